@@ -1,6 +1,6 @@
 """Audio data value object for voice processing."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Union
 import numpy as np
 from pathlib import Path
@@ -22,6 +22,8 @@ class AudioData:
     file_path: Optional[str] = None
     format: str = "wav"
     bit_depth: int = 16
+    # Computed on first use; samples are never modified in place
+    _cached_rms: Optional[float] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate audio data after creation."""
@@ -108,9 +110,11 @@ class AudioData:
         return self.samples.tolist()
     
     def get_rms_amplitude(self) -> float:
-        """Calculate RMS amplitude of the audio."""
-        samples_array = self.get_samples_as_numpy()
-        return float(np.sqrt(np.mean(samples_array ** 2)))
+        """Calculate RMS amplitude of the audio (cached after the first call)."""
+        if self._cached_rms is None:
+            samples_array = self.get_samples_as_numpy()
+            object.__setattr__(self, '_cached_rms', float(np.sqrt(np.mean(samples_array ** 2))))
+        return self._cached_rms
     
     def get_peak_amplitude(self) -> float:
         """Get peak amplitude of the audio."""
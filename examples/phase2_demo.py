@@ -343,7 +343,7 @@ async def main():
     
     finally:
         # Cleanup
-        container.shutdown()
+        await container.ashutdown()
 
 
 if __name__ == "__main__":
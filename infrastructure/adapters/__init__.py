@@ -2,12 +2,14 @@
 
 from .whisper_adapter import WhisperAdapter
 from .speecht5_adapter import SpeechT5Adapter
+from .speecht5_worker import SpeechT5ProcessAdapter
 from .meerkat_adapter import MeerkatAdapter
 from .filesystem_audio_repository import FileSystemAudioRepository
 
 __all__ = [
     "WhisperAdapter",
     "SpeechT5Adapter", 
+    "SpeechT5ProcessAdapter",
     "MeerkatAdapter",
     "FileSystemAudioRepository"
 ]
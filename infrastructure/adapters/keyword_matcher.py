@@ -0,0 +1,68 @@
+"""Multi-keyword matching for rule-based medical text extraction."""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive substring matcher for categorized keyword sets.
+
+    With pyahocorasick installed all keywords are found in a single pass over
+    the text (Aho-Corasick automaton), independent of how many keywords are
+    registered. Without it, each keyword is searched with ``in``.
+    """
+
+    def __init__(self, keywords_by_category: Dict[str, Iterable[str]]):
+        """
+        Initialize keyword matcher.
+
+        Args:
+            keywords_by_category: Keywords to search for, grouped by category
+        """
+        self._keywords: Dict[str, Tuple[str, ...]] = {
+            category: tuple(keyword.lower() for keyword in keywords)
+            for category, keywords in keywords_by_category.items()
+        }
+
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keywords in self._keywords.values():
+                for keyword in keywords:
+                    self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+
+    def _present_keywords(self, text_lower: str) -> Set[str]:
+        """Return the registered keywords that occur in the lowercased text."""
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text_lower)}
+
+        return {
+            keyword
+            for keywords in self._keywords.values()
+            for keyword in keywords
+            if keyword in text_lower
+        }
+
+    def find(self, text: str) -> Dict[str, List[str]]:
+        """
+        Find keywords occurring in text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Found keywords per category, in registration order
+        """
+        present = self._present_keywords(text.lower()) if text else set()
+
+        return {
+            category: [keyword for keyword in keywords if keyword in present]
+            for category, keywords in self._keywords.items()
+        }
@@ -1,9 +1,17 @@
 """Meerkat adapter for medical AI model functionality."""
 
 import asyncio
+import copy
+import hashlib
+import importlib.util
+import re
+import threading
+import numpy as np
 import torch
 import time
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, AsyncIterator, ClassVar, Tuple
 from pathlib import Path
 
 from application.ports.medical_model_port import (
@@ -13,6 +21,7 @@ from domain.entities.patient import Patient
 from domain.entities.medical_response import MedicalResponse, UrgencyLevel
 from domain.value_objects.medical_symptoms import MedicalSymptoms
 from infrastructure.logging.logger_factory import get_module_logger
+from infrastructure.adapters.keyword_matcher import KeywordMatcher
 
 try:
     from transformers import (
@@ -20,6 +29,9 @@ try:
         AutoModelForCausalLM,
         AutoModelForSeq2SeqLM,
         AutoConfig,
+        StoppingCriteria,
+        StoppingCriteriaList,
+        TextIteratorStreamer,
         pipeline
     )
     TRANSFORMERS_AVAILABLE = True
@@ -27,6 +39,154 @@ except ImportError:
     TRANSFORMERS_AVAILABLE = False
 
 
+# Maximum number of generated responses kept per adapter
+RESPONSE_CACHE_SIZE = 256
+
+# Caps on items extracted from a single model response
+MAX_RECOMMENDATIONS = 6
+MAX_RED_FLAGS = 5
+
+# Medical prompts and templates
+SYMPTOM_ANALYSIS_TEMPLATE = """Medical consultation for patient with {symptoms}. Patient details: {patient_context}.
+
+Provide medical assessment and recommendations:"""
+
+URGENCY_TEMPLATE = """Assess the medical urgency for these symptoms: {symptoms}
+
+Patient context: {patient_context}
+
+Urgency Classification:
+- EMERGENCY: Life-threatening condition requiring immediate medical attention (call 911)
+- HIGH: Serious condition requiring medical evaluation within 24 hours
+- MODERATE: Should see healthcare provider within 2-3 days
+- LOW: Routine care, can schedule regular appointment
+
+Consider factors like:
+- Severity and progression of symptoms
+- Patient's age and medical history
+- Potential for rapid deterioration
+- Risk of complications
+
+Provide urgency level with brief justification:"""
+
+# Urgency cues in model output, matched as plain substrings ("not urgent"
+# contains "urgent"; no cue overlaps another, so one scan finds them all)
+URGENCY_PATTERN = re.compile(
+    r"(?P<emergency>emergency|immediate|urgent|911)"
+    r"|(?P<high>high|soon|24 hours)"
+    r"|(?P<low>low|routine)",
+    re.IGNORECASE
+)
+
+# Section markers used when parsing free-text model responses
+RECOMMENDATION_HEADERS = ("recommendation", "immediate action", "care", "treatment")
+RECOMMENDATION_END_HEADERS = ("red flag", "warning", "diagnosis", "assessment")
+RECOMMENDATION_KEYWORDS = ("recommend", "should", "advise", "suggest", "seek", "contact", "call")
+RED_FLAG_HEADERS = ("red flag", "warning", "emergency", "immediate attention")
+RED_FLAG_END_HEADERS = ("recommendation", "diagnosis", "assessment", "remember")
+BULLET_CHARACTERS = '•-*123456789. '
+
+# Keyword-based entity extraction (placeholder for a clinical NER model)
+ENTITY_KEYWORDS = {
+    "symptoms": ("pain", "fever", "nausea", "headache", "cough"),
+    "medications": (),
+    "conditions": (),
+    "procedures": ()
+}
+
+# Symptoms flagged anywhere in a response, even outside a red flag section
+CRITICAL_SYMPTOMS = (
+    "chest pain", "difficulty breathing", "severe pain", "loss of consciousness",
+    "severe bleeding", "stroke symptoms", "heart attack", "call 911"
+)
+
+# Streamed urgency assessment stops once a level is given as a label ("Urgency
+# level: high") or opens a line in capitals, or after this many chunks. Bare words
+# in prose ("high blood pressure", "low-grade fever") do not stop it.
+URGENCY_STREAM_MAX_CHUNKS = 50
+URGENCY_STREAM_STOP_PATTERN = re.compile(
+    r"(?i:urgency(?:\s+level)?|level|classification)\s*:[\s*]*(?i:emergency|high|moderate|low)\b"
+    r"|^[\s*]*(?:EMERGENCY|HIGH|MODERATE|LOW)\b",
+    re.MULTILINE
+)
+
+# Trailing characters rescanned with each chunk, so a label split across chunks is found
+URGENCY_STREAM_OVERLAP = 64
+
+
+def _resolve_attn_implementation(device: str, torch_dtype: torch.dtype) -> str:
+    """Pick the fastest attention backend usable for the given device/dtype."""
+    # FlashAttention-2 only runs on CUDA with half-precision weights
+    if (
+        device.startswith("cuda")
+        and torch_dtype in (torch.float16, torch.bfloat16)
+        and importlib.util.find_spec("flash_attn") is not None
+    ):
+        return "flash_attention_2"
+    return "sdpa"
+
+
+# Texts longer than this are line-filtered with a vectorized scan
+LONG_TEXT_THRESHOLD = 4096
+
+INTERACTION_KEYWORDS = ("interaction", "contraindication", "avoid")
+WARNING_KEYWORDS = ("warning", "caution", "risk", "danger")
+
+
+def _iter_line_spans(data: bytes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Locate line boundaries in UTF-8 data; returns (newlines, starts, ends) offsets."""
+    buf = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buf == 0x0A)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(buf)]))
+    return newlines, starts, ends
+
+
+def _find_matching_lines(text: str, keywords: Tuple[str, ...]) -> List[str]:
+    """Return the stripped lines of text that contain any of the keywords."""
+    if len(text) <= LONG_TEXT_THRESHOLD:
+        return [
+            line.strip() for line in text.split('\n')
+            if any(keyword in line.lower() for keyword in keywords)
+        ]
+    
+    # Long text: locate keyword hits with C-level find() over the whole buffer,
+    # then decode only the lines they fall on
+    data = text.encode("utf-8")
+    data_lower = data.lower()
+    hits = []
+    for keyword in keywords:
+        keyword_bytes = keyword.encode("utf-8")
+        position = data_lower.find(keyword_bytes)
+        while position != -1:
+            hits.append(position)
+            # One hit per line is enough; resume at the next line
+            next_line = data_lower.find(b"\n", position)
+            if next_line == -1:
+                break
+            position = data_lower.find(keyword_bytes, next_line)
+    
+    if not hits:
+        return []
+    
+    newlines, starts, ends = _iter_line_spans(data)
+    line_indices = np.unique(np.searchsorted(newlines, hits))
+    return [data[starts[i]:ends[i]].decode("utf-8").strip() for i in line_indices]
+
+
+if TRANSFORMERS_AVAILABLE:
+    class _StopEventCriteria(StoppingCriteria):
+        """Stop generation once the consumer of a token stream signals it."""
+
+        def __init__(self, stop_event: threading.Event):
+            self.stop_event = stop_event
+
+        def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+            return torch.full(
+                (input_ids.shape[0],), self.stop_event.is_set(), dtype=torch.bool, device=input_ids.device
+            )
+
+
 class MeerkatAdapter(MedicalModelPort):
     """
     Meerkat adapter for medical AI reasoning.
@@ -35,12 +195,28 @@ class MeerkatAdapter(MedicalModelPort):
     like Meerkat-8B or FLAN-T5 for medical analysis and reasoning.
     """
     
+    symptom_analysis_template: ClassVar[str] = SYMPTOM_ANALYSIS_TEMPLATE
+    urgency_template: ClassVar[str] = URGENCY_TEMPLATE
+    
+    # Templates whose static prefix is KV-cached for causal models
+    _prompt_templates: ClassVar[Dict[str, str]] = {
+        "symptom_analysis": SYMPTOM_ANALYSIS_TEMPLATE,
+        "urgency": URGENCY_TEMPLATE
+    }
+    
+    # One automaton covers entity keywords and the critical-symptom scan
+    _entity_matcher: ClassVar[KeywordMatcher] = KeywordMatcher(
+        {**ENTITY_KEYWORDS, "critical": CRITICAL_SYMPTOMS}
+    )
+    
     def __init__(
         self,
         model_name: str = "google/flan-t5-base",
         device: str = "auto",
         torch_dtype: str = "float16",
-        max_new_tokens: int = 256
+        max_new_tokens: int = 256,
+        max_gpu_memory: Optional[str] = None,
+        max_cpu_memory: str = "32GiB"
     ):
         """
         Initialize Meerkat adapter.
@@ -50,6 +226,9 @@ class MeerkatAdapter(MedicalModelPort):
             device: Device to run model on ("auto", "cpu", "cuda")
             torch_dtype: Torch data type for model
             max_new_tokens: Maximum tokens to generate
+            max_gpu_memory: Per-GPU weight budget (e.g. "11GiB"); layers beyond it
+                are offloaded to CPU. None lets accelerate use all free memory.
+            max_cpu_memory: CPU memory budget for offloaded layers
         """
         if not TRANSFORMERS_AVAILABLE:
             raise ImportError("Transformers not available. Install transformers library.")
@@ -58,38 +237,30 @@ class MeerkatAdapter(MedicalModelPort):
         self.device = self._resolve_device(device)
         self.torch_dtype = getattr(torch, torch_dtype)
         self.max_new_tokens = max_new_tokens
+        self.max_gpu_memory = max_gpu_memory
+        self.max_cpu_memory = max_cpu_memory
+        self.attn_implementation = _resolve_attn_implementation(self.device, self.torch_dtype)
         
         self.tokenizer: Optional[AutoTokenizer] = None
         self.model: Optional[AutoModelForCausalLM] = None
         self.pipeline = None
+        self._is_encoder_decoder = False
+        self._cuda_graphs_enabled = False
         
         self._model_lock = asyncio.Lock()
         self._is_loaded = False
         
-        self.logger = get_module_logger(__name__)
+        # Single worker so generate() calls serialize on the device instead of
+        # contending for the CUDA context from the default executor's threads
+        self._gpu_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="meerkat-gpu")
         
-        # Medical prompts and templates
-        self.symptom_analysis_template = """Medical consultation for patient with {symptoms}. Patient details: {patient_context}.
-
-Provide medical assessment and recommendations:"""
+        # Generated responses keyed by prompt digest (see _response_cache_key)
+        self._response_cache: "OrderedDict[bytes, str]" = OrderedDict()
         
-        self.urgency_template = """Assess the medical urgency for these symptoms: {symptoms}
-
-Patient context: {patient_context}
-
-Urgency Classification:
-- EMERGENCY: Life-threatening condition requiring immediate medical attention (call 911)
-- HIGH: Serious condition requiring medical evaluation within 24 hours
-- MODERATE: Should see healthcare provider within 2-3 days
-- LOW: Routine care, can schedule regular appointment
-
-Consider factors like:
-- Severity and progression of symptoms
-- Patient's age and medical history
-- Potential for rapid deterioration
-- Risk of complications
-
-Provide urgency level with brief justification:"""
+        self.logger = get_module_logger(__name__)
+        
+        # Template name -> (prefix input_ids, prefix past_key_values)
+        self._prefix_cache: Dict[str, Tuple[torch.Tensor, Any]] = {}
     
     def _resolve_device(self, device: str) -> str:
         """Resolve device string to actual device."""
@@ -108,41 +279,66 @@ Provide urgency level with brief justification:"""
             
             try:
                 self.logger.info(f"Loading medical model: {self.model_name}")
+                self._response_cache.clear()
                 
                 # Load tokenizer and model in thread pool
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 
                 # Inspect config to pick correct model class
                 config = await loop.run_in_executor(
-                    None,
+                    self._gpu_executor,
                     lambda: AutoConfig.from_pretrained(self.model_name)
                 )
 
                 self.tokenizer = await loop.run_in_executor(
-                    None,
+                    self._gpu_executor,
                     lambda: AutoTokenizer.from_pretrained(self.model_name)
                 )
 
+                self._is_encoder_decoder = bool(getattr(config, "is_encoder_decoder", False))
+
                 def load_model():
-                    if hasattr(config, "is_encoder_decoder") and config.is_encoder_decoder:
-                        return AutoModelForSeq2SeqLM.from_pretrained(
-                            self.model_name,
-                            torch_dtype=self.torch_dtype,
-                            low_cpu_mem_usage=True
-                        ).to(self.device)
+                    if self._is_encoder_decoder:
+                        model_class = AutoModelForSeq2SeqLM
                     else:
-                        return AutoModelForCausalLM.from_pretrained(
+                        model_class = AutoModelForCausalLM
+
+                    load_kwargs = {
+                        "torch_dtype": self.torch_dtype,
+                        "low_cpu_mem_usage": True
+                    }
+
+                    # On GPU let accelerate place layers, offloading to CPU what doesn't fit
+                    use_device_map = self.device.startswith("cuda")
+                    if use_device_map:
+                        load_kwargs["device_map"] = "auto"
+                        if self.max_gpu_memory:
+                            load_kwargs["max_memory"] = {0: self.max_gpu_memory, "cpu": self.max_cpu_memory}
+
+                    try:
+                        model = model_class.from_pretrained(
                             self.model_name,
-                            torch_dtype=self.torch_dtype,
-                            low_cpu_mem_usage=True
-                        ).to(self.device)
+                            attn_implementation=self.attn_implementation,
+                            **load_kwargs
+                        )
+                    except (ValueError, ImportError) as e:
+                        # Not every checkpoint advertises SDPA / FlashAttention-2 support
+                        self.logger.warning(
+                            f"{self.attn_implementation} attention unavailable for "
+                            f"{self.model_name}, using default: {e}"
+                        )
+                        self.attn_implementation = "eager"
+                        model = model_class.from_pretrained(self.model_name, **load_kwargs)
 
-                self.model = await loop.run_in_executor(None, load_model)
+                    return model if use_device_map else model.to(self.device)
+
+                self.model = await loop.run_in_executor(self._gpu_executor, load_model)
 
                 # Create generation pipeline; choose task by architecture
-                task_name = "text2text-generation" if getattr(config, "is_encoder_decoder", False) else "text-generation"
+                task_name = "text2text-generation" if self._is_encoder_decoder else "text-generation"
 
                 # Configure pipeline parameters based on model type
+                # Greedy decoding: temperature is a no-op without sampling, so it is not set
                 pipeline_kwargs = {
                     "model": self.model,
                     "tokenizer": self.tokenizer,
@@ -150,16 +346,17 @@ Provide urgency level with brief justification:"""
                     "do_sample": False
                 }
 
-                # Only add temperature for text-generation (causal models)
-                # text2text-generation (seq2seq) models ignore temperature when do_sample=False
+                # Causal models echo the prompt; return only the continuation
                 if task_name == "text-generation":
-                    pipeline_kwargs["temperature"] = 0.1
+                    pipeline_kwargs["return_full_text"] = False
 
                 self.pipeline = await loop.run_in_executor(
-                    None,
+                    self._gpu_executor,
                     lambda: pipeline(task_name, **pipeline_kwargs)
                 )
                 
+                await loop.run_in_executor(self._gpu_executor, self._build_prefix_cache)
+                
                 self._is_loaded = True
                 self.logger.info(f"Medical model loaded successfully")
                 
@@ -193,11 +390,12 @@ Provide urgency level with brief justification:"""
             )
             
             # Generate response
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response_text = await loop.run_in_executor(
-                None,
+                self._gpu_executor,
                 self._generate_text_sync,
-                prompt
+                prompt,
+                "symptom_analysis"
             )
             
             # Parse response into MedicalResponse
@@ -246,9 +444,9 @@ Please identify:
 Drug interaction analysis:"""
             
             # Generate response
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response_text = await loop.run_in_executor(
-                None,
+                self._gpu_executor,
                 self._generate_text_sync,
                 prompt
             )
@@ -292,9 +490,9 @@ List the top 5 most likely diagnoses with brief explanations:
 
 Differential diagnosis:"""
             
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response_text = await loop.run_in_executor(
-                None,
+                self._gpu_executor,
                 self._generate_text_sync,
                 prompt
             )
@@ -329,12 +527,7 @@ Differential diagnosis:"""
                 patient_context=patient_info
             )
             
-            loop = asyncio.get_event_loop()
-            response_text = await loop.run_in_executor(
-                None,
-                self._generate_text_sync,
-                prompt
-            )
+            response_text = await self._generate_urgency_text(prompt, "urgency")
             
             urgency_level = self._extract_urgency_level(response_text)
             
@@ -372,37 +565,186 @@ Differential diagnosis:"""
         
         return "; ".join(context_parts) if context_parts else "No patient context provided"
     
-    def _generate_text_sync(self, prompt: str) -> str:
+    def _build_prefix_cache(self) -> None:
+        """Precompute the KV cache of each template's static prefix (causal models only)."""
+        self._prefix_cache = {}
+        
+        # Encoder attention is bidirectional, so a seq2seq prefix cannot be reused
+        if self._is_encoder_decoder:
+            return
+        
+        for name, template in self._prompt_templates.items():
+            # Trailing whitespace tokenizes together with the text that follows it
+            prefix = template.split("{", 1)[0].rstrip()
+            if not prefix:
+                continue
+            
+            prefix_ids = self.tokenizer(prefix, return_tensors="pt").input_ids.to(self.model.device)
+            with torch.no_grad():
+                outputs = self.model(prefix_ids, use_cache=True)
+            
+            self._prefix_cache[name] = (prefix_ids, outputs.past_key_values)
+        
+        self.logger.debug(f"Cached prompt prefixes: {list(self._prefix_cache)}")
+    
+    def _prepare_generation_inputs(self, prompt: str, template_name: Optional[str] = None) -> Dict[str, Any]:
+        """Tokenize a prompt, reusing the cached template prefix when its tokens lead the prompt's."""
+        inputs = dict(self.tokenizer(prompt, return_tensors="pt", truncation=True, max_length=1024).to(self.model.device))
+        
+        cached = self._prefix_cache.get(template_name) if template_name else None
+        if cached is None:
+            return inputs
+        
+        # The prefix only applies when the full prompt tokenizes to the same leading ids
+        prefix_ids, prefix_past = cached
+        input_ids = inputs["input_ids"]
+        prefix_length = prefix_ids.shape[-1]
+        if input_ids.shape[-1] <= prefix_length or not torch.equal(input_ids[:, :prefix_length], prefix_ids):
+            return inputs
+        
+        # generate() extends the cache in place, so each call needs its own copy
+        inputs["past_key_values"] = copy.deepcopy(prefix_past)
+        return inputs
+    
+    def _response_cache_key(self, prompt: str) -> bytes:
+        """Build the response cache key for a prompt under the current model settings."""
+        key_material = f"{self.model_name}\0{self.max_new_tokens}\0{self.torch_dtype}\0{prompt}"
+        return hashlib.blake2b(key_material.encode("utf-8"), digest_size=16).digest()
+    
+    def _generate_text_sync(self, prompt: str, template_name: Optional[str] = None) -> str:
         """Synchronous text generation for thread pool execution."""
+        cache_key = self._response_cache_key(prompt)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            return cached
+        
+        response = self._run_generation(prompt, template_name)
+        
+        self._response_cache[cache_key] = response
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        
+        return response
+    
+    def _greedy_generation_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for a plain greedy generate() call."""
+        pad_token_id = self.tokenizer.pad_token_id
+        if pad_token_id is None:
+            pad_token_id = self.tokenizer.eos_token_id
+        
+        return {
+            "max_new_tokens": self.max_new_tokens,
+            "do_sample": False,
+            "num_beams": 1,
+            "use_cache": True,
+            "pad_token_id": pad_token_id
+        }
+    
+    def _run_generation(self, prompt: str, template_name: Optional[str] = None) -> str:
+        """Run the model on a prompt, bypassing the response cache."""
         try:
-            if self.pipeline:
+            # The pipeline re-encodes the whole prompt, so skip it when a prefix cache applies
+            if self.pipeline and template_name not in self._prefix_cache:
                 result = self.pipeline(prompt)
                 if result and len(result) > 0:
                     return result[0]["generated_text"]
             
             # Fallback to direct model inference
-            inputs = self.tokenizer(prompt, return_tensors="pt", truncation=True, max_length=1024)
+            inputs = self._prepare_generation_inputs(prompt, template_name)
             
             with torch.no_grad():
-                outputs = self.model.generate(
-                    **inputs,
-                    max_new_tokens=self.max_new_tokens,
-                    do_sample=False,
-                    temperature=0.1,
-                    pad_token_id=self.tokenizer.eos_token_id
-                )
+                outputs = self.model.generate(**inputs, **self._greedy_generation_kwargs())
             
-            response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
+            # Causal models return prompt + continuation; skip the prompt tokens.
+            # Seq2seq decoders never see the encoder input, so decode everything.
+            input_length = 0 if self._is_encoder_decoder else inputs["input_ids"].shape[1]
             
-            # Remove the original prompt from response
-            if prompt in response:
-                response = response.replace(prompt, "").strip()
-            
-            return response
+            return self.tokenizer.decode(outputs[0][input_length:], skip_special_tokens=True).strip()
             
         except Exception as e:
             raise MedicalAnalysisError(f"Text generation failed: {e}") from e
     
+    def _start_streaming_generation(
+        self,
+        prompt: str,
+        stop_event: threading.Event,
+        template_name: Optional[str] = None
+    ) -> Tuple["TextIteratorStreamer", Future]:
+        """Submit a streaming generate() to the inference executor."""
+        inputs = self._prepare_generation_inputs(prompt, template_name)
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        
+        generation_kwargs = {
+            **inputs,
+            **self._greedy_generation_kwargs(),
+            "streamer": streamer,
+            "stopping_criteria": StoppingCriteriaList([_StopEventCriteria(stop_event)])
+        }
+        
+        def generate() -> None:
+            try:
+                with torch.no_grad():
+                    self.model.generate(**generation_kwargs)
+            finally:
+                # Unblock the consumer even if generate() raised before streaming
+                streamer.end()
+        
+        return streamer, self._gpu_executor.submit(generate)
+    
+    async def _generate_text_stream(
+        self,
+        prompt: str,
+        stop_event: Optional[threading.Event] = None,
+        template_name: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generate text for a prompt, yielding decoded chunks as they are produced.
+        
+        Closing the iterator early (or setting stop_event) cancels the remaining
+        generation at the next decode step.
+        """
+        stop_event = stop_event or threading.Event()
+        streamer, generation = self._start_streaming_generation(prompt, stop_event, template_name)
+        
+        try:
+            while True:
+                chunk = await asyncio.to_thread(next, streamer, None)
+                if chunk is None:
+                    break
+                if chunk:
+                    yield chunk
+        finally:
+            stop_event.set()
+        
+        try:
+            await asyncio.wrap_future(generation)
+        except Exception as e:
+            raise MedicalAnalysisError(f"Text generation failed: {e}") from e
+    
+    async def _generate_urgency_text(self, prompt: str, template_name: Optional[str] = None) -> str:
+        """Stream an urgency assessment, stopping once an urgency level is named."""
+        text = ""
+        chunk_count = 0
+        stream = self._generate_text_stream(prompt, template_name=template_name)
+        
+        try:
+            async for chunk in stream:
+                scan_from = max(0, len(text) - URGENCY_STREAM_OVERLAP)
+                text += chunk
+                chunk_count += 1
+                if URGENCY_STREAM_STOP_PATTERN.search(text, scan_from):
+                    break
+                if chunk_count >= URGENCY_STREAM_MAX_CHUNKS:
+                    self.logger.warning(
+                        f"Urgency assessment named no level within {URGENCY_STREAM_MAX_CHUNKS} chunks, truncating"
+                    )
+                    break
+        finally:
+            await stream.aclose()
+        
+        return text.strip()
+    
     def _parse_medical_response(self, response_text: str, symptoms: MedicalSymptoms) -> MedicalResponse:
         """Parse AI response into MedicalResponse object."""
         # Extract urgency level
@@ -415,13 +757,11 @@ Differential diagnosis:"""
             urgency=urgency
         )
 
-        # Extract recommendations
-        recommendations = self._extract_recommendations(response_text)
+        # Extract recommendations and red flags
+        recommendations, red_flags = self._extract_sections(response_text)
         for rec in recommendations:
             medical_response.add_recommendation(rec)
 
-        # Extract red flags
-        red_flags = self._extract_red_flags(response_text)
         for flag in red_flags:
             medical_response.add_red_flag(flag)
 
@@ -435,109 +775,105 @@ Differential diagnosis:"""
 
         # Fall back to string parsing
         try:
-            text_lower = str(text_or_level).lower()
+            text = str(text_or_level)
         except Exception:
             return UrgencyLevel.MODERATE
 
-        if any(word in text_lower for word in ["emergency", "immediate", "urgent", "911"]):
-            return UrgencyLevel.EMERGENCY
-        elif any(word in text_lower for word in ["high", "soon", "24 hours"]):
-            return UrgencyLevel.HIGH
-        elif any(word in text_lower for word in ["low", "routine", "not urgent"]):
-            return UrgencyLevel.LOW
-        else:
-            return UrgencyLevel.MODERATE
+        # One scan; emergency wins outright, otherwise HIGH outranks LOW
+        found_level = None
+        for match in URGENCY_PATTERN.finditer(text):
+            if match.lastgroup == "emergency":
+                return UrgencyLevel.EMERGENCY
+            if match.lastgroup == "high":
+                found_level = UrgencyLevel.HIGH
+            elif found_level is None:
+                found_level = UrgencyLevel.LOW
+
+        return found_level or UrgencyLevel.MODERATE
     
     def _extract_recommendations(self, text: str) -> List[str]:
         """Extract recommendations from response text."""
-        recommendations = []
-        lines = text.split('\n')
-
-        # Look for recommendations section
-        in_recommendations_section = False
-        for line in lines:
-            line = line.strip()
-
-            # Check if we're entering recommendations section
-            if any(header in line.lower() for header in ["recommendation", "immediate action", "care", "treatment"]):
-                in_recommendations_section = True
-                continue
-
-            # Check if we're leaving recommendations section
-            if in_recommendations_section and any(header in line.lower() for header in ["red flag", "warning", "diagnosis", "assessment"]):
-                in_recommendations_section = False
-                continue
-
-            # Extract recommendations
-            if in_recommendations_section or any(keyword in line.lower() for keyword in ["recommend", "should", "advise", "suggest", "seek", "contact", "call"]):
-                if line and not line.startswith('#') and len(line) > 10:
-                    # Clean up bullet points and numbering
-                    cleaned_line = line.lstrip('•-*123456789. ')
-                    if cleaned_line:
-                        recommendations.append(cleaned_line)
-
-        return recommendations[:6]  # Limit to 6 recommendations
+        recommendations, _ = self._extract_sections(text, red_flags=False)
+        return recommendations
     
     def _extract_red_flags(self, text: str) -> List[str]:
         """Extract red flags from response text."""
-        red_flags = []
-        lines = text.split('\n')
-
-        # Look for red flags section
+        _, red_flags = self._extract_sections(text, recommendations=False)
+        return red_flags
+    
+    def _extract_sections(
+        self,
+        text: str,
+        recommendations: bool = True,
+        red_flags: bool = True
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Extract recommendations and red flags in a single pass over the lines.
+        
+        Both section state machines run over the same stripped, lowercased line,
+        and the scan stops once every requested list has reached its cap.
+        """
+        found_recommendations: List[str] = []
+        found_red_flags: List[str] = []
+        recommendations_done = not recommendations
+        red_flags_done = not red_flags
+        in_recommendations_section = False
         in_red_flags_section = False
-        for line in lines:
+        
+        for line in text.split('\n'):
             line = line.strip()
-
-            # Check if we're entering red flags section
-            if any(header in line.lower() for header in ["red flag", "warning", "emergency", "immediate attention"]):
-                in_red_flags_section = True
-                continue
-
-            # Check if we're leaving red flags section
-            if in_red_flags_section and any(header in line.lower() for header in ["recommendation", "diagnosis", "assessment", "remember"]):
-                in_red_flags_section = False
-                continue
-
-            # Extract red flags from section or by keywords
-            if in_red_flags_section and line and len(line) > 5:
-                cleaned_line = line.lstrip('•-*123456789. ')
-                if cleaned_line:
-                    red_flags.append(cleaned_line)
-
+            line_lower = line.lower()
+            
+            if not recommendations_done:
+                # Entering / leaving the recommendations section
+                if any(header in line_lower for header in RECOMMENDATION_HEADERS):
+                    in_recommendations_section = True
+                elif in_recommendations_section and any(header in line_lower for header in RECOMMENDATION_END_HEADERS):
+                    in_recommendations_section = False
+                elif in_recommendations_section or any(keyword in line_lower for keyword in RECOMMENDATION_KEYWORDS):
+                    if line and not line.startswith('#') and len(line) > 10:
+                        # Clean up bullet points and numbering
+                        cleaned_line = line.lstrip(BULLET_CHARACTERS)
+                        if cleaned_line:
+                            found_recommendations.append(cleaned_line)
+                            recommendations_done = len(found_recommendations) >= MAX_RECOMMENDATIONS
+            
+            if not red_flags_done:
+                # Entering / leaving the red flags section
+                if any(header in line_lower for header in RED_FLAG_HEADERS):
+                    in_red_flags_section = True
+                elif in_red_flags_section and any(header in line_lower for header in RED_FLAG_END_HEADERS):
+                    in_red_flags_section = False
+                elif in_red_flags_section and line and len(line) > 5:
+                    cleaned_line = line.lstrip(BULLET_CHARACTERS)
+                    if cleaned_line:
+                        found_red_flags.append(cleaned_line)
+                        red_flags_done = len(found_red_flags) >= MAX_RED_FLAGS
+            
+            if recommendations_done and red_flags_done:
+                break
+        
         # Also check for critical symptoms throughout text
-        text_lower = text.lower()
-        critical_symptoms = [
-            "chest pain", "difficulty breathing", "severe pain", "loss of consciousness",
-            "severe bleeding", "stroke symptoms", "heart attack", "call 911"
-        ]
-
-        for keyword in critical_symptoms:
-            if keyword in text_lower and not any(keyword in flag.lower() for flag in red_flags):
-                red_flags.append(f"Warning: {keyword}")
-
-        return red_flags[:5]  # Limit to 5 red flags
+        if red_flags and len(found_red_flags) < MAX_RED_FLAGS:
+            critical_found = self._entity_matcher.find(text)["critical"]
+            
+            # Lowercase the section flags once instead of per keyword
+            flags_lower = "\n".join(found_red_flags).lower()
+            for keyword in critical_found:
+                if keyword not in flags_lower:
+                    found_red_flags.append(f"Warning: {keyword}")
+                    if len(found_red_flags) >= MAX_RED_FLAGS:
+                        break
+        
+        return found_recommendations, found_red_flags
     
     def _extract_interactions(self, text: str) -> List[str]:
         """Extract drug interactions from text."""
-        interactions = []
-        lines = text.split('\n')
-        
-        for line in lines:
-            if any(word in line.lower() for word in ["interaction", "contraindication", "avoid"]):
-                interactions.append(line.strip())
-        
-        return interactions
+        return _find_matching_lines(text, INTERACTION_KEYWORDS)
     
     def _extract_warnings(self, text: str) -> List[str]:
         """Extract warnings from text."""
-        warnings = []
-        lines = text.split('\n')
-        
-        for line in lines:
-            if any(word in line.lower() for word in ["warning", "caution", "risk", "danger"]):
-                warnings.append(line.strip())
-        
-        return warnings
+        return _find_matching_lines(text, WARNING_KEYWORDS)
     
     def _parse_differential_diagnosis(self, text: str) -> List[Dict[str, Any]]:
         """Parse differential diagnosis from text."""
@@ -575,9 +911,9 @@ Patient context: {patient_info}
 
 Treatment recommendations:"""
             
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response_text = await loop.run_in_executor(
-                None,
+                self._gpu_executor,
                 self._generate_text_sync,
                 prompt
             )
@@ -605,9 +941,9 @@ Patient context: {patient_info}
 
 Red flags:"""
             
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response_text = await loop.run_in_executor(
-                None,
+                self._gpu_executor,
                 self._generate_text_sync,
                 prompt
             )
@@ -629,9 +965,9 @@ Summarize this clinical note:
 
 Summary:"""
             
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             summary = await loop.run_in_executor(
-                None,
+                self._gpu_executor,
                 self._generate_text_sync,
                 prompt
             )
@@ -645,23 +981,9 @@ Summary:"""
     async def extract_medical_entities(self, text: str) -> Dict[str, List[str]]:
         """Extract medical entities from text."""
         # This would typically use a specialized NER model
-        # For now, return a simple implementation
-        entities = {
-            "symptoms": [],
-            "medications": [],
-            "conditions": [],
-            "procedures": []
-        }
-        
-        # Simple keyword-based extraction
-        text_lower = text.lower()
-        
-        symptom_keywords = ["pain", "fever", "nausea", "headache", "cough"]
-        for keyword in symptom_keywords:
-            if keyword in text_lower:
-                entities["symptoms"].append(keyword)
-        
-        return entities
+        # For now, return a simple keyword-based implementation
+        found = self._entity_matcher.find(text)
+        return {category: found[category] for category in ENTITY_KEYWORDS}
     
     async def get_model_confidence(self, analysis_result: Any) -> float:
         """Get confidence score for a model analysis result."""
@@ -692,6 +1014,9 @@ Summary:"""
             "type": "medical_language_model",
             "device": self.device,
             "torch_dtype": str(self.torch_dtype),
+            "attn_implementation": self.attn_implementation,
+            "device_map": getattr(self.model, "hf_device_map", None),
+            "cuda_graphs": self._cuda_graphs_enabled,
             "max_new_tokens": self.max_new_tokens,
             "is_loaded": self._is_loaded,
             "available": TRANSFORMERS_AVAILABLE
@@ -704,15 +1029,61 @@ Summary:"""
             
             # Run a simple inference to warm up
             test_prompt = "Test prompt for model warm-up"
-            await asyncio.get_event_loop().run_in_executor(
-                None,
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                self._gpu_executor,
                 self._generate_text_sync,
                 test_prompt
             )
             
+            if self.device.startswith("cuda") and not self._is_encoder_decoder:
+                await loop.run_in_executor(self._gpu_executor, self._enable_cuda_graphs, test_prompt)
+            
             self.logger.info("Model warm-up completed")
             return True
             
         except Exception as e:
             self.logger.error(f"Model warm-up failed: {e}")
             return False
+    
+    def _enable_cuda_graphs(self, warm_up_prompt: str) -> None:
+        """
+        Capture CUDA graphs for the decode step (causal models on CUDA).
+        
+        A static KV cache gives every decode step identical tensor shapes, and
+        compiling the forward pass with mode="reduce-overhead" records it as a
+        CUDA graph that is replayed for each new token instead of relaunching
+        every kernel. The static cache replaces the per-template prefix cache,
+        which is dropped. Falls back to eager decoding if capture fails.
+        """
+        if self._cuda_graphs_enabled:
+            return
+        
+        eager_forward = self.model.forward
+        previous_cache_implementation = self.model.generation_config.cache_implementation
+        
+        try:
+            self.model.generation_config.cache_implementation = "static"
+            self.model.forward = torch.compile(eager_forward, mode="reduce-overhead", fullgraph=True)
+            
+            prefix_cache, self._prefix_cache = self._prefix_cache, {}
+            try:
+                # Capture happens on the first generate() after compiling
+                self._run_generation(warm_up_prompt)
+            except Exception:
+                self._prefix_cache = prefix_cache
+                raise
+            
+            self._cuda_graphs_enabled = True
+            self.logger.info("CUDA graph decoding enabled")
+            
+        except Exception as e:
+            self.model.forward = eager_forward
+            self.model.generation_config.cache_implementation = previous_cache_implementation
+            self.logger.warning(f"CUDA graph capture failed, using eager decoding: {e}")
+    
+    async def close(self) -> None:
+        """Release the inference executor."""
+        self._gpu_executor.shutdown(wait=False)
+        self._response_cache.clear()
+        self.logger.info("Meerkat adapter closed")
@@ -1,7 +1,8 @@
 """Mock adapters to enable demos without heavy model downloads/deps."""
 
 import asyncio
-from typing import Optional, Dict, Any, List
+import os
+from typing import ClassVar, Optional, Dict, Any, List
 from datetime import datetime
 
 from application.ports.voice_interface_port import VoiceInterfacePort
@@ -11,29 +12,48 @@ from domain.value_objects.audio_data import AudioData
 from domain.value_objects.medical_symptoms import MedicalSymptoms
 from domain.entities.medical_response import MedicalResponse, UrgencyLevel
 from infrastructure.logging.logger_factory import get_module_logger
+from infrastructure.adapters.keyword_matcher import KeywordMatcher
+
+
+def _simulate_latency_from_env() -> bool:
+    """Whether mock adapters should sleep to mimic real model latency."""
+    return os.getenv("MOCK_ADAPTER_SIMULATE_LATENCY", "false").lower() == "true"
 
 
 class MockVoiceAdapter(VoiceInterfacePort):
-    def __init__(self):
+    # Simulated per-operation latency in seconds (only applied when enabled)
+    _LATENCIES: ClassVar[Dict[str, float]] = {
+        "transcribe_audio": 0.05,
+        "synthesize_speech": 0.05,
+        "record_audio": 0.05,
+        "play_audio": 0.01
+    }
+
+    def __init__(self, simulate_latency: Optional[bool] = None):
         self.logger = get_module_logger(__name__)
+        self._simulate = _simulate_latency_from_env() if simulate_latency is None else simulate_latency
+
+    async def _simulate_latency(self, operation: str) -> None:
+        if self._simulate:
+            await asyncio.sleep(self._LATENCIES[operation])
 
     async def transcribe_audio(self, audio: AudioData) -> Optional[str]:
-        await asyncio.sleep(0.05)
+        await self._simulate_latency("transcribe_audio")
         return "this is a mock transcription"
 
     async def synthesize_speech(self, text: str, voice_config: Optional[Dict[str, Any]] = None) -> Optional[AudioData]:
-        await asyncio.sleep(0.05)
+        await self._simulate_latency("synthesize_speech")
         return AudioData.silence(1.5, 16000)
 
     async def validate_audio_quality(self, audio: AudioData) -> bool:
         return True
 
     async def record_audio(self, duration_seconds: float) -> Optional[AudioData]:
-        await asyncio.sleep(0.05)
+        await self._simulate_latency("record_audio")
         return AudioData.silence(duration_seconds, 16000)
 
     async def play_audio(self, audio: AudioData) -> bool:
-        await asyncio.sleep(0.01)
+        await self._simulate_latency("play_audio")
         return True
 
     async def get_supported_languages(self) -> list[str]:
@@ -56,11 +76,30 @@ class MockVoiceAdapter(VoiceInterfacePort):
 
 
 class MockMedicalAdapter(MedicalModelPort):
-    def __init__(self):
+    # Simulated per-operation latency in seconds (only applied when enabled)
+    _LATENCIES: ClassVar[Dict[str, float]] = {
+        "analyze_symptoms": 0.05,
+        "check_drug_interactions": 0.02,
+        "generate_differential_diagnosis": 0.02,
+        "assess_urgency": 0.02,
+        "generate_treatment_recommendations": 0.02,
+        "identify_red_flags": 0.02,
+        "summarize_clinical_note": 0.02
+    }
+
+    # Built once; matches all entity keywords in a single pass over the text
+    _entity_matcher: ClassVar[KeywordMatcher] = KeywordMatcher({"symptoms": ("headache",)})
+
+    def __init__(self, simulate_latency: Optional[bool] = None):
         self.logger = get_module_logger(__name__)
+        self._simulate = _simulate_latency_from_env() if simulate_latency is None else simulate_latency
+
+    async def _simulate_latency(self, operation: str) -> None:
+        if self._simulate:
+            await asyncio.sleep(self._LATENCIES[operation])
 
     async def analyze_symptoms(self, symptoms: MedicalSymptoms, patient_context=None) -> MedicalResponse:
-        await asyncio.sleep(0.05)
+        await self._simulate_latency("analyze_symptoms")
         urgency = UrgencyLevel.EMERGENCY if symptoms.has_emergency_symptoms() else UrgencyLevel.MODERATE
         return MedicalResponse.create_from_text(
             "This is a mock medical assessment. Please consult a doctor if symptoms persist.",
@@ -70,31 +109,32 @@ class MockMedicalAdapter(MedicalModelPort):
         )
 
     async def check_drug_interactions(self, medications: List[str], patient_context=None) -> Dict[str, Any]:
-        await asyncio.sleep(0.02)
+        await self._simulate_latency("check_drug_interactions")
         return {"medications": medications, "interactions": [], "warnings": []}
 
     async def generate_differential_diagnosis(self, symptoms: MedicalSymptoms, patient_context=None) -> List[Dict[str, Any]]:
-        await asyncio.sleep(0.02)
+        await self._simulate_latency("generate_differential_diagnosis")
         return [{"diagnosis": "Mock Condition", "probability": 0.5}]
 
     async def assess_urgency(self, symptoms: MedicalSymptoms, patient_context=None) -> Dict[str, Any]:
-        await asyncio.sleep(0.02)
+        await self._simulate_latency("assess_urgency")
         return {"urgency": "moderate"}
 
     async def generate_treatment_recommendations(self, diagnosis: str, symptoms: MedicalSymptoms, patient_context=None) -> List[str]:
-        await asyncio.sleep(0.02)
+        await self._simulate_latency("generate_treatment_recommendations")
         return ["Rest", "Hydration"]
 
     async def identify_red_flags(self, symptoms: MedicalSymptoms, patient_context=None) -> List[str]:
-        await asyncio.sleep(0.02)
+        await self._simulate_latency("identify_red_flags")
         return ["Mock red flag"] if symptoms.has_emergency_symptoms() else []
 
     async def summarize_clinical_note(self, clinical_text: str) -> str:
-        await asyncio.sleep(0.02)
+        await self._simulate_latency("summarize_clinical_note")
         return clinical_text[:100]
 
     async def extract_medical_entities(self, text: str) -> Dict[str, List[str]]:
-        return {"symptoms": ["headache" if "headache" in text.lower() else ""]}
+        found = self._entity_matcher.find(text)
+        return {"symptoms": found["symptoms"] or [""]}
 
     async def get_model_confidence(self, analysis_result: Any) -> float:
         return 0.8
@@ -1,9 +1,17 @@
 """SpeechT5 adapter for text-to-speech functionality."""
 
 import asyncio
+import hashlib
+import importlib.util
+import re
 import torch
 import numpy as np
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, AsyncIterator, Tuple
 from pathlib import Path
 
 from application.ports.voice_interface_port import (
@@ -12,12 +20,78 @@ from application.ports.voice_interface_port import (
 from domain.value_objects.audio_data import AudioData
 from infrastructure.logging.logger_factory import get_module_logger
 
-try:
+if TYPE_CHECKING:
     from transformers import SpeechT5Processor, SpeechT5ForTextToSpeech, SpeechT5HifiGan
+
+
+def _check_speecht5_available() -> bool:
+    """Check that the TTS dependencies are installed without importing them."""
+    return all(
+        importlib.util.find_spec(module) is not None
+        for module in ("transformers", "datasets")
+    )
+
+
+# transformers/datasets are only imported once a model is actually loaded
+SPEECHT5_AVAILABLE = _check_speecht5_available()
+
+
+@lru_cache(maxsize=None)
+def _lazy_import() -> SimpleNamespace:
+    """Import the SpeechT5 classes and dataset loader on first use."""
+    from transformers import SpeechT5Processor, SpeechT5ForTextToSpeech, SpeechT5HifiGan, BitsAndBytesConfig
     from datasets import load_dataset
-    SPEECHT5_AVAILABLE = True
-except ImportError:
-    SPEECHT5_AVAILABLE = False
+    
+    return SimpleNamespace(
+        SpeechT5Processor=SpeechT5Processor,
+        SpeechT5ForTextToSpeech=SpeechT5ForTextToSpeech,
+        SpeechT5HifiGan=SpeechT5HifiGan,
+        BitsAndBytesConfig=BitsAndBytesConfig,
+        load_dataset=load_dataset
+    )
+
+
+# Sentence boundary: terminal punctuation followed by whitespace
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+# Samples blended between consecutive streamed chunks to hide boundary clicks
+CROSSFADE_SAMPLES = 256
+
+# Number of distinct texts whose token ids are kept (warm-up probes, disclaimers)
+TOKENIZE_CACHE_SIZE = 256
+
+# Dummy synthesis passes run after loading to trigger kernel selection up front
+WARMUP_ITERATIONS = 2
+WARMUP_TEXT = "warmup"
+
+# Largest up/down factor used when approximating a speed ratio for polyphase resampling
+SPEED_RATIO_MAX_DENOMINATOR = 1000
+
+# Oldest torch release whose torch.compile handles the SpeechT5 decoder reliably
+TORCH_COMPILE_MIN_VERSION = (2, 1)
+
+# CMU ARCTIC x-vector used as the default voice (female speaker)
+DEFAULT_SPEAKER_INDEX = 7306
+
+# Extracted speaker embeddings are kept here so the dataset is only fetched once
+SPEAKER_EMBEDDING_CACHE_DIR = Path.home() / ".cache" / "medvaani"
+
+# Bundled x-vector used when the dataset cannot be reached
+SPEAKER_EMBEDDING_RESOURCE = Path(__file__).parent / "speaker_default.pt"
+
+# Bounds on the synthesized-waveform cache (entries and total sample bytes)
+WAVEFORM_CACHE_SIZE = 64
+WAVEFORM_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Worker threads reserved for TTS loading and synthesis
+EXECUTOR_WORKERS = 2
+
+# Weight precision per quantization mode; int8 keeps fp16 for non-quantized layers
+QUANTIZATION_DTYPES = {
+    "bf16": torch.bfloat16,
+    "fp16": torch.float16,
+    "int8": torch.float16
+}
 
 
 class SpeechT5Adapter(VoiceInterfacePort):
@@ -33,7 +107,12 @@ class SpeechT5Adapter(VoiceInterfacePort):
         model_name: str = "microsoft/speecht5_tts",
         vocoder_name: str = "microsoft/speecht5_hifigan",
         device: str = "auto",
-        torch_dtype: str = "float16"
+        torch_dtype: str = "float16",
+        compile_model: bool = False,
+        quantization: Optional[str] = None,
+        batch_size: int = 1,
+        max_wait_ms: float = 10.0,
+        enable_cache: bool = True
     ):
         """
         Initialize SpeechT5 adapter.
@@ -43,6 +122,12 @@ class SpeechT5Adapter(VoiceInterfacePort):
             vocoder_name: HiFiGAN vocoder name
             device: Device to run model on ("auto", "cpu", "cuda")
             torch_dtype: Torch data type for model
+            compile_model: Compile the decoder and vocoder with torch.compile
+            quantization: Weight precision ("bf16", "int8", "fp16"), "auto" for
+                bf16 in place of fp16 on CPU, or None to use torch_dtype as given
+            batch_size: Maximum sentences synthesized together; 1 disables batching
+            max_wait_ms: How long the batcher waits for more sentences to arrive
+            enable_cache: Reuse synthesized audio for repeated text and voice settings
         """
         if not SPEECHT5_AVAILABLE:
             raise ImportError("SpeechT5 dependencies not available. Install transformers and datasets.")
@@ -51,14 +136,36 @@ class SpeechT5Adapter(VoiceInterfacePort):
         self.vocoder_name = vocoder_name
         self.device = self._resolve_device(device)
         self.torch_dtype = getattr(torch, torch_dtype)
+        self.quantization = self._resolve_quantization(quantization)
+        if self.quantization:
+            self.torch_dtype = QUANTIZATION_DTYPES[self.quantization]
+        self.compile_model = compile_model
+        self._is_compiled = False
+        self.batch_size = max(1, batch_size)
+        self.max_wait_ms = max_wait_ms
+        self.enable_cache = enable_cache
         
-        self.processor: Optional[SpeechT5Processor] = None
-        self.model: Optional[SpeechT5ForTextToSpeech] = None
-        self.vocoder: Optional[SpeechT5HifiGan] = None
+        self.processor: Optional["SpeechT5Processor"] = None
+        self.model: Optional["SpeechT5ForTextToSpeech"] = None
+        self.vocoder: Optional["SpeechT5HifiGan"] = None
         self.speaker_embeddings: Optional[torch.Tensor] = None
+        # Set when synthesis runs on the zero embedding; its output is never cached
+        self._degraded_voice = False
+        
+        self._loaded_event = asyncio.Event()
+        self._load_task: Optional[asyncio.Task] = None
+        self._warmed_up = False
+        
+        # Micro-batching of concurrent synthesis requests (batch_size > 1)
+        self._synthesis_queue: Optional[asyncio.Queue] = None
+        self._batcher_task: Optional[asyncio.Task] = None
         
-        self._model_lock = asyncio.Lock()
-        self._is_loaded = False
+        # Synthesized audio keyed by text/voice digest (see _waveform_cache_key)
+        self._waveform_cache: "OrderedDict[bytes, AudioData]" = OrderedDict()
+        self._waveform_cache_bytes = 0
+        
+        # Per-instance so cached ids never outlive or leak across processors
+        self._tokenize_cached = lru_cache(maxsize=TOKENIZE_CACHE_SIZE)(self._tokenize)
         
         self.logger = get_module_logger(__name__)
         
@@ -67,6 +174,9 @@ class SpeechT5Adapter(VoiceInterfacePort):
         self.max_text_length = 600  # Maximum characters for TTS
         self.default_voice_speed = 1.0
         self.default_voice_pitch = 1.0
+        
+        # Dedicated pool so TTS work neither starves nor waits on the default executor
+        self._executor = ThreadPoolExecutor(max_workers=EXECUTOR_WORKERS, thread_name_prefix="speecht5")
     
     def _resolve_device(self, device: str) -> str:
         """Resolve device string to actual device."""
@@ -74,78 +184,225 @@ class SpeechT5Adapter(VoiceInterfacePort):
             return "cuda" if torch.cuda.is_available() else "cpu"
         return device
     
+    def _resolve_quantization(self, quantization: Optional[str]) -> Optional[str]:
+        """
+        Resolve the quantization mode for the current device.
+        
+        "auto" selects bf16 on CPU when the requested dtype is fp16 (CPUs
+        without AVX512-FP16 emulate fp16 slowly). It never selects int8,
+        which changes output quality and must be requested explicitly.
+        """
+        if quantization != "auto":
+            if quantization is not None and quantization not in QUANTIZATION_DTYPES:
+                raise ValueError(f"Unsupported quantization: {quantization}")
+            return quantization
+        
+        if self.device == "cpu" and self.torch_dtype == torch.float16:
+            return "bf16"
+        
+        return None
+    
+    def _load_tts_model(self) -> "SpeechT5ForTextToSpeech":
+        """Load the TTS model with the configured precision."""
+        speecht5 = _lazy_import()
+        
+        if self.quantization == "int8":
+            # bitsandbytes places quantized weights itself; .to() is not allowed
+            return speecht5.SpeechT5ForTextToSpeech.from_pretrained(
+                self.model_name,
+                torch_dtype=self.torch_dtype,
+                quantization_config=speecht5.BitsAndBytesConfig(load_in_8bit=True),
+                device_map={"": self.device},
+                low_cpu_mem_usage=True
+            )
+        
+        return speecht5.SpeechT5ForTextToSpeech.from_pretrained(
+            self.model_name,
+            torch_dtype=self.torch_dtype,
+            low_cpu_mem_usage=True
+        ).to(self.device)
+    
     async def _ensure_model_loaded(self) -> None:
-        """Ensure SpeechT5 model is loaded (thread-safe)."""
-        if self._is_loaded:
+        """Ensure SpeechT5 model is loaded (concurrent callers share one load)."""
+        if self._loaded_event.is_set():
             return
         
-        async with self._model_lock:
-            if self._is_loaded:  # Double-check pattern
-                return
+        if self._load_task is None:
+            self._load_task = asyncio.get_running_loop().create_task(self._do_load())
+        
+        load_task = self._load_task
+        try:
+            # Shielded so a cancelled caller does not abort the shared load
+            await asyncio.shield(load_task)
+        except Exception:
+            # Let the next caller retry a failed load
+            if self._load_task is load_task:
+                self._load_task = None
+            raise
+    
+    async def _do_load(self) -> None:
+        """Load processor, model, vocoder and speaker embeddings."""
+        try:
+            self.logger.info(f"Loading SpeechT5 model: {self.model_name}")
             
-            try:
-                self.logger.info(f"Loading SpeechT5 model: {self.model_name}")
-                
-                # Load components in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                
-                # Load processor
-                self.processor = await loop.run_in_executor(
-                    None,
-                    lambda: SpeechT5Processor.from_pretrained(self.model_name)
-                )
-                
-                # Load TTS model
-                self.model = await loop.run_in_executor(
-                    None,
-                    lambda: SpeechT5ForTextToSpeech.from_pretrained(
-                        self.model_name,
-                        torch_dtype=self.torch_dtype,
-                        low_cpu_mem_usage=True
-                    ).to(self.device)
-                )
-                
-                # Load vocoder
-                self.vocoder = await loop.run_in_executor(
-                    None,
-                    lambda: SpeechT5HifiGan.from_pretrained(
+            # Load components in thread pool to avoid blocking
+            loop = asyncio.get_event_loop()
+            speecht5 = await loop.run_in_executor(self._executor, _lazy_import)
+            
+            # Processor, model, vocoder and speaker embeddings are independent, so
+            # their downloads and disk reads overlap
+            self.processor, self.model, self.vocoder, _ = await asyncio.gather(
+                loop.run_in_executor(
+                    self._executor,
+                    lambda: speecht5.SpeechT5Processor.from_pretrained(self.model_name)
+                ),
+                loop.run_in_executor(self._executor, self._load_tts_model),
+                loop.run_in_executor(
+                    self._executor,
+                    lambda: speecht5.SpeechT5HifiGan.from_pretrained(
                         self.vocoder_name,
                         torch_dtype=self.torch_dtype
                     ).to(self.device)
-                )
-                
-                # Load speaker embeddings
-                await self._load_speaker_embeddings()
-                
-                self._is_loaded = True
-                self.logger.info(f"SpeechT5 model loaded successfully on {self.device}")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to load SpeechT5 model: {e}")
-                raise VoiceProcessingError(f"Model loading failed: {e}") from e
+                ),
+                self._load_speaker_embeddings()
+            )
+            
+            if self.compile_model:
+                self._compile_model()
+            
+            # Pay the first-call latency spike here instead of on a user request
+            if not self._warmed_up:
+                await loop.run_in_executor(self._executor, self._warmup_sync)
+            
+            self._loaded_event.set()
+            self.logger.info(
+                f"SpeechT5 model loaded successfully on {self.device} "
+                f"({self.quantization or self.torch_dtype})"
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Failed to load SpeechT5 model: {e}")
+            raise VoiceProcessingError(f"Model loading failed: {e}") from e
+    
+    def _compile_model(self) -> None:
+        """
+        Compile the autoregressive decoder and the vocoder with torch.compile.
+        
+        generate_speech is a Python loop, so compiling the whole model would
+        not reach it; the decoder layers run once per output frame and the
+        vocoder once per utterance, which is where dispatch overhead goes.
+        Compilation happens lazily on the warm-up pass.
+        """
+        torch_version = tuple(int(part) for part in re.findall(r"\d+", torch.__version__)[:2])
+        if torch_version < TORCH_COMPILE_MIN_VERSION or not hasattr(torch, "compile"):
+            self.logger.warning(f"torch.compile requires torch >= 2.1, found {torch.__version__}")
+            return
+        
+        try:
+            decoder = self.model.speecht5.decoder
+            decoder.wrapped_decoder = torch.compile(
+                decoder.wrapped_decoder, mode="reduce-overhead", dynamic=True
+            )
+            self.vocoder = torch.compile(self.vocoder, mode="reduce-overhead", dynamic=True)
+            
+            self._is_compiled = True
+            self.logger.info("SpeechT5 decoder and vocoder compiled")
+            
+        except Exception as e:
+            self.logger.warning(f"torch.compile failed, using eager SpeechT5: {e}")
+    
+    def _warmup_sync(self) -> None:
+        """Run dummy synthesis passes so the first real request is not slowed down."""
+        try:
+            input_ids = self._tokenize_cached(WARMUP_TEXT).to(self.device)
+            
+            with torch.inference_mode():
+                for _ in range(WARMUP_ITERATIONS):
+                    self.model.generate_speech(
+                        input_ids,
+                        self.speaker_embeddings,
+                        vocoder=self.vocoder
+                    )
+            
+            if self.device.startswith("cuda"):
+                torch.cuda.synchronize()
+                torch.cuda.empty_cache()
+            
+            self._warmed_up = True
+            self.logger.debug("SpeechT5 warm-up complete")
+            
+        except Exception as e:
+            self.logger.warning(f"SpeechT5 warm-up failed: {e}")
     
     async def _load_speaker_embeddings(self) -> None:
         """Load default speaker embeddings."""
         try:
-            # Load speaker embeddings from CMU ARCTIC dataset
             loop = asyncio.get_event_loop()
             
-            embeddings_dataset = await loop.run_in_executor(
-                None,
-                lambda: load_dataset("Matthijs/cmu-arctic-xvectors", split="validation")
+            embedding = await loop.run_in_executor(
+                self._executor,
+                self._load_speaker_embedding_sync,
+                DEFAULT_SPEAKER_INDEX
             )
             
-            # Use first speaker embedding as default
-            self.speaker_embeddings = torch.tensor(
-                embeddings_dataset[7306]["xvector"]  # Female speaker
-            ).unsqueeze(0).to(self.device)
+            self.speaker_embeddings = embedding.unsqueeze(0).to(self.device, dtype=self.torch_dtype)
             
             self.logger.debug("Speaker embeddings loaded successfully")
             
         except Exception as e:
             self.logger.warning(f"Failed to load speaker embeddings: {e}")
-            # Create dummy embeddings as fallback
-            self.speaker_embeddings = torch.randn(1, 512).to(self.device)
+            self.speaker_embeddings = self._default_speaker_embedding().unsqueeze(0).to(
+                self.device, dtype=self.torch_dtype
+            )
+    
+    def _default_speaker_embedding(self) -> torch.Tensor:
+        """
+        Deterministic fallback speaker embedding.
+        
+        Uses the bundled x-vector when it is shipped with the package. The
+        all-zero embedding used otherwise is not a real voice and produces
+        abnormal speech, so synthesis on it is flagged as degraded and kept
+        out of the waveform cache.
+        """
+        if SPEAKER_EMBEDDING_RESOURCE.exists():
+            try:
+                return torch.load(SPEAKER_EMBEDDING_RESOURCE, map_location="cpu", weights_only=True)
+            except Exception as e:
+                self.logger.warning(f"Failed to load bundled speaker embedding: {e}")
+        
+        self.logger.error("No speaker embedding available, synthesizing with a zero x-vector (degraded audio, not cached)")
+        self._degraded_voice = True
+        return torch.zeros(512)
+    
+    def _load_speaker_embedding_sync(self, speaker_index: int) -> torch.Tensor:
+        """
+        Load one CMU ARCTIC x-vector, using the on-disk cache when present.
+        
+        Args:
+            speaker_index: Row of the x-vector dataset's validation split
+            
+        Returns:
+            Speaker embedding tensor of shape [512] on CPU
+        """
+        cache_path = SPEAKER_EMBEDDING_CACHE_DIR / f"speaker_emb_{speaker_index}.pt"
+        
+        if cache_path.exists():
+            try:
+                return torch.load(cache_path, map_location="cpu", weights_only=True)
+            except Exception as e:
+                self.logger.warning(f"Ignoring unreadable speaker embedding cache {cache_path}: {e}")
+        
+        # Load speaker embeddings from CMU ARCTIC dataset
+        embeddings_dataset = _lazy_import().load_dataset("Matthijs/cmu-arctic-xvectors", split="validation")
+        embedding = torch.tensor(embeddings_dataset[speaker_index]["xvector"])
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            torch.save(embedding, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not cache speaker embedding: {e}")
+        
+        return embedding
     
     async def synthesize_speech(self, text: str, voice_config: Optional[Dict[str, Any]] = None) -> Optional[AudioData]:
         """
@@ -158,6 +415,77 @@ class SpeechT5Adapter(VoiceInterfacePort):
         Returns:
             AudioData object containing synthesized speech or None if failed
         """
+        cache_key = None
+        if self.enable_cache:
+            cache_key = self._waveform_cache_key(text, self._parse_voice_config(voice_config))
+            cached = self._waveform_cache.get(cache_key)
+            if cached is not None:
+                self._waveform_cache.move_to_end(cache_key)
+                return cached
+        
+        chunks = [
+            chunk.get_samples_as_numpy()
+            async for chunk in self.synthesize_speech_stream(text, voice_config)
+        ]
+        
+        if not chunks:
+            self.logger.warning("Empty synthesis result")
+            return None
+        
+        audio_data = AudioData.from_numpy(np.concatenate(chunks), sample_rate=self.sample_rate)
+        self.logger.debug(f"Speech synthesis successful: {audio_data.duration_seconds:.2f}s")
+        
+        if cache_key is not None and not self._degraded_voice:
+            self._store_waveform(cache_key, audio_data)
+        
+        return audio_data
+    
+    def _waveform_cache_key(self, text: str, config: Dict[str, Any]) -> bytes:
+        """Build the waveform cache key for text under the given voice configuration."""
+        key_material = f"{self.model_name}\0{self.vocoder_name}\0{sorted(config.items())!r}\0{text}"
+        return hashlib.blake2b(key_material.encode("utf-8"), digest_size=16).digest()
+    
+    def _store_waveform(self, cache_key: bytes, audio_data: AudioData) -> None:
+        """Add synthesized audio to the cache, evicting least recently used entries."""
+        samples = audio_data.get_samples_as_numpy()
+        if samples.nbytes > WAVEFORM_CACHE_MAX_BYTES:
+            return
+        
+        # Cached audio is shared between callers
+        samples.setflags(write=False)
+        
+        previous = self._waveform_cache.pop(cache_key, None)
+        if previous is not None:
+            self._waveform_cache_bytes -= previous.get_samples_as_numpy().nbytes
+        
+        self._waveform_cache[cache_key] = audio_data
+        self._waveform_cache_bytes += samples.nbytes
+        
+        while (
+            len(self._waveform_cache) > WAVEFORM_CACHE_SIZE
+            or self._waveform_cache_bytes > WAVEFORM_CACHE_MAX_BYTES
+        ):
+            _, evicted = self._waveform_cache.popitem(last=False)
+            self._waveform_cache_bytes -= evicted.get_samples_as_numpy().nbytes
+    
+    async def synthesize_speech_stream(
+        self,
+        text: str,
+        voice_config: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[AudioData]:
+        """
+        Convert text to speech sentence by sentence, yielding audio as it is ready.
+        
+        The first chunk is available after synthesizing only the first sentence.
+        Consecutive chunks are crossfaded over CROSSFADE_SAMPLES samples.
+        
+        Args:
+            text: Text to convert to speech
+            voice_config: Optional voice configuration (speed, pitch, etc.)
+            
+        Yields:
+            AudioData chunks in playback order
+        """
         try:
             await self._ensure_model_loaded()
             
@@ -169,32 +497,111 @@ class SpeechT5Adapter(VoiceInterfacePort):
             # Apply voice configuration
             config = self._parse_voice_config(voice_config)
             
-            # Run synthesis in thread pool
-            loop = asyncio.get_event_loop()
-            audio_array = await loop.run_in_executor(
-                None,
-                self._synthesize_sync,
-                processed_text,
-                config
-            )
+            pending_tail: Optional[np.ndarray] = None
             
-            if audio_array is not None and len(audio_array) > 0:
-                # Create AudioData object
-                audio_data = AudioData.from_numpy(
-                    audio_array,
-                    sample_rate=self.sample_rate
-                )
+            for sentence in self._split_sentences(processed_text):
+                audio_array = await self._synthesize(sentence, config)
+                
+                if audio_array is None or len(audio_array) == 0:
+                    continue
+                
+                if pending_tail is not None:
+                    audio_array = self._crossfade(pending_tail, audio_array)
                 
-                self.logger.debug(f"Speech synthesis successful: {audio_data.duration_seconds:.2f}s")
-                return audio_data
-            else:
-                self.logger.warning("Empty synthesis result")
-                return None
+                # Hold back the tail so it can be blended with the next chunk
+                if len(audio_array) > CROSSFADE_SAMPLES:
+                    pending_tail = audio_array[-CROSSFADE_SAMPLES:]
+                    audio_array = audio_array[:-CROSSFADE_SAMPLES]
+                else:
+                    pending_tail = None
+                
+                yield AudioData.from_numpy(audio_array, sample_rate=self.sample_rate)
+            
+            if pending_tail is not None:
+                yield AudioData.from_numpy(pending_tail, sample_rate=self.sample_rate)
                 
         except Exception as e:
             self.logger.error(f"Speech synthesis failed: {e}")
             raise SynthesisError(f"SpeechT5 synthesis failed: {e}") from e
     
+    async def _synthesize(self, text: str, config: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        Synthesize one sentence off the event loop.
+        
+        With batch_size > 1 the sentence is queued so the batcher can run it
+        together with sentences from concurrent requests.
+        """
+        loop = asyncio.get_running_loop()
+        
+        if self.batch_size == 1:
+            return await loop.run_in_executor(self._executor, self._synthesize_sync, text, config)
+        
+        if self._batcher_task is None or self._batcher_task.done():
+            self._synthesis_queue = asyncio.Queue()
+            self._batcher_task = loop.create_task(self._run_batcher(self._synthesis_queue))
+        
+        future = loop.create_future()
+        await self._synthesis_queue.put((text, config, future))
+        return await future
+    
+    async def _run_batcher(self, queue: asyncio.Queue) -> None:
+        """Collect queued sentences for up to max_wait_ms and synthesize them as one batch."""
+        loop = asyncio.get_running_loop()
+        batch: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + self.max_wait_ms / 1000
+                
+                while len(batch) < self.batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                
+                texts = [text for text, _, _ in batch]
+                configs = [config for _, config, _ in batch]
+                
+                try:
+                    results = await loop.run_in_executor(self._executor, self._synthesize_batch_sync, texts, configs)
+                except Exception as e:
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for (_, _, future), result in zip(batch, results):
+                        if not future.done():
+                            future.set_result(result)
+        except asyncio.CancelledError:
+            # Callers awaiting the batch in hand would otherwise wait forever
+            self._fail_pending(batch)
+            raise
+    
+    @staticmethod
+    def _fail_pending(requests: List[Tuple[str, Dict[str, Any], asyncio.Future]]) -> None:
+        """Fail the futures of synthesis requests that will never run."""
+        for _, _, future in requests:
+            if not future.done():
+                future.set_exception(SynthesisError("SpeechT5 adapter closed before synthesis"))
+    
+    def _split_sentences(self, text: str) -> List[str]:
+        """Split prepared text into sentences for chunked synthesis."""
+        return [sentence for sentence in _SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+    
+    def _crossfade(self, tail: np.ndarray, audio: np.ndarray) -> np.ndarray:
+        """Blend the previous chunk's tail into the start of the next chunk."""
+        overlap = min(len(tail), len(audio))
+        if overlap == 0:
+            return np.concatenate((tail, audio))
+        
+        fade_in = np.linspace(0.0, 1.0, overlap, dtype=audio.dtype)
+        blended = tail[-overlap:] * (1.0 - fade_in) + audio[:overlap] * fade_in
+        return np.concatenate((tail[:-overlap], blended, audio[overlap:]))
+    
     def _prepare_text_for_synthesis(self, text: str) -> str:
         """Prepare text for speech synthesis."""
         if not text or not text.strip():
@@ -208,14 +615,12 @@ class SpeechT5Adapter(VoiceInterfacePort):
             self.logger.warning(f"Text truncated from {len(processed_text)} to {self.max_text_length} characters")
             processed_text = processed_text[:self.max_text_length]
             
-            # Try to end at a sentence boundary
-            last_period = processed_text.rfind('.')
-            last_exclamation = processed_text.rfind('!')
-            last_question = processed_text.rfind('?')
-            
-            last_sentence_end = max(last_period, last_exclamation, last_question)
-            if last_sentence_end > self.max_text_length * 0.8:  # If we can save 20% of text
-                processed_text = processed_text[:last_sentence_end + 1]
+            # Try to end at a sentence boundary, scanning back only while we'd keep 80% of text
+            min_sentence_end = int(self.max_text_length * 0.8)
+            for index in range(len(processed_text) - 1, min_sentence_end, -1):
+                if processed_text[index] in ".!?":
+                    processed_text = processed_text[:index + 1]
+                    break
         
         return processed_text
     
@@ -236,38 +641,136 @@ class SpeechT5Adapter(VoiceInterfacePort):
         
         return config
     
+    def _tokenize(self, text: str) -> torch.Tensor:
+        """
+        Tokenize text for SpeechT5.
+        
+        Called through ``self._tokenize_cached``; the ids stay on CPU so the
+        cache never pins device memory. Callers must not modify them in place.
+        
+        Args:
+            text: Text to tokenize
+            
+        Returns:
+            Input ids tensor of shape [1, sequence_length] on CPU
+        """
+        return self.processor(text=text, return_tensors="pt")["input_ids"]
+    
+    @torch.inference_mode()
     def _synthesize_sync(self, text: str, config: Dict[str, Any]) -> Optional[np.ndarray]:
         """Synchronous speech synthesis for thread pool execution."""
         try:
             # Tokenize text
-            inputs = self.processor(text=text, return_tensors="pt")
-            input_ids = inputs["input_ids"].to(self.device)
+            input_ids = self._tokenize_cached(text).to(self.device)
             
             # Generate speech
-            with torch.no_grad():
-                speech = self.model.generate_speech(
-                    input_ids,
-                    self.speaker_embeddings,
-                    vocoder=self.vocoder
-                )
-            
-            # Convert to numpy and apply voice modifications
-            audio_array = speech.cpu().numpy()
-            
-            # Apply speed modification (simple time stretching)
-            speed = config.get("speed", 1.0)
+            speech = self.model.generate_speech(
+                input_ids,
+                self.speaker_embeddings,
+                vocoder=self.vocoder
+            )
+            
+            return self._finalize_waveform(speech, config)
+            
+        except Exception as e:
+            raise SynthesisError(f"Synchronous synthesis failed: {e}") from e
+    
+    @torch.inference_mode()
+    def _synthesize_batch_sync(self, texts: List[str], configs: List[Dict[str, Any]]) -> List[Optional[np.ndarray]]:
+        """
+        Synthesize several sentences with a single padded generate_speech call.
+        
+        Args:
+            texts: Sentences to synthesize
+            configs: Parsed voice configuration per sentence
+            
+        Returns:
+            Waveform per sentence, in input order
+        """
+        if len(texts) == 1:
+            return [self._synthesize_sync(texts[0], configs[0])]
+        
+        try:
+            sequences = [self._tokenize_cached(text)[0] for text in texts]
+            input_ids = torch.nn.utils.rnn.pad_sequence(
+                sequences,
+                batch_first=True,
+                padding_value=self.processor.tokenizer.pad_token_id
+            ).to(self.device)
+            attention_mask = torch.nn.utils.rnn.pad_sequence(
+                [torch.ones_like(sequence) for sequence in sequences],
+                batch_first=True
+            ).to(self.device)
+            
+            waveforms, lengths = self.model.generate_speech(
+                input_ids,
+                self.speaker_embeddings.expand(len(texts), -1),
+                attention_mask=attention_mask,
+                vocoder=self.vocoder,
+                return_output_lengths=True
+            )
+            
+            return [
+                self._finalize_waveform(waveforms[i, :length], config)
+                for i, (length, config) in enumerate(zip(lengths, configs))
+            ]
+            
+        except Exception as e:
+            raise SynthesisError(f"Batched synthesis failed: {e}") from e
+    
+    def _finalize_waveform(self, speech: torch.Tensor, config: Dict[str, Any]) -> np.ndarray:
+        """Apply voice configuration to a generated waveform and convert it to numpy."""
+        speed = config.get("speed", 1.0)
+        pitch = config.get("pitch", 1.0)
+        
+        # On GPU, modify the waveform in place and copy it to host only once
+        if speech.is_cuda:
+            speech = self._apply_voice_changes_on_device(speech, speed, pitch)
+            return speech.detach().float().cpu().numpy()
+        
+        # Convert to numpy and apply voice modifications
+        audio_array = speech.float().cpu().numpy()
+        
+        # Apply speed modification (simple time stretching)
+        if speed != 1.0:
+            audio_array = self._apply_speed_change(audio_array, speed)
+        
+        # Apply pitch modification (simple pitch shifting)
+        if pitch != 1.0:
+            audio_array = self._apply_pitch_change(audio_array, pitch)
+        
+        return audio_array
+    
+    def _apply_voice_changes_on_device(self, speech: torch.Tensor, speed: float, pitch: float) -> torch.Tensor:
+        """
+        Apply speed and pitch changes to a waveform without leaving its device.
+        
+        Args:
+            speech: 1-D waveform tensor
+            speed: Playback speed factor
+            pitch: Pitch (amplitude) scaling factor
+            
+        Returns:
+            Modified waveform tensor on the same device
+        """
+        try:
             if speed != 1.0:
-                audio_array = self._apply_speed_change(audio_array, speed)
+                new_length = int(speech.shape[-1] / speed)
+                speech = torch.nn.functional.interpolate(
+                    speech.view(1, 1, -1),
+                    size=new_length,
+                    mode="linear",
+                    align_corners=True
+                ).view(-1)
             
-            # Apply pitch modification (simple pitch shifting)
-            pitch = config.get("pitch", 1.0)
             if pitch != 1.0:
-                audio_array = self._apply_pitch_change(audio_array, pitch)
+                speech = speech * pitch
             
-            return audio_array
+            return speech
             
         except Exception as e:
-            raise SynthesisError(f"Synchronous synthesis failed: {e}") from e
+            self.logger.warning(f"On-device voice modification failed: {e}")
+            return speech
     
     def _apply_speed_change(self, audio: np.ndarray, speed: float) -> np.ndarray:
         """Apply speed change to audio (simple resampling)."""
@@ -275,10 +778,23 @@ class SpeechT5Adapter(VoiceInterfacePort):
             if speed == 1.0:
                 return audio
             
+            audio = audio.astype(np.float32, copy=False)
+            
+            try:
+                # Imported lazily so scipy stays optional for TTS
+                from scipy import signal
+            except ImportError:
+                signal = None
+            
+            if signal is not None:
+                ratio = Fraction(1 / speed).limit_denominator(SPEED_RATIO_MAX_DENOMINATOR)
+                return signal.resample_poly(audio, ratio.numerator, ratio.denominator).astype(np.float32, copy=False)
+            
             # Simple speed change by resampling
             new_length = int(len(audio) / speed)
-            indices = np.linspace(0, len(audio) - 1, new_length)
-            return np.interp(indices, np.arange(len(audio)), audio)
+            indices = np.linspace(0, len(audio) - 1, new_length, dtype=np.float32)
+            positions = np.arange(len(audio), dtype=np.float32)
+            return np.interp(indices, positions, audio).astype(np.float32, copy=False)
             
         except Exception as e:
             self.logger.warning(f"Speed change failed: {e}")
@@ -292,7 +808,7 @@ class SpeechT5Adapter(VoiceInterfacePort):
             
             # This is a very simplified pitch shift
             # In practice, you'd use more sophisticated algorithms
-            return audio * pitch
+            return audio * np.float32(pitch)
             
         except Exception as e:
             self.logger.warning(f"Pitch change failed: {e}")
@@ -335,7 +851,7 @@ class SpeechT5Adapter(VoiceInterfacePort):
         """Check if SpeechT5 interface is available and ready."""
         try:
             await self._ensure_model_loaded()
-            return self._is_loaded
+            return self._loaded_event.is_set()
         except Exception:
             return False
     
@@ -346,18 +862,19 @@ class SpeechT5Adapter(VoiceInterfacePort):
             "model": self.model_name,
             "vocoder": self.vocoder_name,
             "device": self.device,
-            "is_loaded": self._is_loaded,
+            "is_loaded": self._loaded_event.is_set(),
+            "compiled": self._is_compiled,
+            "quantization": self.quantization,
             "available": SPEECHT5_AVAILABLE
         }
         
-        if self._is_loaded and self.model and self.vocoder:
+        if self._loaded_event.is_set() and self.model and self.vocoder:
             try:
                 # Test with dummy text
                 test_text = "Hello"
-                inputs = self.processor(text=test_text, return_tensors="pt")
-                input_ids = inputs["input_ids"].to(self.device)
+                input_ids = self._tokenize_cached(test_text).to(self.device)
                 
-                with torch.no_grad():
+                with torch.inference_mode():
                     _ = self.model.generate_speech(
                         input_ids,
                         self.speaker_embeddings,
@@ -374,3 +891,26 @@ class SpeechT5Adapter(VoiceInterfacePort):
             status["status"] = "not_loaded"
         
         return status
+    
+    async def close(self) -> None:
+        """Stop the batcher and release the synthesis executor."""
+        if self._batcher_task is not None:
+            self._batcher_task.cancel()
+            try:
+                await self._batcher_task
+            except asyncio.CancelledError:
+                pass
+            self._batcher_task = None
+        
+        # Requests still queued behind the cancelled batcher
+        if self._synthesis_queue is not None:
+            pending = []
+            while not self._synthesis_queue.empty():
+                pending.append(self._synthesis_queue.get_nowait())
+            self._fail_pending(pending)
+            self._synthesis_queue = None
+        
+        self._executor.shutdown(wait=False)
+        self._waveform_cache.clear()
+        self._waveform_cache_bytes = 0
+        self.logger.info("SpeechT5 adapter closed")
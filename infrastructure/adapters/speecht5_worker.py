@@ -0,0 +1,398 @@
+"""Out-of-process SpeechT5 text-to-speech.
+
+The SpeechT5 model and vocoder live in a spawned worker process so that
+closing the adapter returns all of their memory (including the CUDA caching
+allocator's VRAM) to the system. The parent talks to the worker over
+multiprocessing queues and receives float32 PCM chunks as they are produced.
+"""
+
+import asyncio
+import itertools
+import multiprocessing
+import queue as queue_module
+import threading
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
+
+import numpy as np
+
+from application.ports.voice_interface_port import (
+    VoiceInterfacePort, VoiceProcessingError, SynthesisError
+)
+from domain.value_objects.audio_data import AudioData
+from infrastructure.logging.logger_factory import LoggerFactory, get_module_logger, initialize_logging
+from infrastructure.logging.log_config import LogConfig
+
+
+# Seconds to wait for the worker to exit cleanly before terminating it
+WORKER_SHUTDOWN_TIMEOUT = 10.0
+
+# Sample rate of audio produced by the worker
+WORKER_SAMPLE_RATE = 16000
+
+# How often the dispatcher checks that the worker is still alive (seconds)
+WORKER_POLL_INTERVAL = 1.0
+
+
+def _worker_main(
+    adapter_kwargs: Dict[str, Any],
+    log_config: Optional[Dict[str, Any]],
+    requests: "multiprocessing.Queue",
+    responses: "multiprocessing.Queue"
+) -> None:
+    """
+    Worker process entry point.
+    
+    Requests are ("synthesize", request_id, text, voice_config),
+    ("available", request_id) or ("health", request_id); None stops the
+    worker. Each request is answered
+    with zero or more (request_id, "chunk", pcm_bytes) messages followed by
+    (request_id, "done", result) or (request_id, "error", message).
+    """
+    initialize_logging(LogConfig.from_dict(log_config) if log_config else None)
+    
+    # Imported here so the parent process never loads torch/transformers for TTS
+    from infrastructure.adapters.speecht5_adapter import SpeechT5Adapter
+    
+    try:
+        adapter = SpeechT5Adapter(**adapter_kwargs)
+        startup_error = None
+    except Exception as e:
+        adapter = None
+        startup_error = f"SpeechT5 unavailable in worker: {e}"
+    
+    loop = asyncio.new_event_loop()
+    
+    async def stream(request_id: int, text: str, voice_config: Optional[Dict[str, Any]]) -> None:
+        async for chunk in adapter.synthesize_speech_stream(text, voice_config):
+            pcm = chunk.get_samples_as_numpy().astype(np.float32, copy=False).tobytes()
+            responses.put((request_id, "chunk", pcm))
+    
+    try:
+        while True:
+            message = requests.get()
+            if message is None:
+                break
+            
+            kind, request_id, *args = message
+            try:
+                if adapter is None:
+                    responses.put((request_id, "error", startup_error))
+                elif kind == "synthesize":
+                    loop.run_until_complete(stream(request_id, *args))
+                    responses.put((request_id, "done", None))
+                elif kind == "available":
+                    available = loop.run_until_complete(adapter.is_available())
+                    responses.put((request_id, "done", available))
+                elif kind == "health":
+                    status = loop.run_until_complete(adapter.get_health_status())
+                    responses.put((request_id, "done", status))
+                else:
+                    responses.put((request_id, "error", f"Unknown request: {kind}"))
+            except Exception as e:
+                responses.put((request_id, "error", str(e)))
+    finally:
+        if adapter is not None:
+            loop.run_until_complete(adapter.close())
+        loop.close()
+        # Tells the parent's dispatcher thread to stop
+        responses.put(None)
+
+
+class SpeechT5ProcessAdapter(VoiceInterfacePort):
+    """
+    SpeechT5 adapter that runs the model in an isolated worker process.
+    
+    This is a thin proxy with the same TTS surface as SpeechT5Adapter. The
+    worker is started on first use and stopped by close(), which guarantees
+    the model's memory is released; a later request starts a fresh worker.
+    """
+    
+    def __init__(self, **adapter_kwargs: Any):
+        """
+        Initialize process-isolated SpeechT5 adapter.
+        
+        Args:
+            adapter_kwargs: Keyword arguments forwarded to SpeechT5Adapter in the worker
+        """
+        self.adapter_kwargs = adapter_kwargs
+        self.sample_rate = WORKER_SAMPLE_RATE
+        
+        self._context = multiprocessing.get_context("spawn")
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._requests: Optional["multiprocessing.Queue"] = None
+        self._responses: Optional["multiprocessing.Queue"] = None
+        self._dispatcher: Optional[threading.Thread] = None
+        
+        # request_id -> (event loop, queue) receiving that request's messages
+        self._pending: Dict[int, Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = {}
+        self._pending_lock = threading.Lock()
+        self._request_ids = itertools.count()
+        self._start_lock = threading.Lock()
+        
+        self.logger = get_module_logger(__name__)
+    
+    async def _ensure_worker(self) -> None:
+        """Start the worker process and response dispatcher if not running."""
+        if self._process is not None and self._process.is_alive():
+            return
+        
+        # Spawning blocks while the child imports its modules, so keep it off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self._start_worker)
+    
+    def _start_worker(self) -> None:
+        """Start the worker process and response dispatcher unless another caller already has."""
+        with self._start_lock:
+            if self._process is not None and self._process.is_alive():
+                return
+            
+            log_config = LoggerFactory().get_config()
+            
+            self._requests = self._context.Queue()
+            self._responses = self._context.Queue()
+            self._process = self._context.Process(
+                target=_worker_main,
+                args=(
+                    self.adapter_kwargs,
+                    log_config.to_dict() if log_config else None,
+                    self._requests,
+                    self._responses
+                ),
+                name="speecht5-worker",
+                daemon=True
+            )
+            self._process.start()
+            
+            self._dispatcher = threading.Thread(
+                target=self._dispatch_responses,
+                args=(self._process, self._responses),
+                name="speecht5-dispatcher",
+                daemon=True
+            )
+            self._dispatcher.start()
+            
+            self.logger.info(f"Started SpeechT5 worker process (pid {self._process.pid})")
+    
+    def _dispatch_responses(
+        self,
+        process: multiprocessing.process.BaseProcess,
+        responses: "multiprocessing.Queue"
+    ) -> None:
+        """Route worker messages to the asyncio queue of the request they answer."""
+        while True:
+            try:
+                message = responses.get(timeout=WORKER_POLL_INTERVAL)
+            except queue_module.Empty:
+                if process.is_alive():
+                    continue
+                # The worker died (e.g. OOM); fail everything still waiting
+                self._fail_pending(f"SpeechT5 worker exited with code {process.exitcode}")
+                break
+            
+            if message is None:
+                break
+            
+            with self._pending_lock:
+                target = self._pending.get(message[0])
+            
+            # Requests abandoned by their caller are dropped
+            if target is not None:
+                self._deliver(target, message)
+    
+    def _deliver(self, target: Tuple[asyncio.AbstractEventLoop, asyncio.Queue], message: Tuple) -> None:
+        """Hand a worker message to the event loop that is waiting for it."""
+        loop, queue = target
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, message)
+        except RuntimeError:
+            # The caller's event loop has already closed
+            pass
+    
+    def _fail_pending(self, reason: str) -> None:
+        """Answer every outstanding request with an error."""
+        with self._pending_lock:
+            pending = list(self._pending.items())
+        
+        for request_id, target in pending:
+            self._deliver(target, (request_id, "error", reason))
+    
+    @asynccontextmanager
+    async def streaming_request(
+        self,
+        text: str,
+        voice_config: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[AsyncIterator[AudioData]]:
+        """
+        Submit a synthesis request and stream its audio chunks back.
+        
+        Args:
+            text: Text to convert to speech
+            voice_config: Optional voice configuration (speed, pitch, etc.)
+        
+        Yields:
+            Async iterator over AudioData chunks in playback order
+        """
+        await self._ensure_worker()
+        
+        request_id = next(self._request_ids)
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._pending_lock:
+            self._pending[request_id] = (asyncio.get_running_loop(), queue)
+        
+        async def chunks() -> AsyncIterator[AudioData]:
+            while True:
+                _, kind, payload = await queue.get()
+                if kind == "done":
+                    return
+                if kind == "error":
+                    raise SynthesisError(f"SpeechT5 worker failed: {payload}")
+                
+                samples = np.frombuffer(payload, dtype=np.float32)
+                yield AudioData.from_numpy(samples, sample_rate=self.sample_rate)
+        
+        try:
+            self._requests.put(("synthesize", request_id, text, voice_config))
+            yield chunks()
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+    
+    async def _request(self, kind: str) -> Any:
+        """Send a non-streaming request to the worker and return its result."""
+        await self._ensure_worker()
+        
+        request_id = next(self._request_ids)
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._pending_lock:
+            self._pending[request_id] = (asyncio.get_running_loop(), queue)
+        
+        try:
+            self._requests.put((kind, request_id))
+            _, status, payload = await queue.get()
+            if status == "error":
+                raise VoiceProcessingError(f"SpeechT5 worker failed: {payload}")
+            return payload
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+    
+    async def synthesize_speech(self, text: str, voice_config: Optional[Dict[str, Any]] = None) -> Optional[AudioData]:
+        """
+        Convert text to speech in the worker process.
+        
+        Args:
+            text: Text to convert to speech
+            voice_config: Optional voice configuration (speed, pitch, etc.)
+        
+        Returns:
+            AudioData object containing synthesized speech or None if failed
+        """
+        chunks = [
+            chunk.get_samples_as_numpy()
+            async for chunk in self.synthesize_speech_stream(text, voice_config)
+        ]
+        
+        if not chunks:
+            self.logger.warning("Empty synthesis result")
+            return None
+        
+        return AudioData.from_numpy(np.concatenate(chunks), sample_rate=self.sample_rate)
+    
+    async def synthesize_speech_stream(
+        self,
+        text: str,
+        voice_config: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[AudioData]:
+        """
+        Convert text to speech in the worker process, yielding audio as it is ready.
+        
+        Args:
+            text: Text to convert to speech
+            voice_config: Optional voice configuration (speed, pitch, etc.)
+        
+        Yields:
+            AudioData chunks in playback order
+        """
+        async with self.streaming_request(text, voice_config) as chunks:
+            async for chunk in chunks:
+                yield chunk
+    
+    async def transcribe_audio(self, audio: AudioData) -> Optional[str]:
+        """Not implemented in SpeechT5 adapter (TTS only)."""
+        raise NotImplementedError("SpeechT5 adapter only supports TTS, not ASR")
+    
+    async def validate_audio_quality(self, audio: AudioData) -> bool:
+        """Not implemented in SpeechT5 adapter (TTS only)."""
+        raise NotImplementedError("SpeechT5 adapter does not validate input audio")
+    
+    async def record_audio(self, duration_seconds: float) -> Optional[AudioData]:
+        """Not implemented in SpeechT5 adapter (use system recording)."""
+        raise NotImplementedError("SpeechT5 adapter does not support audio recording")
+    
+    async def play_audio(self, audio: AudioData) -> bool:
+        """Not implemented in SpeechT5 adapter (use system playback)."""
+        raise NotImplementedError("SpeechT5 adapter does not support audio playback")
+    
+    async def get_supported_languages(self) -> List[str]:
+        """Get list of supported languages for SpeechT5."""
+        return ["en"]
+    
+    async def detect_language(self, audio: AudioData) -> Optional[str]:
+        """Not implemented in SpeechT5 adapter (TTS only)."""
+        raise NotImplementedError("SpeechT5 adapter does not support language detection")
+    
+    async def get_transcription_confidence(self, audio: AudioData) -> float:
+        """Not implemented in SpeechT5 adapter (TTS only)."""
+        raise NotImplementedError("SpeechT5 adapter does not support transcription")
+    
+    async def enhance_audio_quality(self, audio: AudioData) -> AudioData:
+        """Not implemented in SpeechT5 adapter (TTS only)."""
+        raise NotImplementedError("SpeechT5 adapter does not enhance input audio")
+    
+    async def is_available(self) -> bool:
+        """Check if the worker can load SpeechT5 and is ready."""
+        try:
+            return bool(await self._request("available"))
+        except Exception:
+            return False
+    
+    async def get_health_status(self) -> Dict[str, Any]:
+        """Get health status of the SpeechT5 worker process."""
+        if self._process is None or not self._process.is_alive():
+            return {
+                "service": "speecht5_tts",
+                "isolated": True,
+                "status": "not_loaded"
+            }
+        
+        try:
+            status = await self._request("health")
+        except Exception as e:
+            status = {"service": "speecht5_tts", "status": "unhealthy", "error": str(e)}
+        
+        status["isolated"] = True
+        status["worker_pid"] = self._process.pid
+        return status
+    
+    async def close(self) -> None:
+        """Stop the worker process, releasing all model memory."""
+        with self._start_lock:
+            process, self._process = self._process, None
+            requests = self._requests
+        
+        if process is None:
+            return
+        
+        if process.is_alive():
+            requests.put(None)
+            await asyncio.get_running_loop().run_in_executor(
+                None, process.join, WORKER_SHUTDOWN_TIMEOUT
+            )
+        
+        if process.is_alive():
+            # The dispatcher notices the exit and fails any pending requests
+            self.logger.warning("SpeechT5 worker did not exit, terminating")
+            process.terminate()
+            process.join()
+        
+        self.logger.info("SpeechT5 worker process stopped")
@@ -1,8 +1,11 @@
 """Whisper adapter for speech-to-text functionality."""
 
 import asyncio
+import os
+import threading
 import torch
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 
@@ -13,11 +16,69 @@ from domain.value_objects.audio_data import AudioData
 from infrastructure.logging.logger_factory import get_module_logger
 
 try:
-    from transformers import WhisperProcessor, WhisperForConditionalGeneration
+    from transformers import (
+        WhisperProcessor, WhisperForConditionalGeneration, BitsAndBytesConfig, HqqConfig, pipeline
+    )
     WHISPER_AVAILABLE = True
 except ImportError:
     WHISPER_AVAILABLE = False
 
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+try:
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+
+# Whisper's decoder context length (max_target_positions)
+WHISPER_MAX_TARGET_LENGTH = 448
+
+# Log-Mel frames in Whisper's fixed 30-second input window
+WHISPER_INPUT_FRAMES = 3000
+
+# Tokens generated by the warm-up pass that triggers compilation
+WARMUP_NEW_TOKENS = 4
+
+# Window length for chunked long-form decoding
+LONG_FORM_CHUNK_SECONDS = 30
+
+# Audio windows decoded per forward pass by the ASR pipeline
+PIPELINE_BATCH_SIZE = 24
+
+# Whisper log-Mel dynamic range (log10 units) and output scaling
+LOG_MEL_DYNAMIC_RANGE = 8.0
+LOG_MEL_OFFSET = 4.0
+
+# Silent samples (0.1 s at 16 kHz) decoded by the health check
+HEALTH_CHECK_SAMPLES = 1600
+
+# Weight quantization modes for the transformers backend
+QUANTIZATION_MODES = ("none", "hqq-4bit", "int8")
+
+# HQQ quantization group size (weights per scale/zero pair)
+HQQ_GROUP_SIZE = 64
+
+# Worker threads for CPU-side audio preparation (resampling, normalization)
+CPU_EXECUTOR_WORKERS = min(4, os.cpu_count() or 1)
+
+# Languages offered to callers and scored by language detection
+SUPPORTED_LANGUAGES = (
+    "en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh",
+    "ar", "hi", "tr", "pl", "nl", "sv", "da", "no", "fi"
+)
+
+# Supported inference backends
+TRANSFORMERS_BACKEND = "transformers"
+FASTER_WHISPER_BACKEND = "faster_whisper"
+ONNXRUNTIME_BACKEND = "onnxruntime"
+
 
 class WhisperAdapter(VoiceInterfacePort):
     """
@@ -31,7 +92,10 @@ class WhisperAdapter(VoiceInterfacePort):
         self,
         model_name: str = "openai/whisper-small",
         device: str = "auto",
-        torch_dtype: str = "float16"
+        torch_dtype: str = "float16",
+        backend: str = TRANSFORMERS_BACKEND,
+        quantization: str = "none",
+        engine_path: Optional[str] = None
     ):
         """
         Initialize Whisper adapter.
@@ -40,25 +104,65 @@ class WhisperAdapter(VoiceInterfacePort):
             model_name: Whisper model name from Hugging Face
             device: Device to run model on ("auto", "cpu", "cuda")
             torch_dtype: Torch data type for model
+            backend: "transformers" (PyTorch), "faster_whisper" (CTranslate2) or
+                "onnxruntime" (ONNX Runtime, TensorRT on NVIDIA GPUs)
+            quantization: Weight quantization for the transformers backend
+                ("none", "hqq-4bit", "int8"); faster-whisper always uses int8
+            engine_path: Directory with a Whisper ONNX export for the onnxruntime
+                backend (exported from model_name at load time when omitted);
+                TensorRT engines built from it are cached there
         """
-        if not WHISPER_AVAILABLE:
-            raise ImportError("Whisper dependencies not available. Install transformers.")
+        if backend == FASTER_WHISPER_BACKEND:
+            if not FASTER_WHISPER_AVAILABLE:
+                raise ImportError("faster-whisper backend not available. Install faster-whisper.")
+        elif backend == TRANSFORMERS_BACKEND:
+            if not WHISPER_AVAILABLE:
+                raise ImportError("Whisper dependencies not available. Install transformers.")
+        elif backend == ONNXRUNTIME_BACKEND:
+            if not (WHISPER_AVAILABLE and ONNXRUNTIME_AVAILABLE):
+                raise ImportError("ONNX Runtime backend not available. Install optimum[onnxruntime-gpu].")
+        else:
+            raise ValueError(f"Unsupported Whisper backend: {backend}")
+        
+        if quantization not in QUANTIZATION_MODES:
+            raise ValueError(f"Unsupported quantization: {quantization}")
         
+        self.backend = backend
+        self.quantization = quantization
         self.model_name = model_name
+        self.engine_path = Path(engine_path) if engine_path else None
+        self.logger = get_module_logger(__name__)
         self.device = self._resolve_device(device)
-        self.torch_dtype = getattr(torch, torch_dtype)
+        self.torch_dtype = self._pick_dtype(torch_dtype)
         
-        self.processor: Optional[WhisperProcessor] = None
-        self.model: Optional[WhisperForConditionalGeneration] = None
+        self.processor: Optional["WhisperProcessor"] = None
+        self.model: Optional[Any] = None
+        self._pipeline: Optional[Any] = None
+        self._health_input_features: Optional[torch.Tensor] = None
+        self._mel_filters: Optional[torch.Tensor] = None
+        self._stft_window: Optional[torch.Tensor] = None
+        self._language_codes: List[str] = []
+        self._language_token_ids: Optional[torch.Tensor] = None
+        self._start_token_ids: Optional[torch.Tensor] = None
+        self._pinned_waveforms: Optional[torch.Tensor] = None
+        self._copy_stream: Optional["torch.cuda.Stream"] = None
+        self._copy_done: Optional["torch.cuda.Event"] = None
+        self._staging_lock = threading.Lock()
         self._model_lock = asyncio.Lock()
         self._is_loaded = False
+        self._compiled_decoding = False
+        # Fused scaled_dot_product_attention avoids materializing attention matrices
+        self.attn_implementation = "sdpa"
         
-        self.logger = get_module_logger(__name__)
+        # Model calls queue on one thread (they serialize on the device anyway);
+        # audio preparation runs alongside them on a separate pool
+        self._gpu_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper-gpu")
+        self._cpu_executor = ThreadPoolExecutor(max_workers=CPU_EXECUTOR_WORKERS, thread_name_prefix="whisper-cpu")
         
         # Configuration
         self.sample_rate = 16000
         self.min_audio_length = 0.1  # 100ms minimum
-        self.max_audio_length = 30.0  # 30 seconds maximum
+        self.max_audio_length = 600.0  # 10 minutes maximum, decoded in 30 s chunks
         self.quality_threshold = 0.01  # RMS amplitude threshold
     
     def _resolve_device(self, device: str) -> str:
@@ -67,6 +171,35 @@ class WhisperAdapter(VoiceInterfacePort):
             return "cuda" if torch.cuda.is_available() else "cpu"
         return device
     
+    def _pick_dtype(self, torch_dtype: str) -> torch.dtype:
+        """
+        Choose the model dtype for the resolved device and backend.
+        
+        A float16 request becomes bfloat16 on GPUs that support it (Ampere
+        and newer): same Tensor Core throughput, but fp32's exponent range,
+        so long-context logits cannot overflow. On CPU it becomes float32,
+        since CPUs have no fast fp16 matmul (on Arm, fp32 can use oneDNN BF16
+        fast-math when DNNL_DEFAULT_FPMATH_MODE=BF16 is set at launch).
+        """
+        dtype = getattr(torch, torch_dtype)
+        
+        if self.backend == ONNXRUNTIME_BACKEND:
+            # ONNX exports take float32 features; TensorRT lowers to fp16 internally
+            return torch.float32
+        
+        if dtype != torch.float16:
+            return dtype
+        
+        if self.device.startswith("cuda") and torch.cuda.is_bf16_supported():
+            self.logger.info("GPU supports bfloat16, loading Whisper in bfloat16 instead of float16")
+            return torch.bfloat16
+        
+        if self.device == "cpu":
+            self.logger.warning("float16 is slow on CPU, loading Whisper in float32")
+            return torch.float32
+        
+        return dtype
+    
     async def _ensure_model_loaded(self) -> None:
         """Ensure Whisper model is loaded (thread-safe)."""
         if self._is_loaded:
@@ -80,21 +213,28 @@ class WhisperAdapter(VoiceInterfacePort):
                 self.logger.info(f"Loading Whisper model: {self.model_name}")
                 
                 # Load processor and model in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
+                
+                if self.backend == FASTER_WHISPER_BACKEND:
+                    self.model = await loop.run_in_executor(self._gpu_executor, self._load_faster_whisper_model)
+                    self._is_loaded = True
+                    self.logger.info(f"Whisper model loaded successfully on {self.device} (faster-whisper)")
+                    return
                 
                 self.processor = await loop.run_in_executor(
-                    None,
+                    self._cpu_executor,
                     lambda: WhisperProcessor.from_pretrained(self.model_name)
                 )
                 
-                self.model = await loop.run_in_executor(
-                    None,
-                    lambda: WhisperForConditionalGeneration.from_pretrained(
-                        self.model_name,
-                        torch_dtype=self.torch_dtype,
-                        low_cpu_mem_usage=True
-                    ).to(self.device)
+                load_model = (
+                    self._load_onnx_model if self.backend == ONNXRUNTIME_BACKEND else self._load_transformers_model
                 )
+                self.model = await loop.run_in_executor(self._gpu_executor, load_model)
+                
+                if self.backend == TRANSFORMERS_BACKEND and self.device.startswith("cuda"):
+                    await loop.run_in_executor(self._gpu_executor, self._enable_compiled_decoding)
+                
+                await loop.run_in_executor(self._gpu_executor, self._prepare_inference)
                 
                 self._is_loaded = True
                 self.logger.info(f"Whisper model loaded successfully on {self.device}")
@@ -103,6 +243,173 @@ class WhisperAdapter(VoiceInterfacePort):
                 self.logger.error(f"Failed to load Whisper model: {e}")
                 raise VoiceProcessingError(f"Model loading failed: {e}") from e
     
+    def _prepare_inference(self) -> None:
+        """Build the ASR pipeline and device-resident feature tensors for the loaded model."""
+        pipeline_kwargs = {}
+        if not getattr(self.model, "hf_device_map", None):
+            # Quantized loads are placed by accelerate; the pipeline refuses to move them
+            pipeline_kwargs["device"] = self.device
+        
+        self._pipeline = pipeline(
+            "automatic-speech-recognition",
+            model=self.model,
+            tokenizer=self.processor.tokenizer,
+            feature_extractor=self.processor.feature_extractor,
+            torch_dtype=self.torch_dtype,
+            **pipeline_kwargs
+        )
+        
+        # Keep the STFT window and Whisper's Mel filterbank resident on the device
+        feature_extractor = self.processor.feature_extractor
+        self._mel_filters = torch.from_numpy(feature_extractor.mel_filters.T).to(self.device, torch.float32)
+        self._stft_window = torch.hann_window(feature_extractor.n_fft, device=self.device)
+        
+        self._build_language_detection_tokens()
+        
+        # Built once so health checks only run the decoder step
+        self._health_input_features = self._log_mel_features([np.zeros(HEALTH_CHECK_SAMPLES, dtype=np.float32)])
+    
+    def _build_language_detection_tokens(self) -> None:
+        """Look up the language tokens scored by language detection."""
+        tokenizer = self.processor.tokenizer
+        
+        language_tokens = {}
+        for language in SUPPORTED_LANGUAGES:
+            token_id = tokenizer.convert_tokens_to_ids(f"<|{language}|>")
+            if token_id is not None and token_id != tokenizer.unk_token_id:
+                language_tokens[language] = token_id
+        
+        self._language_codes = list(language_tokens)
+        self._language_token_ids = torch.tensor(list(language_tokens.values()), device=self.device)
+        self._start_token_ids = torch.tensor(
+            [[self.model.generation_config.decoder_start_token_id]], device=self.device
+        )
+    
+    def _load_transformers_model(self) -> "WhisperForConditionalGeneration":
+        """Load the PyTorch Whisper model with fused SDPA attention and optional quantization."""
+        load_kwargs = {
+            "torch_dtype": self.torch_dtype,
+            "low_cpu_mem_usage": True
+        }
+        
+        quantization_config = self._quantization_config()
+        if quantization_config is not None:
+            # Quantizers place weights themselves; .to() is not allowed afterwards
+            load_kwargs["quantization_config"] = quantization_config
+            load_kwargs["device_map"] = {"": self.device}
+        
+        try:
+            model = WhisperForConditionalGeneration.from_pretrained(
+                self.model_name,
+                attn_implementation=self.attn_implementation,
+                **load_kwargs
+            )
+        except (ValueError, ImportError) as e:
+            self.logger.warning(f"{self.attn_implementation} attention unavailable for {self.model_name}, using default: {e}")
+            self.attn_implementation = "eager"
+            model = WhisperForConditionalGeneration.from_pretrained(self.model_name, **load_kwargs)
+        
+        if quantization_config is not None:
+            return model
+        
+        return model.to(self.device)
+    
+    def _quantization_config(self) -> Optional[Any]:
+        """
+        Build the weight quantization config for the decoder-heavy Linear layers.
+        
+        Only nn.Linear weights are quantized; conv1/conv2 and layer norms keep
+        the model dtype. proj_out shares its weight with the token embedding
+        and is skipped.
+        """
+        if self.quantization == "hqq-4bit":
+            return HqqConfig(nbits=4, group_size=HQQ_GROUP_SIZE, skip_modules=["proj_out"])
+        
+        if self.quantization == "int8":
+            return BitsAndBytesConfig(load_in_8bit=True, llm_int8_skip_modules=["proj_out"])
+        
+        return None
+    
+    def _load_onnx_model(self) -> "ORTModelForSpeechSeq2Seq":
+        """
+        Load the Whisper ONNX export into ONNX Runtime.
+        
+        On CUDA the TensorRT execution provider is preferred when the
+        onnxruntime build ships it: TensorRT fuses attention and captures
+        fp16 kernels into an engine, which is built on first load and cached
+        next to the export. Otherwise the CUDA or CPU provider is used.
+        """
+        available_providers = onnxruntime.get_available_providers()
+        provider_options = None
+        
+        if self.device.startswith("cuda") and "TensorrtExecutionProvider" in available_providers:
+            provider = "TensorrtExecutionProvider"
+            provider_options = {"trt_fp16_enable": True}
+            if self.engine_path is not None:
+                provider_options["trt_engine_cache_enable"] = True
+                provider_options["trt_engine_cache_path"] = str(self.engine_path / "trt_cache")
+        elif self.device.startswith("cuda"):
+            provider = "CUDAExecutionProvider"
+        else:
+            provider = "CPUExecutionProvider"
+        
+        self.logger.info(f"Loading Whisper ONNX model with {provider}")
+        return ORTModelForSpeechSeq2Seq.from_pretrained(
+            str(self.engine_path) if self.engine_path is not None else self.model_name,
+            export=self.engine_path is None,
+            provider=provider,
+            provider_options=provider_options
+        )
+    
+    def _load_faster_whisper_model(self) -> "WhisperModel":
+        """Load the CTranslate2 Whisper model with int8 weights."""
+        # CTranslate2 uses size names ("small") or converted repos, not openai/* ids
+        model_name = self.model_name
+        if model_name.startswith("openai/whisper-"):
+            model_name = model_name[len("openai/whisper-"):]
+        
+        device = "cuda" if self.device.startswith("cuda") else "cpu"
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+        return WhisperModel(model_name, device=device, compute_type=compute_type)
+    
+    def _enable_compiled_decoding(self) -> None:
+        """
+        Decode with a static KV cache and a compiled forward pass (CUDA only).
+        
+        A static cache keeps every decode step at the same tensor shapes, so
+        torch.compile(mode="reduce-overhead") can capture the step once and
+        replay it per token. A dummy 30-second input triggers compilation
+        here rather than on the first request. Falls back to eager decoding
+        if compilation fails.
+        """
+        eager_forward = self.model.forward
+        generation_config = self.model.generation_config
+        previous_settings = (
+            generation_config.cache_implementation,
+            getattr(generation_config, "max_cache_len", None)
+        )
+        
+        try:
+            generation_config.cache_implementation = "static"
+            # Size the cache for the longest transcript so every call reuses one graph
+            generation_config.max_cache_len = WHISPER_MAX_TARGET_LENGTH
+            self.model.forward = torch.compile(eager_forward, mode="reduce-overhead", fullgraph=True)
+            
+            dummy_features = torch.zeros(
+                1, self.model.config.num_mel_bins, WHISPER_INPUT_FRAMES,
+                dtype=self.torch_dtype, device=self.device
+            )
+            with torch.no_grad():
+                self.model.generate(dummy_features, max_new_tokens=WARMUP_NEW_TOKENS, do_sample=False, num_beams=1)
+            
+            self._compiled_decoding = True
+            self.logger.info("Whisper compiled static-cache decoding enabled")
+            
+        except Exception as e:
+            self.model.forward = eager_forward
+            generation_config.cache_implementation, generation_config.max_cache_len = previous_settings
+            self.logger.warning(f"Whisper compilation failed, using eager decoding: {e}")
+    
     async def transcribe_audio(self, audio: AudioData) -> Optional[str]:
         """
         Transcribe audio to text using Whisper.
@@ -121,12 +428,12 @@ class WhisperAdapter(VoiceInterfacePort):
                 raise AudioQualityError("Audio validation failed")
             
             # Prepare audio for Whisper
-            audio_array = self._prepare_audio_for_whisper(audio)
+            loop = asyncio.get_running_loop()
+            audio_array = await loop.run_in_executor(self._cpu_executor, self._prepare_audio_for_whisper, audio)
             
             # Run transcription in thread pool
-            loop = asyncio.get_event_loop()
             transcription = await loop.run_in_executor(
-                None,
+                self._gpu_executor,
                 self._transcribe_sync,
                 audio_array
             )
@@ -142,6 +449,51 @@ class WhisperAdapter(VoiceInterfacePort):
             self.logger.error(f"Transcription failed: {e}")
             raise TranscriptionError(f"Whisper transcription failed: {e}") from e
     
+    async def transcribe_batch(self, audios: List[AudioData]) -> List[Optional[str]]:
+        """
+        Transcribe several audio clips with batched decoding.
+        
+        Clips are batched together (and clips longer than 30 seconds are split
+        into windows) so that one generate call covers many inputs.
+        
+        Args:
+            audios: AudioData objects to transcribe
+            
+        Returns:
+            Transcribed text per input, None for clips that failed validation
+            or produced no text
+        """
+        if not audios:
+            return []
+        
+        try:
+            await self._ensure_model_loaded()
+            
+            results: List[Optional[str]] = [None] * len(audios)
+            valid_indices = [i for i, audio in enumerate(audios) if self._validate_audio_for_transcription(audio)]
+            
+            loop = asyncio.get_running_loop()
+            audio_arrays = await asyncio.gather(*(
+                loop.run_in_executor(self._cpu_executor, self._prepare_audio_for_whisper, audios[i])
+                for i in valid_indices
+            ))
+            
+            if audio_arrays:
+                transcriptions = await loop.run_in_executor(
+                    self._gpu_executor,
+                    self._transcribe_batch_sync,
+                    audio_arrays
+                )
+                
+                for i, transcription in zip(valid_indices, transcriptions):
+                    results[i] = transcription.strip() or None
+            
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Batch transcription failed: {e}")
+            raise TranscriptionError(f"Whisper batch transcription failed: {e}") from e
+    
     def _validate_audio_for_transcription(self, audio: AudioData) -> bool:
         """Validate audio is suitable for transcription."""
         # Check duration
@@ -154,69 +506,160 @@ class WhisperAdapter(VoiceInterfacePort):
             return False
         
         # Check audio quality
-        if not audio.has_sufficient_volume(self.quality_threshold):
-            self.logger.warning(f"Audio volume too low: {audio.get_rms_amplitude()}")
+        rms = audio.get_rms_amplitude()
+        if rms < self.quality_threshold:
+            self.logger.warning(f"Audio volume too low: {rms}")
             return False
         
         return True
     
     def _prepare_audio_for_whisper(self, audio: AudioData) -> np.ndarray:
-        """Prepare audio data for Whisper processing."""
-        audio_array = audio.get_samples_as_numpy()
+        """
+        Prepare audio data for Whisper processing.
         
+        Integer PCM is scaled to [-1, 1]. Float input already in range is
+        passed through unscaled (without a copy when already float32); float
+        input peaking above 1.0 is scaled back to [-1, 1]. Whisper's log-Mel
+        floor (max - 8) is relative, but the absolute level still shifts
+        every feature, so out-of-range input must not reach the model.
+        """
         # Ensure correct sample rate
         if audio.sample_rate != self.sample_rate:
             # Resample if needed (requires librosa)
             try:
                 audio = audio.resample(self.sample_rate)
-                audio_array = audio.get_samples_as_numpy()
             except ImportError:
                 self.logger.warning(f"Cannot resample audio from {audio.sample_rate} to {self.sample_rate}")
         
-        # Ensure float32 and normalize
-        audio_array = audio_array.astype(np.float32)
+        audio_array = audio.get_samples_as_numpy()
         
-        # Normalize to [-1, 1] range
-        max_val = np.max(np.abs(audio_array))
-        if max_val > 0:
-            audio_array = audio_array / max_val
+        if audio_array.dtype.kind == "i":
+            return audio_array.astype(np.float32) / np.iinfo(audio_array.dtype).max
+        
+        audio_array = audio_array.astype(np.float32, copy=False)
+        peak = np.abs(audio_array).max(initial=0.0)
+        if peak > 1.0:
+            return audio_array / peak
         
         return audio_array
     
     def _transcribe_sync(self, audio_array: np.ndarray) -> str:
         """Synchronous transcription for thread pool execution."""
+        return self._transcribe_batch_sync([audio_array])[0]
+    
+    def _transcribe_batch_sync(self, audio_arrays: List[np.ndarray]) -> List[str]:
+        """Synchronous batched transcription for thread pool execution."""
+        if self.backend == FASTER_WHISPER_BACKEND:
+            try:
+                # CTranslate2 computes log-Mel features itself; segments decode lazily
+                transcriptions = []
+                for audio_array in audio_arrays:
+                    segments, _ = self.model.transcribe(audio_array, beam_size=1, vad_filter=False)
+                    transcriptions.append("".join(segment.text for segment in segments))
+                return transcriptions
+            except Exception as e:
+                raise TranscriptionError(f"Synchronous transcription failed: {e}") from e
+        
         try:
-            # Process audio
-            inputs = self.processor(
-                audio_array,
-                sampling_rate=self.sample_rate,
-                return_tensors="pt"
+            if all(len(audio_array) <= self.processor.feature_extractor.n_samples for audio_array in audio_arrays):
+                # Short-form: log-Mel on the model device, one generate call for the batch
+                with torch.no_grad():
+                    predicted_ids = self.model.generate(
+                        self._log_mel_features(audio_arrays),
+                        do_sample=False,
+                        num_beams=1
+                    )
+                
+                return self.processor.batch_decode(predicted_ids, skip_special_tokens=True)
+            
+            # The pipeline splits audio into 30 s windows and batches them across inputs
+            outputs = self._pipeline(
+                audio_arrays,
+                chunk_length_s=LONG_FORM_CHUNK_SECONDS,
+                batch_size=PIPELINE_BATCH_SIZE,
+                return_timestamps=False,
+                generate_kwargs={"do_sample": False, "num_beams": 1}
             )
             
-            # Move inputs to device
-            input_features = inputs["input_features"].to(self.device)
+            return [output["text"] for output in outputs]
             
-            # Generate transcription
-            with torch.no_grad():
-                predicted_ids = self.model.generate(
-                    input_features,
-                    max_new_tokens=448,  # Whisper's max length
-                    do_sample=False,
-                    num_beams=1,
-                    return_dict_in_generate=True,
-                    output_scores=True
-                )
+        except Exception as e:
+            raise TranscriptionError(f"Synchronous transcription failed: {e}") from e
+    
+    def _log_mel_features(self, audio_arrays: List[np.ndarray]) -> torch.Tensor:
+        """
+        Compute Whisper log-Mel input features on the model device.
+        
+        Mirrors WhisperFeatureExtractor: zero-pad each clip to 30 seconds,
+        power STFT, Mel projection, log10 clamped to 8 below the per-clip
+        peak, then rescaled. Only the raw samples cross to the device.
+        
+        Args:
+            audio_arrays: 16 kHz float32 clips of at most 30 seconds
             
-            # Decode transcription
-            transcription = self.processor.batch_decode(
-                predicted_ids.sequences,
-                skip_special_tokens=True
-            )[0]
+        Returns:
+            Input features of shape [batch, num_mel_bins, 3000] in the model dtype
+        """
+        feature_extractor = self.processor.feature_extractor
+        
+        if self.device.startswith("cuda"):
+            waveforms = self._upload_waveforms(audio_arrays, feature_extractor.n_samples)
+        else:
+            waveforms = torch.zeros(len(audio_arrays), feature_extractor.n_samples, device=self.device)
+            for row, audio_array in zip(waveforms, audio_arrays):
+                row[:len(audio_array)] = torch.from_numpy(audio_array).to(self.device)
+        
+        stft = torch.stft(
+            waveforms,
+            feature_extractor.n_fft,
+            feature_extractor.hop_length,
+            window=self._stft_window,
+            return_complex=True
+        )
+        magnitudes = stft[..., :-1].abs().pow_(2)
+        
+        log_spec = torch.matmul(self._mel_filters, magnitudes).clamp_(min=1e-10).log10_()
+        peak = log_spec.amax(dim=(1, 2), keepdim=True)
+        log_spec = torch.maximum(log_spec, peak - LOG_MEL_DYNAMIC_RANGE)
+        log_spec.add_(LOG_MEL_OFFSET).div_(LOG_MEL_OFFSET)
+        
+        return log_spec.to(self.torch_dtype)
+    
+    def _upload_waveforms(self, audio_arrays: List[np.ndarray], n_samples: int) -> torch.Tensor:
+        """
+        Copy zero-padded clips to the GPU through a pinned staging buffer.
+        
+        The host-to-device copy runs as DMA on a side stream; the compute
+        stream waits on it instead of the calling thread. The staging buffer
+        grows to the largest batch seen and is reused once its last copy has
+        completed.
+        """
+        with self._staging_lock:
+            if self._copy_done is not None:
+                # The previous upload may still be reading the buffer
+                self._copy_done.synchronize()
             
-            return transcription
+            if self._pinned_waveforms is None or self._pinned_waveforms.shape[0] < len(audio_arrays):
+                self._pinned_waveforms = torch.empty(len(audio_arrays), n_samples, pin_memory=True)
+                self._copy_stream = torch.cuda.Stream(device=self.device)
+                self._copy_done = torch.cuda.Event()
             
-        except Exception as e:
-            raise TranscriptionError(f"Synchronous transcription failed: {e}") from e
+            staging = self._pinned_waveforms[:len(audio_arrays)]
+            for row, audio_array in zip(staging, audio_arrays):
+                row[:len(audio_array)] = torch.from_numpy(audio_array)
+                row[len(audio_array):] = 0.0
+            
+            compute_stream = torch.cuda.current_stream(self.device)
+            self._copy_stream.wait_stream(compute_stream)
+            with torch.cuda.stream(self._copy_stream):
+                waveforms = staging.to(self.device, non_blocking=True)
+                self._copy_done.record()
+            
+            compute_stream.wait_stream(self._copy_stream)
+            # Allocated on the copy stream but consumed on the compute stream
+            waveforms.record_stream(compute_stream)
+            
+            return waveforms
     
     async def synthesize_speech(self, text: str, voice_config: Optional[Dict[str, Any]] = None) -> Optional[AudioData]:
         """Not implemented in Whisper adapter (ASR only)."""
@@ -244,11 +687,8 @@ class WhisperAdapter(VoiceInterfacePort):
     
     async def get_supported_languages(self) -> List[str]:
         """Get list of supported languages for Whisper."""
-        # Whisper supports many languages
-        return [
-            "en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh",
-            "ar", "hi", "tr", "pl", "nl", "sv", "da", "no", "fi"
-        ]
+        # The port returns a list; copy so callers cannot affect the shared constant
+        return list(SUPPORTED_LANGUAGES)
     
     async def detect_language(self, audio: AudioData) -> Optional[str]:
         """
@@ -264,12 +704,12 @@ class WhisperAdapter(VoiceInterfacePort):
             await self._ensure_model_loaded()
             
             # Prepare audio
-            audio_array = self._prepare_audio_for_whisper(audio)
+            loop = asyncio.get_running_loop()
+            audio_array = await loop.run_in_executor(self._cpu_executor, self._prepare_audio_for_whisper, audio)
             
             # Run language detection in thread pool
-            loop = asyncio.get_event_loop()
             language = await loop.run_in_executor(
-                None,
+                self._gpu_executor,
                 self._detect_language_sync,
                 audio_array
             )
@@ -282,28 +722,42 @@ class WhisperAdapter(VoiceInterfacePort):
     
     def _detect_language_sync(self, audio_array: np.ndarray) -> Optional[str]:
         """Synchronous language detection."""
+        if self.backend == FASTER_WHISPER_BACKEND:
+            try:
+                # Language is detected eagerly; leaving the segments unconsumed skips decoding
+                _, info = self.model.transcribe(audio_array, beam_size=1, vad_filter=False)
+                return info.language
+            except Exception as e:
+                self.logger.error(f"Language detection sync failed: {e}")
+                return None
+        
+        if not self._language_codes:
+            return None
+        
         try:
-            # Process audio
-            inputs = self.processor(
-                audio_array,
-                sampling_rate=self.sample_rate,
-                return_tensors="pt"
-            )
+            # Whisper predicts the language as the first token after <|startoftranscript|>;
+            # the first 30 s window is enough to decide it
+            n_samples = self.processor.feature_extractor.n_samples
+            input_features = self._log_mel_features([audio_array[:n_samples]])
             
-            input_features = inputs["input_features"].to(self.device)
+            if self.backend == ONNXRUNTIME_BACKEND:
+                # ONNX sessions only expose the full forward pass
+                logits = self.model(input_features=input_features, decoder_input_ids=self._start_token_ids).logits
+                language_logits = logits[0, -1, self._language_token_ids]
+                return self._language_codes[int(language_logits.argmax())]
             
-            # Generate with language detection
             with torch.no_grad():
-                predicted_ids = self.model.generate(
-                    input_features,
-                    max_new_tokens=1,
-                    return_dict_in_generate=True,
-                    output_scores=True
-                )
+                encoder_states = self.model.model.encoder(input_features).last_hidden_state
+                decoder_state = self.model.model.decoder(
+                    input_ids=self._start_token_ids,
+                    encoder_hidden_states=encoder_states
+                ).last_hidden_state[0, -1]
+                
+                # Project onto the language-token rows only instead of the full vocabulary
+                language_weights = self.model.proj_out.weight[self._language_token_ids]
+                language_logits = language_weights @ decoder_state
             
-            # Extract language token (this is a simplified approach)
-            # In practice, you'd need to decode the language token properly
-            return "en"  # Default to English for now
+            return self._language_codes[int(language_logits.argmax())]
             
         except Exception as e:
             self.logger.error(f"Language detection sync failed: {e}")
@@ -370,19 +824,24 @@ class WhisperAdapter(VoiceInterfacePort):
         status = {
             "service": "whisper_asr",
             "model": self.model_name,
+            "backend": self.backend,
+            "quantization": self.quantization,
             "device": self.device,
             "is_loaded": self._is_loaded,
-            "available": WHISPER_AVAILABLE
+            "compiled_decoding": self._compiled_decoding,
+            "attn_implementation": self.attn_implementation,
+            "available": {
+                TRANSFORMERS_BACKEND: WHISPER_AVAILABLE,
+                FASTER_WHISPER_BACKEND: FASTER_WHISPER_AVAILABLE,
+                ONNXRUNTIME_BACKEND: WHISPER_AVAILABLE and ONNXRUNTIME_AVAILABLE
+            }[self.backend]
         }
         
         if self._is_loaded and self.model:
             try:
-                # Test with dummy data
-                dummy_audio = np.zeros(1600, dtype=np.float32)  # 0.1 second of silence
-                inputs = self.processor(dummy_audio, sampling_rate=self.sample_rate, return_tensors="pt")
-                
-                with torch.no_grad():
-                    _ = self.model.generate(inputs["input_features"].to(self.device), max_new_tokens=1)
+                # Queued behind inference on the model's own executor
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._gpu_executor, self._health_check_sync)
                 
                 status["status"] = "healthy"
                 status["last_check"] = "success"
@@ -394,3 +853,20 @@ class WhisperAdapter(VoiceInterfacePort):
             status["status"] = "not_loaded"
         
         return status
+    
+    def _health_check_sync(self) -> None:
+        """Run a minimal decode on dummy data."""
+        if self.backend == FASTER_WHISPER_BACKEND:
+            dummy_audio = np.zeros(HEALTH_CHECK_SAMPLES, dtype=np.float32)
+            segments, _ = self.model.transcribe(dummy_audio, beam_size=1)
+            list(segments)
+            return
+        
+        with torch.no_grad():
+            self.model.generate(self._health_input_features, max_new_tokens=1)
+    
+    async def close(self) -> None:
+        """Release the inference and audio preparation executors."""
+        self._gpu_executor.shutdown(wait=False)
+        self._cpu_executor.shutdown(wait=False)
+        self.logger.info("Whisper adapter closed")
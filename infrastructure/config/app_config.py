@@ -1,10 +1,26 @@
 """Application configuration management."""
 
 import os
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from dataclasses import asdict, dataclass, field, fields
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+
+# Default models directory (the standard Hugging Face cache location), resolved
+# once instead of per AppConfig instance; HF_HOME deliberately does not move it
+DEFAULT_MODELS_DIR = Path.home() / ".cache" / "huggingface"
+
+
+def _serializable_dict(items: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """Build a dict for asdict(), storing paths as strings for YAML output."""
+    return {key: str(value) if isinstance(value, Path) else value for key, value in items}
+
 
 @dataclass
 class VoiceConfig:
@@ -17,7 +33,7 @@ class VoiceConfig:
     voice_speed: float = 1.0
     voice_pitch: float = 1.0
     enable_audio_save: bool = True
-    audio_output_dir: str = "audio_outputs"
+    audio_output_dir: Path = field(default_factory=lambda: Path("audio_outputs"))
     max_recording_duration: int = 30
     audio_quality_threshold: float = 0.02
 
@@ -108,50 +124,31 @@ class AppConfig:
     # Paths
     data_dir: Path = field(default_factory=lambda: Path("data"))
     logs_dir: Path = field(default_factory=lambda: Path("logs"))
-    models_dir: Path = field(default_factory=lambda: Path.home() / ".cache" / "huggingface")
+    models_dir: Path = field(default_factory=lambda: DEFAULT_MODELS_DIR)
     
     @classmethod
     def from_env(cls) -> "AppConfig":
         """Create configuration from environment variables."""
         config = cls()
+        env = os.environ
         
-        # Override with environment variables
-        config.environment = os.getenv("ENVIRONMENT", config.environment)
-        config.debug = os.getenv("DEBUG", str(config.debug)).lower() == "true"
-        config.host = os.getenv("HOST", config.host)
-        config.port = int(os.getenv("PORT", str(config.port)))
-        config.workers = int(os.getenv("WORKERS", str(config.workers)))
-        
-        # Voice configuration from environment
-        config.voice.tts_model = os.getenv("TTS_MODEL", config.voice.tts_model)
-        config.voice.asr_model = os.getenv("ASR_MODEL", config.voice.asr_model)
-        config.voice.sample_rate = int(os.getenv("SAMPLE_RATE", str(config.voice.sample_rate)))
-        config.voice.device = os.getenv("VOICE_DEVICE", config.voice.device)
-        
-        # Medical configuration from environment
-        config.medical.reasoning_model = os.getenv("MEDICAL_MODEL", config.medical.reasoning_model)
-        config.medical.max_new_tokens = int(os.getenv("MAX_NEW_TOKENS", str(config.medical.max_new_tokens)))
-        config.medical.temperature = float(os.getenv("TEMPERATURE", str(config.medical.temperature)))
-        
-        # Database configuration from environment
-        config.database.url = os.getenv("DATABASE_URL", config.database.url)
-        config.database.echo = os.getenv("DATABASE_ECHO", str(config.database.echo)).lower() == "true"
-        
-        # Cache configuration from environment
-        config.cache.enabled = os.getenv("CACHE_ENABLED", str(config.cache.enabled)).lower() == "true"
-        config.cache.backend = os.getenv("CACHE_BACKEND", config.cache.backend)
-        config.cache.redis_url = os.getenv("REDIS_URL", config.cache.redis_url)
-        
-        # Security configuration from environment
-        config.security.jwt_secret_key = os.getenv("JWT_SECRET_KEY", config.security.jwt_secret_key)
-        config.security.enable_authentication = os.getenv("ENABLE_AUTH", str(config.security.enable_authentication)).lower() == "true"
+        # Override with environment variables, converted to each field's type
+        for (section, field_name), env_key in _ENV_MAP.items():
+            raw_value = env.get(env_key)
+            if raw_value is None:
+                continue
+            
+            target = getattr(config, section) if section else config
+            coerce = _ENV_COERCE.get(type(getattr(target, field_name)), str)
+            setattr(target, field_name, coerce(raw_value))
         
         return config
     
     @classmethod
     def from_file(cls, config_path: Path) -> "AppConfig":
         """Load configuration from YAML file."""
-        import yaml
+        if not YAML_AVAILABLE:
+            raise ImportError("pyyaml is required to load configuration files")
         
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
@@ -162,120 +159,53 @@ class AppConfig:
         return cls.from_dict(config_data)
     
     @classmethod
-    def from_dict(cls, config_dict: Dict[str, Any]) -> "AppConfig":
-        """Create configuration from dictionary."""
+    def from_dict(cls, config_dict: Dict[str, Any], strict: bool = False) -> "AppConfig":
+        """
+        Create configuration from dictionary.
+        
+        Args:
+            config_dict: Top-level settings and per-section dictionaries
+            strict: Raise ValueError on unknown keys instead of ignoring them
+            
+        Returns:
+            Configuration with the given values applied over the defaults
+        """
         config = cls()
+        unknown_keys = []
         
-        # Update basic settings
         for key, value in config_dict.items():
-            if hasattr(config, key) and not isinstance(getattr(config, key), (VoiceConfig, MedicalConfig, DatabaseConfig, CacheConfig, SecurityConfig, MonitoringConfig)):
+            if key in _SECTION_TYPES:
+                # Update component configuration
+                section = getattr(config, key)
+                valid_fields = _VALID_FIELDS[_SECTION_TYPES[key]]
+                for section_key, section_value in value.items():
+                    if section_key in valid_fields:
+                        if isinstance(getattr(section, section_key), Path):
+                            section_value = Path(section_value)
+                        setattr(section, section_key, section_value)
+                    else:
+                        unknown_keys.append(f"{key}.{section_key}")
+            elif key in _VALID_FIELDS[AppConfig]:
+                # to_dict() stores paths as strings
+                if isinstance(getattr(config, key), Path):
+                    value = Path(value)
                 setattr(config, key, value)
+            else:
+                unknown_keys.append(key)
         
-        # Update component configurations
-        if "voice" in config_dict:
-            for key, value in config_dict["voice"].items():
-                if hasattr(config.voice, key):
-                    setattr(config.voice, key, value)
-        
-        if "medical" in config_dict:
-            for key, value in config_dict["medical"].items():
-                if hasattr(config.medical, key):
-                    setattr(config.medical, key, value)
-        
-        if "database" in config_dict:
-            for key, value in config_dict["database"].items():
-                if hasattr(config.database, key):
-                    setattr(config.database, key, value)
-        
-        if "cache" in config_dict:
-            for key, value in config_dict["cache"].items():
-                if hasattr(config.cache, key):
-                    setattr(config.cache, key, value)
-        
-        if "security" in config_dict:
-            for key, value in config_dict["security"].items():
-                if hasattr(config.security, key):
-                    setattr(config.security, key, value)
-        
-        if "monitoring" in config_dict:
-            for key, value in config_dict["monitoring"].items():
-                if hasattr(config.monitoring, key):
-                    setattr(config.monitoring, key, value)
+        if strict and unknown_keys:
+            raise ValueError(f"Unknown configuration keys: {', '.join(unknown_keys)}")
         
         return config
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
-        return {
-            "environment": self.environment,
-            "debug": self.debug,
-            "app_name": self.app_name,
-            "app_version": self.app_version,
-            "host": self.host,
-            "port": self.port,
-            "workers": self.workers,
-            "voice": {
-                "tts_model": self.voice.tts_model,
-                "asr_model": self.voice.asr_model,
-                "sample_rate": self.voice.sample_rate,
-                "device": self.voice.device,
-                "voice_speed": self.voice.voice_speed,
-                "voice_pitch": self.voice.voice_pitch,
-                "enable_audio_save": self.voice.enable_audio_save,
-                "audio_output_dir": self.voice.audio_output_dir,
-                "max_recording_duration": self.voice.max_recording_duration,
-                "audio_quality_threshold": self.voice.audio_quality_threshold
-            },
-            "medical": {
-                "reasoning_model": self.medical.reasoning_model,
-                "reasoning_model_large": self.medical.reasoning_model_large,
-                "ner_model": self.medical.ner_model,
-                "vision_model": self.medical.vision_model,
-                "max_new_tokens": self.medical.max_new_tokens,
-                "do_sample": self.medical.do_sample,
-                "temperature": self.medical.temperature,
-                "top_p": self.medical.top_p,
-                "device_map": self.medical.device_map,
-                "torch_dtype": self.medical.torch_dtype,
-                "low_cpu_mem_usage": self.medical.low_cpu_mem_usage
-            },
-            "database": {
-                "url": self.database.url,
-                "echo": self.database.echo,
-                "pool_size": self.database.pool_size,
-                "max_overflow": self.database.max_overflow,
-                "pool_timeout": self.database.pool_timeout,
-                "pool_recycle": self.database.pool_recycle
-            },
-            "cache": {
-                "enabled": self.cache.enabled,
-                "backend": self.cache.backend,
-                "default_timeout": self.cache.default_timeout,
-                "max_entries": self.cache.max_entries,
-                "redis_url": self.cache.redis_url
-            },
-            "security": {
-                "enable_cors": self.security.enable_cors,
-                "cors_origins": self.security.cors_origins,
-                "enable_rate_limiting": self.security.enable_rate_limiting,
-                "rate_limit_per_minute": self.security.rate_limit_per_minute,
-                "enable_authentication": self.security.enable_authentication,
-                "jwt_secret_key": self.security.jwt_secret_key,
-                "jwt_expiration_hours": self.security.jwt_expiration_hours
-            },
-            "monitoring": {
-                "enable_metrics": self.monitoring.enable_metrics,
-                "enable_tracing": self.monitoring.enable_tracing,
-                "metrics_port": self.monitoring.metrics_port,
-                "health_check_interval": self.monitoring.health_check_interval,
-                "performance_monitoring": self.monitoring.performance_monitoring,
-                "error_tracking": self.monitoring.error_tracking
-            }
-        }
+        return asdict(self, dict_factory=_serializable_dict)
     
     def save_to_file(self, config_path: Path) -> None:
         """Save configuration to YAML file."""
-        import yaml
+        if not YAML_AVAILABLE:
+            raise ImportError("pyyaml is required to save configuration files")
         
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
@@ -317,3 +247,51 @@ class AppConfig:
     def is_testing(self) -> bool:
         """Check if running in testing environment."""
         return self.environment.lower() == "testing"
+
+
+# AppConfig fields holding a component configuration, by section name
+_SECTION_TYPES = {
+    "voice": VoiceConfig,
+    "medical": MedicalConfig,
+    "database": DatabaseConfig,
+    "cache": CacheConfig,
+    "security": SecurityConfig,
+    "monitoring": MonitoringConfig
+}
+
+# Field names per configuration dataclass, for set-membership checks in from_dict
+_VALID_FIELDS = {
+    config_class: frozenset(f.name for f in fields(config_class))
+    for config_class in (AppConfig, *_SECTION_TYPES.values())
+}
+
+# Environment variable per (section, field); section None is a top-level AppConfig field
+_ENV_MAP = {
+    (None, "environment"): "ENVIRONMENT",
+    (None, "debug"): "DEBUG",
+    (None, "host"): "HOST",
+    (None, "port"): "PORT",
+    (None, "workers"): "WORKERS",
+    ("voice", "tts_model"): "TTS_MODEL",
+    ("voice", "asr_model"): "ASR_MODEL",
+    ("voice", "sample_rate"): "SAMPLE_RATE",
+    ("voice", "device"): "VOICE_DEVICE",
+    ("medical", "reasoning_model"): "MEDICAL_MODEL",
+    ("medical", "max_new_tokens"): "MAX_NEW_TOKENS",
+    ("medical", "temperature"): "TEMPERATURE",
+    ("database", "url"): "DATABASE_URL",
+    ("database", "echo"): "DATABASE_ECHO",
+    ("cache", "enabled"): "CACHE_ENABLED",
+    ("cache", "backend"): "CACHE_BACKEND",
+    ("cache", "redis_url"): "REDIS_URL",
+    ("security", "jwt_secret_key"): "JWT_SECRET_KEY",
+    ("security", "enable_authentication"): "ENABLE_AUTH"
+}
+
+# Conversion from an environment string by the field's default value type
+_ENV_COERCE = {
+    bool: lambda value: value.lower() == "true",
+    int: int,
+    float: float,
+    str: str
+}
@@ -1,23 +1,49 @@
 """Dependency injection container for the medical research application."""
 
-from typing import Optional
+from __future__ import annotations
+
+from functools import cached_property
+from types import SimpleNamespace
+from typing import Optional, TYPE_CHECKING
 from pathlib import Path
+import asyncio
+import gc
+import inspect
 import os
+import sys
+import threading
 
 
 # Note: dependency-injector will be installed as part of requirements
 # For now, we'll create a simple manual DI container
 from .app_config import AppConfig
 from ..logging.logger_factory import LoggerFactory, initialize_logging
-from ..logging.log_config import LogConfig
-from ..adapters.whisper_adapter import WhisperAdapter
-from ..adapters.speecht5_adapter import SpeechT5Adapter
-from ..adapters.meerkat_adapter import MeerkatAdapter
-from ..adapters.filesystem_audio_repository import FileSystemAudioRepository
-from ..adapters.composite_voice_interface import CompositeVoiceInterface
-from ..adapters.mock_adapters import MockVoiceAdapter, MockMedicalAdapter
-from application.use_cases.voice_consultation_use_case import VoiceConsultationUseCase
-from application.use_cases.medical_analysis_use_case import MedicalAnalysisUseCase
+from ..logging.log_config import LogConfig, LOG_CONFIG_BUILDERS
+
+if TYPE_CHECKING:
+    # Adapters pull in torch/transformers; they are imported where they are built
+    from ..adapters.whisper_adapter import WhisperAdapter
+    from ..adapters.speecht5_adapter import SpeechT5Adapter
+    from ..adapters.meerkat_adapter import MeerkatAdapter
+    from ..adapters.filesystem_audio_repository import FileSystemAudioRepository
+    from ..adapters.composite_voice_interface import CompositeVoiceInterface
+    from application.use_cases.voice_consultation_use_case import VoiceConsultationUseCase
+    from application.use_cases.medical_analysis_use_case import MedicalAnalysisUseCase
+
+
+# Dependencies built lazily by cached properties and dropped on shutdown
+_CACHED_DEPENDENCIES = (
+    "whisper_adapter",
+    "speecht5_adapter",
+    "meerkat_adapter",
+    "audio_repository",
+    "voice_interface",
+    "medical_analysis_use_case",
+    "voice_consultation_use_case",
+)
+
+# Directories already created by a container in this process
+_CREATED_DIRECTORIES: set[Path] = set()
 
 
 class ApplicationContainer:
@@ -28,6 +54,9 @@ class ApplicationContainer:
     ensuring proper initialization order and configuration.
     """
 
+    # Fixed state lives in slots; __dict__ only holds cached_property results
+    __slots__ = ("_config", "_logger_factory", "_env", "_initialized", "__dict__")
+
     def __init__(self, config: Optional[AppConfig] = None):
         """
         Initialize the application container.
@@ -37,19 +66,9 @@ class ApplicationContainer:
         """
         self._config = config or AppConfig.from_env()
         self._logger_factory: Optional[LoggerFactory] = None
+        self._env: Optional[SimpleNamespace] = None
         self._initialized = False
 
-        # Infrastructure adapters
-        self._whisper_adapter: Optional[WhisperAdapter] = None
-        self._speecht5_adapter: Optional[SpeechT5Adapter] = None
-        self._meerkat_adapter: Optional[MeerkatAdapter] = None
-        self._audio_repository: Optional[FileSystemAudioRepository] = None
-        self._voice_interface: Optional[CompositeVoiceInterface] = None
-
-        # Use cases
-        self._medical_analysis_use_case: Optional[MedicalAnalysisUseCase] = None
-        self._voice_consultation_use_case: Optional[VoiceConsultationUseCase] = None
-
     def initialize(self) -> None:
         """Initialize all container dependencies."""
         if self._initialized:
@@ -60,6 +79,9 @@ class ApplicationContainer:
         if errors:
             raise ValueError(f"Invalid configuration: {errors}")
 
+        # Read adapter settings from the environment once
+        self._env = self._snapshot_env()
+
         # Initialize logging
         self._setup_logging()
 
@@ -68,6 +90,35 @@ class ApplicationContainer:
 
         self._initialized = True
 
+    def _snapshot_env(self) -> SimpleNamespace:
+        """Read adapter environment overrides into typed fields, falling back to config."""
+        env = os.environ
+        config = self._config
+        is_testing = str(config.environment).lower() == "testing"
+        use_mock_adapters = env.get("USE_MOCK_ADAPTERS", "false").lower() == "true"
+
+        return SimpleNamespace(
+            use_mocks=is_testing or use_mock_adapters,
+            torch_dtype=env.get("FORCE_TORCH_DTYPE", config.medical.torch_dtype),
+            voice_device=env.get("VOICE_DEVICE", config.voice.device),
+            asr_model=env.get("ASR_MODEL", config.voice.asr_model),
+            asr_backend=env.get("ASR_BACKEND", "transformers"),
+            asr_quantization=env.get("ASR_QUANTIZATION", "none"),
+            asr_engine_path=env.get("ASR_ENGINE_PATH"),
+            tts_model=env.get("TTS_MODEL", config.voice.tts_model),
+            tts_vocoder=env.get("TTS_VOCODER", config.voice.tts_vocoder),
+            tts_isolate_process=env.get("TTS_ISOLATE_PROCESS", "false").lower() == "true",
+            tts_compile_model=env.get("TTS_COMPILE_MODEL", "false").lower() == "true",
+            tts_quantization=env.get("TTS_QUANTIZATION"),
+            tts_batch_size=int(env.get("TTS_BATCH_SIZE", "1")),
+            tts_batch_max_wait_ms=float(env.get("TTS_BATCH_MAX_WAIT_MS", "10")),
+            tts_enable_cache=env.get("TTS_ENABLE_CACHE", "true").lower() == "true",
+            medical_model=env.get("MEDICAL_MODEL", config.medical.reasoning_model),
+            medical_device=env.get("MEDICAL_DEVICE", "cpu"),
+            max_new_tokens=int(env.get("MAX_NEW_TOKENS", str(config.medical.max_new_tokens))),
+            medical_max_gpu_memory=env.get("MEDICAL_MAX_GPU_MEMORY")
+        )
+
     def _setup_logging(self) -> None:
         """Setup logging system."""
         log_config = self._create_log_config()
@@ -75,24 +126,27 @@ class ApplicationContainer:
 
     def _create_log_config(self) -> LogConfig:
         """Create logging configuration from app config."""
-        if self._config.is_production():
-            log_config = LogConfig.production()
+        environment = self._config.environment.lower()
+        log_config = LOG_CONFIG_BUILDERS.get(environment, LogConfig.development)()
+
+        if environment == "production":
             log_config.log_file = self._config.logs_dir / "medical_research.log"
-        elif self._config.is_testing():
-            log_config = LogConfig.testing()
-        else:
-            log_config = LogConfig.development()
 
         return log_config
 
     def _create_directories(self) -> None:
         """Create necessary directories."""
-        self._config.data_dir.mkdir(parents=True, exist_ok=True)
-        self._config.logs_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create voice output directory
-        voice_output_dir = Path(self._config.voice.audio_output_dir)
-        voice_output_dir.mkdir(parents=True, exist_ok=True)
+        directories = (
+            self._config.data_dir,
+            self._config.logs_dir,
+            self._config.voice.audio_output_dir
+        )
+
+        # Containers rebuilt after reset_container() skip directories already created
+        for directory in directories:
+            if directory not in _CREATED_DIRECTORIES:
+                directory.mkdir(parents=True, exist_ok=True)
+                _CREATED_DIRECTORIES.add(directory)
 
     @property
     def config(self) -> AppConfig:
@@ -114,144 +168,213 @@ class ApplicationContainer:
         """Get a logger instance."""
         return self.logger_factory.get_logger(name)
 
+    @cached_property
+    def whisper_adapter(self) -> WhisperAdapter:
+        """Whisper ASR adapter, created on first access."""
+        self.initialize()
+
+        env = self._env
+
+        if env.use_mocks:
+            from ..adapters.mock_adapters import MockVoiceAdapter
+            return MockVoiceAdapter()
+
+        from ..adapters.whisper_adapter import WhisperAdapter
+
+        return WhisperAdapter(
+            model_name=env.asr_model,
+            device=env.voice_device,
+            torch_dtype=env.torch_dtype,
+            backend=env.asr_backend,
+            quantization=env.asr_quantization,
+            engine_path=env.asr_engine_path
+        )
+
+    @cached_property
+    def speecht5_adapter(self) -> SpeechT5Adapter:
+        """SpeechT5 TTS adapter, created on first access."""
+        self.initialize()
+
+        env = self._env
+
+        if env.use_mocks:
+            # Reuse the mock voice adapter for TTS too
+            from ..adapters.mock_adapters import MockVoiceAdapter
+            return MockVoiceAdapter()
+
+        from ..adapters.speecht5_adapter import SpeechT5Adapter
+        from ..adapters.speecht5_worker import SpeechT5ProcessAdapter
+
+        # Optionally run TTS in a worker process so closing it frees all model memory
+        adapter_class = SpeechT5ProcessAdapter if env.tts_isolate_process else SpeechT5Adapter
+        return adapter_class(
+            model_name=env.tts_model,
+            vocoder_name=env.tts_vocoder,
+            device=env.voice_device,
+            torch_dtype=env.torch_dtype,
+            compile_model=env.tts_compile_model,
+            quantization=env.tts_quantization,
+            batch_size=env.tts_batch_size,
+            max_wait_ms=env.tts_batch_max_wait_ms,
+            enable_cache=env.tts_enable_cache
+        )
+
+    @cached_property
+    def meerkat_adapter(self) -> MeerkatAdapter:
+        """Meerkat medical AI adapter, created on first access."""
+        self.initialize()
+
+        env = self._env
+
+        if env.use_mocks:
+            from ..adapters.mock_adapters import MockMedicalAdapter
+            return MockMedicalAdapter()
+
+        from ..adapters.meerkat_adapter import MeerkatAdapter
+
+        return MeerkatAdapter(
+            model_name=env.medical_model,
+            device=env.medical_device,
+            torch_dtype=env.torch_dtype,
+            max_new_tokens=env.max_new_tokens,
+            max_gpu_memory=env.medical_max_gpu_memory
+        )
+
+    @cached_property
+    def audio_repository(self) -> FileSystemAudioRepository:
+        """Filesystem audio repository, created on first access."""
+        self.initialize()
+
+        from ..adapters.filesystem_audio_repository import FileSystemAudioRepository
+
+        audio_dir = self._config.data_dir / "audio"
+        return FileSystemAudioRepository(
+            base_path=audio_dir,
+            max_storage_gb=5.0,  # 5GB limit
+            auto_cleanup_days=30
+        )
+
+    @cached_property
+    def voice_interface(self) -> CompositeVoiceInterface:
+        """Composite voice interface, created on first access."""
+        from ..adapters.composite_voice_interface import CompositeVoiceInterface
+
+        return CompositeVoiceInterface(
+            asr_adapter=self.whisper_adapter,
+            tts_adapter=self.speecht5_adapter,
+            enable_resilience=True
+        )
+
+    @cached_property
+    def medical_analysis_use_case(self) -> MedicalAnalysisUseCase:
+        """Medical analysis use case, created on first access."""
+        from application.use_cases.medical_analysis_use_case import MedicalAnalysisUseCase
+
+        return MedicalAnalysisUseCase(self.meerkat_adapter)
+
+    @cached_property
+    def voice_consultation_use_case(self) -> VoiceConsultationUseCase:
+        """Voice consultation use case, created on first access."""
+        from application.use_cases.voice_consultation_use_case import VoiceConsultationUseCase
+
+        return VoiceConsultationUseCase(
+            voice_interface=self.voice_interface,
+            medical_analysis_use_case=self.medical_analysis_use_case,
+            audio_repository=self.audio_repository
+        )
+
     def get_whisper_adapter(self) -> WhisperAdapter:
         """Get Whisper ASR adapter."""
-        if not self._initialized:
-            self.initialize()
-
-        if self._whisper_adapter is None:
-            if str(self._config.environment).lower() == "testing" or str(os.getenv("USE_MOCK_ADAPTERS", "false")).lower() == "true":
-                self._whisper_adapter = MockVoiceAdapter()
-            else:
-                dtype_arg = os.getenv("FORCE_TORCH_DTYPE", self._config.medical.torch_dtype)
-                self._whisper_adapter = WhisperAdapter(
-                    model_name=os.getenv("ASR_MODEL", self._config.voice.asr_model),
-                    device=os.getenv("VOICE_DEVICE", self._config.voice.device),
-                    torch_dtype=dtype_arg
-                )
-
-        return self._whisper_adapter
+        return self.whisper_adapter
 
     def get_speecht5_adapter(self) -> SpeechT5Adapter:
         """Get SpeechT5 TTS adapter."""
-        if not self._initialized:
-            self.initialize()
-
-        if self._speecht5_adapter is None:
-            if str(self._config.environment).lower() == "testing" or str(os.getenv("USE_MOCK_ADAPTERS", "false")).lower() == "true":
-                # Reuse the mock voice adapter for TTS too
-                self._speecht5_adapter = MockVoiceAdapter()
-            else:
-                dtype_arg = os.getenv("FORCE_TORCH_DTYPE", self._config.medical.torch_dtype)
-                self._speecht5_adapter = SpeechT5Adapter(
-                    model_name=os.getenv("TTS_MODEL", self._config.voice.tts_model),
-                    vocoder_name=os.getenv("TTS_VOCODER", self._config.voice.tts_vocoder),
-                    device=os.getenv("VOICE_DEVICE", self._config.voice.device),
-                    torch_dtype=dtype_arg
-                )
-
-        return self._speecht5_adapter
+        return self.speecht5_adapter
 
     def get_meerkat_adapter(self) -> MeerkatAdapter:
         """Get Meerkat medical AI adapter."""
-        if not self._initialized:
-            self.initialize()
-
-        if self._meerkat_adapter is None:
-            if str(self._config.environment).lower() == "testing" and str(os.getenv("USE_MOCK_ADAPTERS", "false")).lower() == "true":
-                self._meerkat_adapter = MockMedicalAdapter()
-            else:
-                dtype_arg = os.getenv("FORCE_TORCH_DTYPE", self._config.medical.torch_dtype)
-                self._meerkat_adapter = MeerkatAdapter(
-                    model_name=os.getenv("MEDICAL_MODEL", self._config.medical.reasoning_model),
-                    device=os.getenv("MEDICAL_DEVICE", "cpu"),
-                    torch_dtype=dtype_arg,
-                    max_new_tokens=int(os.getenv("MAX_NEW_TOKENS", str(self._config.medical.max_new_tokens)))
-                )
-
-        return self._meerkat_adapter
+        return self.meerkat_adapter
 
     def get_audio_repository(self) -> FileSystemAudioRepository:
         """Get filesystem audio repository."""
-        if not self._initialized:
-            self.initialize()
-
-        if self._audio_repository is None:
-            audio_dir = self._config.data_dir / "audio"
-            self._audio_repository = FileSystemAudioRepository(
-                base_path=audio_dir,
-                max_storage_gb=5.0,  # 5GB limit
-                auto_cleanup_days=30
-            )
-
-        return self._audio_repository
+        return self.audio_repository
 
     def get_voice_interface(self) -> CompositeVoiceInterface:
         """Get composite voice interface."""
-        if not self._initialized:
-            self.initialize()
-
-        if self._voice_interface is None:
-            asr_adapter = self.get_whisper_adapter()
-            tts_adapter = self.get_speecht5_adapter()
-
-            self._voice_interface = CompositeVoiceInterface(
-                asr_adapter=asr_adapter,
-                tts_adapter=tts_adapter,
-                enable_resilience=True
-            )
-
-        return self._voice_interface
+        return self.voice_interface
 
     def get_medical_analysis_use_case(self) -> MedicalAnalysisUseCase:
         """Get medical analysis use case."""
-        if not self._initialized:
-            self.initialize()
-
-        if self._medical_analysis_use_case is None:
-            medical_adapter = self.get_meerkat_adapter()
-            self._medical_analysis_use_case = MedicalAnalysisUseCase(medical_adapter)
-
-        return self._medical_analysis_use_case
+        return self.medical_analysis_use_case
 
     def get_voice_consultation_use_case(self) -> VoiceConsultationUseCase:
         """Get voice consultation use case."""
-        if not self._initialized:
-            self.initialize()
-
-        if self._voice_consultation_use_case is None:
-            voice_interface = self.get_voice_interface()
-            medical_analysis = self.get_medical_analysis_use_case()
-            audio_repository = self.get_audio_repository()
+        return self.voice_consultation_use_case
 
-            self._voice_consultation_use_case = VoiceConsultationUseCase(
-                voice_interface=voice_interface,
-                medical_analysis_use_case=medical_analysis,
-                audio_repository=audio_repository
-            )
+    def shutdown(self) -> None:
+        """
+        Shutdown the container and clean up resources.
 
-        return self._voice_consultation_use_case
+        Async adapter closes are run to completion with asyncio.run(), so this
+        must not be called from a running event loop; use ashutdown() there.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("shutdown() called from a running event loop; await ashutdown() instead")
+
+        self._close_dependencies()
+        self._release_resources()
+
+    async def ashutdown(self) -> None:
+        """Shutdown the container from an event loop, awaiting async adapter closes."""
+        await self._aclose_dependencies()
+        self._release_resources()
+
+    def _close_dependencies(self) -> None:
+        """Clear all cached instances, closing those that hold executors or models."""
+        for close in self._pop_close_methods():
+            result = close()
+            if inspect.isawaitable(result):
+                asyncio.run(result)
+
+    async def _aclose_dependencies(self) -> None:
+        """Clear all cached instances, awaiting the close() of those that hold executors or models."""
+        for close in self._pop_close_methods():
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+
+    def _pop_close_methods(self) -> list:
+        """Remove the cached dependencies and return the close() methods they provide."""
+        dependencies = [self.__dict__.pop(name, None) for name in _CACHED_DEPENDENCIES]
+        return [
+            close for close in (getattr(dependency, "close", None) for dependency in dependencies)
+            if callable(close)
+        ]
+
+    def _release_resources(self) -> None:
+        """Release model memory and shut logging down once dependencies are closed."""
+        # Release model memory now rather than whenever the cycle collector runs
+        gc.collect()
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
 
-    def shutdown(self) -> None:
-        """Shutdown the container and clean up resources."""
         if self._logger_factory:
             self._logger_factory.shutdown()
 
-        # Clear all cached instances
-        self._whisper_adapter = None
-        self._speecht5_adapter = None
-        self._meerkat_adapter = None
-        self._audio_repository = None
-        self._voice_interface = None
-        self._medical_analysis_use_case = None
-        self._voice_consultation_use_case = None
-
         self._initialized = False
 
 
 # Global container instance
 _container: Optional[ApplicationContainer] = None
 
+# Serializes first-time container creation so models are only loaded once
+_container_lock = threading.Lock()
+
 
 def create_container(config: Optional[AppConfig] = None) -> ApplicationContainer:
     """
@@ -265,11 +388,16 @@ def create_container(config: Optional[AppConfig] = None) -> ApplicationContainer
     """
     global _container
 
-    if _container is None:
-        _container = ApplicationContainer(config)
-        _container.initialize()
+    container = _container
+    if container is None:
+        with _container_lock:
+            container = _container
+            if container is None:
+                container = ApplicationContainer(config)
+                container.initialize()
+                _container = container
 
-    return _container
+    return container
 
 
 def get_container() -> ApplicationContainer:
@@ -294,9 +422,10 @@ def reset_container() -> None:
     """Reset the global container (useful for testing)."""
     global _container
 
-    if _container:
-        _container.shutdown()
-        _container = None
+    with _container_lock:
+        if _container:
+            _container.shutdown()
+            _container = None
 
 
 # Convenience functions for dependency access
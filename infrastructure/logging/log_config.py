@@ -4,7 +4,7 @@ import logging
 import sys
 from pathlib import Path
 from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
 
 
@@ -24,7 +24,20 @@ class LogFormat(Enum):
     RICH = "rich"
 
 
-@dataclass
+# Standard library level for each application log level
+PYTHON_LOG_LEVELS: Dict[LogLevel, int] = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL
+}
+
+# dataclass(slots=True) needs Python 3.10+; plain dataclass on 3.9
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class LogConfig:
     """Configuration for logging system."""
     
@@ -80,51 +93,28 @@ class LogConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
-        return {
-            "level": self.level.value,
-            "format": self.format.value,
-            "log_file": str(self.log_file) if self.log_file else None,
-            "max_file_size_mb": self.max_file_size_mb,
-            "backup_count": self.backup_count,
-            "enable_console": self.enable_console,
-            "enable_file": self.enable_file,
-            "enable_structured": self.enable_structured,
-            "include_timestamp": self.include_timestamp,
-            "include_module": self.include_module,
-            "include_function": self.include_function,
-            "include_line_number": self.include_line_number,
-            "correlation_id_header": self.correlation_id_header
-        }
+        config_dict = {f.name: getattr(self, f.name) for f in fields(self)}
+        config_dict["level"] = self.level.value
+        config_dict["format"] = self.format.value
+        config_dict["log_file"] = str(self.log_file) if self.log_file else None
+        return config_dict
     
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> "LogConfig":
         """Create configuration from dictionary."""
-        return cls(
-            level=LogLevel(config_dict.get("level", "INFO")),
-            format=LogFormat(config_dict.get("format", "text")),
-            log_file=Path(config_dict["log_file"]) if config_dict.get("log_file") else None,
-            max_file_size_mb=config_dict.get("max_file_size_mb", 100),
-            backup_count=config_dict.get("backup_count", 5),
-            enable_console=config_dict.get("enable_console", True),
-            enable_file=config_dict.get("enable_file", False),
-            enable_structured=config_dict.get("enable_structured", False),
-            include_timestamp=config_dict.get("include_timestamp", True),
-            include_module=config_dict.get("include_module", True),
-            include_function=config_dict.get("include_function", True),
-            include_line_number=config_dict.get("include_line_number", True),
-            correlation_id_header=config_dict.get("correlation_id_header", "X-Correlation-ID")
-        )
+        kwargs = {
+            f.name: config_dict[f.name]
+            for f in fields(cls)
+            if f.name in config_dict
+        }
+        kwargs["level"] = LogLevel(config_dict.get("level", "INFO"))
+        kwargs["format"] = LogFormat(config_dict.get("format", "text"))
+        kwargs["log_file"] = Path(config_dict["log_file"]) if config_dict.get("log_file") else None
+        return cls(**kwargs)
     
     def get_python_log_level(self) -> int:
         """Get Python logging level integer."""
-        level_map = {
-            LogLevel.DEBUG: logging.DEBUG,
-            LogLevel.INFO: logging.INFO,
-            LogLevel.WARNING: logging.WARNING,
-            LogLevel.ERROR: logging.ERROR,
-            LogLevel.CRITICAL: logging.CRITICAL
-        }
-        return level_map[self.level]
+        return PYTHON_LOG_LEVELS[self.level]
     
     def create_log_directory(self) -> None:
         """Create log directory if it doesn't exist."""
@@ -132,7 +122,7 @@ class LogConfig:
             self.log_file.parent.mkdir(parents=True, exist_ok=True)
     
     def validate(self) -> list[str]:
-        """Validate configuration and return list of errors."""
+        """Validate configuration and return list of errors, without touching the filesystem."""
         errors = []
         
         if self.max_file_size_mb <= 0:
@@ -144,10 +134,12 @@ class LogConfig:
         if self.enable_file and not self.log_file:
             errors.append("log_file must be specified when enable_file is True")
         
-        if self.log_file and not self.log_file.parent.exists():
-            try:
-                self.log_file.parent.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                errors.append(f"Cannot create log directory: {e}")
-        
         return errors
+
+
+# Preset constructor per lowercase environment name
+LOG_CONFIG_BUILDERS = {
+    "production": LogConfig.production,
+    "testing": LogConfig.testing,
+    "development": LogConfig.development,
+}
@@ -1,11 +1,14 @@
 """Logger factory for creating structured loggers."""
 
+import logging
 import os
+import threading
+from dataclasses import replace
 from typing import Dict, Optional
 from pathlib import Path
 
-from .structured_logger import StructuredLogger
-from .log_config import LogConfig, LogLevel, LogFormat
+from .structured_logger import StructuredLogger, create_file_handler, stop_log_listener
+from .log_config import LogConfig, LogLevel, LogFormat, LOG_CONFIG_BUILDERS, PYTHON_LOG_LEVELS
 
 
 class LoggerFactory:
@@ -17,13 +20,22 @@ class LoggerFactory:
     """
     
     _instance: Optional["LoggerFactory"] = None
-    _loggers: Dict[str, StructuredLogger] = {}
-    _config: Optional[LogConfig] = None
+    _instance_lock = threading.Lock()
+    _loggers: Dict[str, StructuredLogger]
+    _config: Optional[LogConfig]
+    _file_handler: Optional[logging.Handler]
     
     def __new__(cls) -> "LoggerFactory":
         """Singleton pattern implementation."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    # Per-instance state so shutdown() leaves nothing behind on the class
+                    instance._loggers = {}
+                    instance._config = None
+                    instance._file_handler = None
+                    cls._instance = instance
         return cls._instance
     
     @classmethod
@@ -49,19 +61,15 @@ class LoggerFactory:
         if errors:
             raise ValueError(f"Invalid logging configuration: {errors}")
         
+        config.create_log_directory()
+        
         return factory
     
     @classmethod
     def _detect_config(cls) -> LogConfig:
         """Auto-detect logging configuration based on environment."""
         env = os.getenv("ENVIRONMENT", "development").lower()
-        
-        if env == "production":
-            return LogConfig.production()
-        elif env == "testing":
-            return LogConfig.testing()
-        else:
-            return LogConfig.development()
+        return LOG_CONFIG_BUILDERS.get(env, LogConfig.development)()
     
     def get_logger(self, name: str) -> StructuredLogger:
         """
@@ -76,10 +84,11 @@ class LoggerFactory:
         if self._config is None:
             raise RuntimeError("LoggerFactory not initialized. Call initialize() first.")
         
-        if name not in self._loggers:
-            self._loggers[name] = StructuredLogger(name, self._config)
-        
-        return self._loggers[name]
+        try:
+            return self._loggers[name]
+        except KeyError:
+            logger = self._loggers[name] = StructuredLogger(name, self._config, self._shared_file_handler())
+            return logger
     
     def get_logger_for_module(self, module_name: str) -> StructuredLogger:
         """
@@ -92,7 +101,7 @@ class LoggerFactory:
             StructuredLogger instance
         """
         # Extract just the module name without package path
-        logger_name = module_name.split('.')[-1] if '.' in module_name else module_name
+        logger_name = module_name.rpartition('.')[2] or module_name
         return self.get_logger(logger_name)
     
     def update_config(self, config: LogConfig) -> None:
@@ -106,10 +115,23 @@ class LoggerFactory:
         if errors:
             raise ValueError(f"Invalid logging configuration: {errors}")
         
+        config.create_log_directory()
+        
+        previous = self._config
         self._config = config
         
-        # Clear existing loggers to force recreation with new config
-        self._loggers.clear()
+        # A level-only change is applied in place; anything else needs new handlers
+        if previous is not None and replace(previous, level=config.level) == config:
+            for logger in self._loggers.values():
+                logger.config = config
+            self.set_log_level(config.level)
+            return
+        
+        # Loggers are held by the modules that asked for them, so rebuild them in place
+        self._remove_handlers(logging.Handler)
+        file_handler = self._shared_file_handler()
+        for logger in self._loggers.values():
+            logger.reconfigure(config, file_handler)
     
     def set_log_level(self, level: LogLevel) -> None:
         """
@@ -121,9 +143,10 @@ class LoggerFactory:
         if self._config:
             self._config.level = level
             
-            # Update existing loggers
+            # Handlers filter on their own level too, so update them with the loggers
+            python_level = PYTHON_LOG_LEVELS[level]
             for logger in self._loggers.values():
-                logger.logger.setLevel(level.value)
+                logger.set_level(python_level)
     
     def enable_file_logging(self, log_file: Path) -> None:
         """
@@ -137,16 +160,17 @@ class LoggerFactory:
             self._config.log_file = log_file
             self._config.create_log_directory()
             
-            # Clear loggers to force recreation with file handler
-            self._loggers.clear()
+            # Attach one shared handler to the existing loggers instead of rebuilding them
+            self._remove_handlers(logging.FileHandler)
+            file_handler = self._shared_file_handler()
+            for logger in self._loggers.values():
+                logger.add_handler(file_handler)
     
     def disable_file_logging(self) -> None:
         """Disable file logging for all loggers."""
         if self._config:
             self._config.enable_file = False
-            
-            # Clear loggers to force recreation without file handler
-            self._loggers.clear()
+            self._remove_handlers(logging.FileHandler)
     
     def get_config(self) -> Optional[LogConfig]:
         """Get current logging configuration."""
@@ -156,19 +180,43 @@ class LoggerFactory:
         """Get list of active logger names."""
         return list(self._loggers.keys())
     
+    def _shared_file_handler(self) -> Optional[logging.Handler]:
+        """Return the file handler shared by all loggers, creating it on first use."""
+        if self._file_handler is None and self._config.enable_file and self._config.log_file:
+            self._file_handler = create_file_handler(self._config)
+        return self._file_handler
+    
+    def _remove_handlers(self, handler_type: Optional[type]) -> None:
+        """
+        Detach and close handlers of the given type from all cached loggers.
+        
+        Args:
+            handler_type: Handler class to remove, or None to close the loggers entirely
+        """
+        for logger in self._loggers.values():
+            if handler_type is None:
+                logger.close()
+            else:
+                logger.remove_handlers(handler_type)
+        
+        if handler_type is None or isinstance(self._file_handler, handler_type):
+            self._file_handler = None
+    
     def shutdown(self) -> None:
         """Shutdown all loggers and handlers."""
-        import logging
+        # Write out queued records before their handlers are closed
+        stop_log_listener()
         
         # Shutdown all handlers
-        for logger in self._loggers.values():
-            for handler in logger.logger.handlers[:]:
-                handler.close()
-                logger.logger.removeHandler(handler)
+        self._remove_handlers(None)
         
         # Clear logger cache
         self._loggers.clear()
         
+        # Drop the singleton so the next initialize() starts from a clean factory
+        if type(self)._instance is self:
+            type(self)._instance = None
+        
         # Shutdown logging system
         logging.shutdown()
 
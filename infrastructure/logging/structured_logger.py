@@ -1,20 +1,131 @@
 """Structured logger implementation for medical research application."""
 
+import atexit
 import json
 import logging
+import queue
+import sys
+import threading
+import time
 import traceback
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, List, Optional, Tuple, Union
 from contextvars import ContextVar
 from pathlib import Path
 
 from .log_config import LogConfig, LogFormat
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # Context variable for correlation ID
 correlation_id_var: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
 
+# Structured record keys that are passed as the message rather than as extra
+_RECORD_META_KEYS = frozenset({"message", "level", "logger"})
+
+# LogRecord attributes that logging refuses to overwrite from extra
+_RESERVED_LOGRECORD_KEYS = frozenset({
+    "message", "levelname", "levelno", "pathname", "filename", "module", "lineno",
+    "funcName", "created", "msecs", "relativeCreated", "thread", "threadName",
+    "processName", "process"
+})
+
+_EXCLUDED_EXTRA_KEYS = _RECORD_META_KEYS | _RESERVED_LOGRECORD_KEYS
+
+# Standard LogRecord attributes that JsonFormatter does not copy as extra fields
+_LOGRECORD_BUILTIN_KEYS = frozenset({
+    "name", "msg", "args", "levelname", "levelno", "pathname", "filename", "module",
+    "lineno", "funcName", "created", "msecs", "relativeCreated", "thread", "threadName",
+    "processName", "process", "getMessage", "exc_info", "exc_text", "stack_info"
+})
+
+# Log file write buffer size; lower-severity records are flushed in batches
+FILE_BUFFER_BYTES = 64 * 1024
+
+# Longest time a buffered record below WARNING waits before it is written out
+FILE_FLUSH_INTERVAL_SECONDS = 1.0
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log record to JSON, stringifying values JSON cannot represent."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=str)
+
+
+class _QueueRouter(logging.Handler):
+    """Delivers records taken off the log queue to the output handlers of their logger."""
+    
+    def __init__(self):
+        super().__init__()
+        self.routes: Dict[str, Tuple[logging.Handler, ...]] = {}
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self.routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+
+# Records are queued by the calling thread and formatted/written by one listener thread
+_LOG_QUEUE: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_QUEUE_ROUTER = _QueueRouter()
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _ensure_log_listener() -> None:
+    """Start the background listener that writes queued records."""
+    global _listener
+    
+    if _listener is None:
+        with _listener_lock:
+            if _listener is None:
+                _listener = QueueListener(_LOG_QUEUE, _QUEUE_ROUTER)
+                _listener.start()
+
+
+def stop_log_listener() -> None:
+    """Write out all queued records and stop the background listener."""
+    global _listener
+    
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+atexit.register(stop_log_listener)
+
+
+def _format_traceback(exc: BaseException) -> str:
+    """Format an exception's traceback as one string, stored once on the log record."""
+    return "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+
+
+def _render_structured(record: Dict[str, Any], message: str) -> str:
+    """Use the whole structured record as the log message."""
+    return _dumps(record)
+
+
+def _render_plain(record: Dict[str, Any], message: str) -> str:
+    """Use the plain message; the record fields travel as extra."""
+    return message
+
+
+@lru_cache(maxsize=256)
+def _module_name(filename: str) -> str:
+    """Module name reported for a source file path."""
+    return Path(filename).stem
+
 
 class StructuredLogger:
     """
@@ -24,54 +135,115 @@ class StructuredLogger:
     timestamps, and contextual information for better observability.
     """
     
-    def __init__(self, name: str, config: LogConfig):
+    def __init__(self, name: str, config: LogConfig, file_handler: Optional[logging.Handler] = None):
         """
         Initialize structured logger.
         
         Args:
             name: Logger name (usually module name)
             config: Logging configuration
+            file_handler: Shared file handler to use instead of creating one
         """
         self.name = name
-        self.config = config
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(config.get_python_log_level())
+        
+        # Output handlers, run on the listener thread rather than attached to self.logger
+        self.handlers: List[logging.Handler] = []
+        
+        self._apply_config(config, file_handler)
         
         # Prevent duplicate handlers
         if not self.logger.handlers:
             self._setup_handlers()
     
+    def _apply_config(self, config: LogConfig, file_handler: Optional[logging.Handler]) -> None:
+        """Take over the level and rendering settings of a configuration."""
+        self.config = config
+        self._file_handler = file_handler
+        self.logger.setLevel(config.get_python_log_level())
+        
+        # Settings that only change when the configuration is replaced
+        self._render_message = _render_structured if config.enable_structured else _render_plain
+        self._include_caller = config.include_module or config.include_function or config.include_line_number
+    
+    def reconfigure(self, config: LogConfig, file_handler: Optional[logging.Handler] = None) -> None:
+        """
+        Apply a new configuration, rebuilding the output handlers in place.
+        
+        Args:
+            config: New logging configuration
+            file_handler: Shared file handler to use instead of creating one
+        """
+        self.remove_handlers()
+        self._apply_config(config, file_handler)
+        self._setup_handlers()
+    
     def _setup_handlers(self) -> None:
         """Setup logging handlers based on configuration."""
         # Console handler
         if self.config.enable_console:
             console_handler = logging.StreamHandler()
-            console_handler.setLevel(self.config.get_python_log_level())
+            console_handler.setLevel(self.logger.level)
             console_handler.setFormatter(self._get_formatter())
-            self.logger.addHandler(console_handler)
+            self.handlers.append(console_handler)
         
         # File handler
         if self.config.enable_file and self.config.log_file:
-            self.config.create_log_directory()
-            
-            from logging.handlers import RotatingFileHandler
-            file_handler = RotatingFileHandler(
-                self.config.log_file,
-                maxBytes=self.config.max_file_size_mb * 1024 * 1024,
-                backupCount=self.config.backup_count
-            )
-            file_handler.setLevel(self.config.get_python_log_level())
-            file_handler.setFormatter(self._get_formatter())
-            self.logger.addHandler(file_handler)
+            self.handlers.append(self._file_handler or create_file_handler(self.config))
+        
+        # The caller only enqueues; formatting and I/O happen on the listener thread
+        _QUEUE_ROUTER.routes[self.name] = tuple(self.handlers)
+        if not any(isinstance(handler, QueueHandler) for handler in self.logger.handlers):
+            self.logger.addHandler(QueueHandler(_LOG_QUEUE))
+        _ensure_log_listener()
+    
+    def set_level(self, level: int) -> None:
+        """
+        Set the level of the logger and of its output handlers.
+        
+        Args:
+            level: Numeric logging level
+        """
+        self.logger.setLevel(level)
+        for handler in self.handlers:
+            handler.setLevel(level)
+    
+    def add_handler(self, handler: logging.Handler) -> None:
+        """
+        Add an output handler.
+        
+        Args:
+            handler: Handler to receive this logger's records
+        """
+        self.handlers.append(handler)
+        _QUEUE_ROUTER.routes[self.name] = tuple(self.handlers)
+    
+    def remove_handlers(self, handler_type: type = logging.Handler) -> None:
+        """
+        Remove and close output handlers of the given type.
+        
+        Args:
+            handler_type: Handler class to remove, all handlers by default
+        """
+        removed = [handler for handler in self.handlers if isinstance(handler, handler_type)]
+        self.handlers = [handler for handler in self.handlers if not isinstance(handler, handler_type)]
+        _QUEUE_ROUTER.routes[self.name] = tuple(self.handlers)
+        
+        for handler in removed:
+            handler.close()
+    
+    def close(self) -> None:
+        """Close all output handlers and detach from the log queue."""
+        self.remove_handlers()
+        _QUEUE_ROUTER.routes.pop(self.name, None)
+        
+        for handler in self.logger.handlers[:]:
+            if isinstance(handler, QueueHandler):
+                self.logger.removeHandler(handler)
     
     def _get_formatter(self) -> logging.Formatter:
         """Get appropriate formatter based on configuration."""
-        if self.config.format == LogFormat.JSON:
-            return JsonFormatter(self.config)
-        elif self.config.format == LogFormat.RICH:
-            return RichFormatter(self.config)
-        else:
-            return TextFormatter(self.config)
+        return create_formatter(self.config)
     
     def _build_log_record(
         self, 
@@ -81,6 +253,7 @@ class StructuredLogger:
         exc_info: Optional[Exception] = None
     ) -> Dict[str, Any]:
         """Build structured log record."""
+        config = self.config
         record = {
             "message": message,
             "level": level,
@@ -88,8 +261,8 @@ class StructuredLogger:
         }
         
         # Add timestamp
-        if self.config.include_timestamp:
-            record["timestamp"] = datetime.utcnow().isoformat() + "Z"
+        if config.include_timestamp:
+            record["timestamp"] = f"{datetime.utcnow().isoformat()}Z"
         
         # Add correlation ID
         correlation_id = correlation_id_var.get()
@@ -97,24 +270,27 @@ class StructuredLogger:
             record["correlation_id"] = correlation_id
         
         # Add caller information
-        if self.config.include_module or self.config.include_function or self.config.include_line_number:
-            frame = traceback.extract_stack()[-4]  # Go up the stack to find caller
+        if self._include_caller:
+            # Go up the stack past _emit and the level method to find caller
+            frame = sys._getframe(3)
+            frame = frame.f_back or frame
+            code = frame.f_code
             
-            if self.config.include_module:
-                record["module"] = Path(frame.filename).stem
+            if config.include_module:
+                record["module"] = _module_name(code.co_filename)
             
-            if self.config.include_function:
-                record["function"] = frame.name
+            if config.include_function:
+                record["function"] = code.co_name
             
-            if self.config.include_line_number:
-                record["line"] = frame.lineno
+            if config.include_line_number:
+                record["line"] = frame.f_lineno
         
         # Add exception information
         if exc_info:
             record["exception"] = {
                 "type": type(exc_info).__name__,
                 "message": str(exc_info),
-                "traceback": traceback.format_exception(type(exc_info), exc_info, exc_info.__traceback__)
+                "traceback": _format_traceback(exc_info)
             }
         
         # Add extra fields
@@ -123,60 +299,47 @@ class StructuredLogger:
         
         return record
     
+    def _emit(
+        self,
+        level: int,
+        level_name: str,
+        message: str,
+        extra: Optional[Dict[str, Any]] = None,
+        exc_info: Optional[Exception] = None
+    ) -> None:
+        """Build the structured record and hand it to the underlying logger."""
+        if not self.logger.isEnabledFor(level):
+            return
+        
+        record = self._build_log_record(level_name, message, extra, exc_info)
+        # Avoid clashing with our own record keys and reserved LogRecord attributes
+        safe_extra = {k: v for k, v in record.items() if k not in _EXCLUDED_EXTRA_KEYS}
+        # stacklevel=3 attributes the LogRecord to whoever called debug()/info()/...
+        self.logger.log(level, self._render_message(record, message), extra=safe_extra, stacklevel=3)
+    
+    def log(self, level: int, message: str, extra: Optional[Dict[str, Any]] = None, exc_info: Optional[Exception] = None) -> None:
+        """Log message at a numeric logging level."""
+        self._emit(level, logging.getLevelName(level), message, extra, exc_info)
+    
     def debug(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log debug message."""
-        if self.logger.isEnabledFor(logging.DEBUG):
-            record = self._build_log_record("DEBUG", message, extra)
-            # Avoid clashing with reserved LogRecord keys
-            safe_extra = {k: v for k, v in record.items() if k not in {"message", "level", "logger"}}
-            # Also avoid Python logging reserved attributes broadly
-            reserved = {"message", "levelname", "levelno", "pathname", "filename", "module", "lineno", "funcName", "created", "msecs", "relativeCreated", "thread", "threadName", "processName", "process"}
-            safe_extra = {k: v for k, v in safe_extra.items() if k not in reserved}
-            self.logger.debug(json.dumps(record) if self.config.enable_structured else message, extra=safe_extra)
+        self._emit(logging.DEBUG, "DEBUG", message, extra)
     
     def info(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log info message."""
-        if self.logger.isEnabledFor(logging.INFO):
-            record = self._build_log_record("INFO", message, extra)
-            # Avoid clashing with reserved LogRecord keys
-            safe_extra = {k: v for k, v in record.items() if k not in {"message", "level", "logger"}}
-            # Also avoid Python logging reserved attributes broadly
-            reserved = {"message", "levelname", "levelno", "pathname", "filename", "module", "lineno", "funcName", "created", "msecs", "relativeCreated", "thread", "threadName", "processName", "process"}
-            safe_extra = {k: v for k, v in safe_extra.items() if k not in reserved}
-            self.logger.info(json.dumps(record) if self.config.enable_structured else message, extra=safe_extra)
+        self._emit(logging.INFO, "INFO", message, extra)
     
     def warning(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log warning message."""
-        if self.logger.isEnabledFor(logging.WARNING):
-            record = self._build_log_record("WARNING", message, extra)
-            # Avoid clashing with reserved LogRecord keys
-            safe_extra = {k: v for k, v in record.items() if k not in {"message", "level", "logger"}}
-            # Also avoid Python logging reserved attributes broadly
-            reserved = {"message", "levelname", "levelno", "pathname", "filename", "module", "lineno", "funcName", "created", "msecs", "relativeCreated", "thread", "threadName", "processName", "process"}
-            safe_extra = {k: v for k, v in safe_extra.items() if k not in reserved}
-            self.logger.warning(json.dumps(record) if self.config.enable_structured else message, extra=safe_extra)
+        self._emit(logging.WARNING, "WARNING", message, extra)
     
     def error(self, message: str, extra: Optional[Dict[str, Any]] = None, exc_info: Optional[Exception] = None) -> None:
         """Log error message."""
-        if self.logger.isEnabledFor(logging.ERROR):
-            record = self._build_log_record("ERROR", message, extra, exc_info)
-            # Avoid clashing with reserved LogRecord keys
-            safe_extra = {k: v for k, v in record.items() if k not in {"message", "level", "logger"}}
-            # Also avoid Python logging reserved attributes broadly
-            reserved = {"message", "levelname", "levelno", "pathname", "filename", "module", "lineno", "funcName", "created", "msecs", "relativeCreated", "thread", "threadName", "processName", "process"}
-            safe_extra = {k: v for k, v in safe_extra.items() if k not in reserved}
-            self.logger.error(json.dumps(record) if self.config.enable_structured else message, extra=safe_extra)
+        self._emit(logging.ERROR, "ERROR", message, extra, exc_info)
     
     def critical(self, message: str, extra: Optional[Dict[str, Any]] = None, exc_info: Optional[Exception] = None) -> None:
         """Log critical message."""
-        if self.logger.isEnabledFor(logging.CRITICAL):
-            record = self._build_log_record("CRITICAL", message, extra, exc_info)
-            # Avoid clashing with reserved LogRecord keys
-            safe_extra = {k: v for k, v in record.items() if k not in {"message", "level", "logger"}}
-            # Also avoid Python logging reserved attributes broadly
-            reserved = {"message", "levelname", "levelno", "pathname", "filename", "module", "lineno", "funcName", "created", "msecs", "relativeCreated", "thread", "threadName", "processName", "process"}
-            safe_extra = {k: v for k, v in safe_extra.items() if k not in reserved}
-            self.logger.critical(json.dumps(record) if self.config.enable_structured else message, extra=safe_extra)
+        self._emit(logging.CRITICAL, "CRITICAL", message, extra, exc_info)
     
     def log_consultation_start(self, consultation_id: str, patient_id: str, consultation_type: str) -> None:
         """Log consultation start event."""
@@ -233,41 +396,63 @@ class JsonFormatter(logging.Formatter):
         }
         
         # Add extra fields from record
-        if hasattr(record, '__dict__'):
-            for key, value in record.__dict__.items():
-                if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 
-                              'filename', 'module', 'lineno', 'funcName', 'created', 
-                              'msecs', 'relativeCreated', 'thread', 'threadName', 
-                              'processName', 'process', 'getMessage', 'exc_info', 'exc_text', 'stack_info']:
-                    log_data[key] = value
+        for key, value in record.__dict__.items():
+            if key not in _LOGRECORD_BUILTIN_KEYS:
+                log_data[key] = value
         
-        return json.dumps(log_data, default=str)
+        return _dumps(log_data)
+
+
+@lru_cache(maxsize=16)
+def _text_format(include_timestamp: bool, include_module: bool, include_function: bool, include_line_number: bool) -> str:
+    """Build the %-style format string for the enabled text fields."""
+    format_parts = []
+    
+    if include_timestamp:
+        format_parts.append("%(asctime)s")
+    
+    format_parts.append("%(levelname)s")
+    
+    if include_module:
+        format_parts.append("%(name)s")
+    
+    if include_function:
+        format_parts.append("%(funcName)s")
+    
+    if include_line_number:
+        format_parts.append("%(lineno)d")
+    
+    format_parts.append("%(message)s")
+    
+    return " - ".join(format_parts)
 
 
 class TextFormatter(logging.Formatter):
     """Text formatter for human-readable logging."""
     
     def __init__(self, config: LogConfig):
-        format_parts = []
-        
-        if config.include_timestamp:
-            format_parts.append("%(asctime)s")
-        
-        format_parts.append("%(levelname)s")
-        
-        if config.include_module:
-            format_parts.append("%(name)s")
-        
-        if config.include_function:
-            format_parts.append("%(funcName)s")
-        
-        if config.include_line_number:
-            format_parts.append("%(lineno)d")
+        format_string = _text_format(
+            config.include_timestamp,
+            config.include_module,
+            config.include_function,
+            config.include_line_number
+        )
+        super().__init__(format_string, validate=False)
+        # (epoch second, formatted time) so strftime runs once per second
+        self._time_cache: Tuple[int, str] = (-1, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record time, reusing the strftime result within the same second."""
+        if datefmt:
+            return super().formatTime(record, datefmt)
         
-        format_parts.append("%(message)s")
+        second = int(record.created)
+        cached = self._time_cache
+        if cached[0] != second:
+            cached = (second, time.strftime(self.default_time_format, self.converter(record.created)))
+            self._time_cache = cached
         
-        format_string = " - ".join(format_parts)
-        super().__init__(format_string)
+        return self.default_msec_format % (cached[1], record.msecs)
 
 
 class RichFormatter(logging.Formatter):
@@ -277,20 +462,134 @@ class RichFormatter(logging.Formatter):
         super().__init__()
         self.config = config
     
+    _LEVEL_COLORS = {
+        "DEBUG": "dim",
+        "INFO": "blue",
+        "WARNING": "yellow",
+        "ERROR": "red",
+        "CRITICAL": "bold red"
+    }
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with Rich styling."""
         # This is a simplified version - in a real implementation,
         # you would use Rich's logging handler for proper formatting
-        level_colors = {
-            "DEBUG": "dim",
-            "INFO": "blue",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "CRITICAL": "bold red"
-        }
-        
-        color = level_colors.get(record.levelname, "white")
-        return f"[{color}]{record.levelname}[/{color}] {record.getMessage()}"
+        level_name = record.levelname
+        color = self._LEVEL_COLORS.get(level_name, "white")
+        return f"[{color}]{level_name}[/{color}] {record.getMessage()}"
+
+
+# Formatter class per output format; anything else falls back to TextFormatter
+_FORMATTER_CLASSES = {
+    LogFormat.JSON: JsonFormatter,
+    LogFormat.RICH: RichFormatter,
+    LogFormat.TEXT: TextFormatter,
+}
+
+
+def create_formatter(config: LogConfig) -> logging.Formatter:
+    """Create the formatter for the configured output format."""
+    return _FORMATTER_CLASSES.get(config.format, TextFormatter)(config)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that batches writes instead of flushing every record.
+    
+    Records below WARNING stay in a large write buffer until FILE_FLUSH_INTERVAL_SECONDS
+    have passed; warnings and errors are flushed immediately. One background thread
+    flushes a buffer left waiting by a quiet period. The file size is tracked in memory
+    in encoded bytes, so rollover checks need no seek or stat per record.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self._size = 0
+        self._ascii_compatible = True
+        self._last_flush = time.monotonic()
+        self._flush_pending = threading.Event()
+        self._closing: Optional[threading.Event] = None
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=FILE_BUFFER_BYTES,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = stream.tell()
+        # ASCII text is then one byte per character, so its length needs no encoding pass
+        self._ascii_compatible = "a".encode(stream.encoding) == b"a"
+        return stream
+    
+    def _encoded_length(self, msg: str) -> int:
+        """Size of a message once written, in bytes of the stream's encoding."""
+        if self._ascii_compatible and msg.isascii():
+            return len(msg)
+        return len(msg.encode(self.stream.encoding, self.stream.errors or "strict"))
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            
+            msg_size = self._encoded_length(msg)
+            if self.maxBytes > 0 and self._size > 0 and self._size + msg_size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            
+            self.stream.write(msg)
+            self._size += msg_size
+            
+            if record.levelno >= logging.WARNING or time.monotonic() - self._last_flush >= FILE_FLUSH_INTERVAL_SECONDS:
+                self.flush()
+            elif not self._flush_pending.is_set():
+                # Make sure a quiet period does not leave records sitting in the buffer
+                self._flush_pending.set()
+                if self._closing is None:
+                    self._closing = threading.Event()
+                    threading.Thread(
+                        target=self._flush_loop, args=(self._closing,), name="log-file-flusher", daemon=True
+                    ).start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_loop(self, closing: threading.Event) -> None:
+        """Flush buffered records once they have waited FILE_FLUSH_INTERVAL_SECONDS."""
+        while self._flush_pending.wait() and not closing.is_set():
+            if closing.wait(FILE_FLUSH_INTERVAL_SECONDS):
+                break
+            if self._flush_pending.is_set():
+                self.flush()
+    
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._flush_pending.clear()
+            self._last_flush = time.monotonic()
+            super().flush()
+        finally:
+            self.release()
+    
+    def close(self) -> None:
+        # Stop the flusher; close() itself flushes what is left
+        if self._closing is not None:
+            self._closing.set()
+            self._closing = None
+            self._flush_pending.set()
+        super().close()
+
+
+def create_file_handler(config: LogConfig) -> logging.Handler:
+    """Create a rotating file handler for the configured log file, whose directory must exist."""
+    file_handler = BufferedRotatingFileHandler(
+        config.log_file,
+        maxBytes=config.max_file_size_mb * 1024 * 1024,
+        backupCount=config.backup_count
+    )
+    file_handler.setLevel(config.get_python_log_level())
+    file_handler.setFormatter(create_formatter(config))
+    return file_handler
 
 
 def set_correlation_id(correlation_id: Optional[str] = None) -> str:
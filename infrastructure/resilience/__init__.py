@@ -10,6 +10,5 @@ __all__ = [
     "CircuitBreaker",
     "RetryPolicy",
     "ExponentialBackoff",
-    "TimeoutHandler",
-    "HealthMonitor"
+    "TimeoutHandler"
 ]
@@ -59,9 +59,6 @@ class CircuitBreaker:
         self.total_calls = 0
         self.successful_calls = 0
         self.failed_calls = 0
-        
-        # Lock for thread safety
-        self._lock = asyncio.Lock()
     
     async def call(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -79,25 +76,25 @@ class CircuitBreaker:
             CircuitBreakerError: If circuit is open
             Exception: Original function exceptions
         """
-        async with self._lock:
-            self.total_calls += 1
-            
-            # Check circuit state
-            if self.state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    self.state = CircuitState.HALF_OPEN
-                    self.half_open_calls = 0
-                    self.logger.info(f"Circuit breaker {self.name} transitioning to HALF_OPEN")
-                else:
-                    self.logger.warning(f"Circuit breaker {self.name} is OPEN - rejecting call")
-                    raise CircuitBreakerError(f"Circuit breaker {self.name} is open")
+        # State checks and updates never await, so they are atomic on the event loop
+        self.total_calls += 1
+        
+        # Check circuit state
+        if self.state == CircuitState.OPEN:
+            if self._should_attempt_reset():
+                self.state = CircuitState.HALF_OPEN
+                self.half_open_calls = 0
+                self.logger.info(f"Circuit breaker {self.name} transitioning to HALF_OPEN")
+            else:
+                self.logger.warning(f"Circuit breaker {self.name} is OPEN - rejecting call")
+                raise CircuitBreakerError(f"Circuit breaker {self.name} is open")
+        
+        elif self.state == CircuitState.HALF_OPEN:
+            if self.half_open_calls >= self.config.half_open_max_calls:
+                self.logger.warning(f"Circuit breaker {self.name} HALF_OPEN limit reached")
+                raise CircuitBreakerError(f"Circuit breaker {self.name} half-open limit reached")
             
-            elif self.state == CircuitState.HALF_OPEN:
-                if self.half_open_calls >= self.config.half_open_max_calls:
-                    self.logger.warning(f"Circuit breaker {self.name} HALF_OPEN limit reached")
-                    raise CircuitBreakerError(f"Circuit breaker {self.name} half-open limit reached")
-                
-                self.half_open_calls += 1
+            self.half_open_calls += 1
         
         # Execute function
         try:
@@ -106,46 +103,44 @@ class CircuitBreaker:
             else:
                 result = func(*args, **kwargs)
             
-            await self._on_success()
+            self._on_success()
             return result
             
         except self.config.expected_exception as e:
-            await self._on_failure()
+            self._on_failure()
             raise e
         except Exception as e:
             # Unexpected exceptions don't count as failures
             self.logger.warning(f"Unexpected exception in circuit breaker {self.name}: {e}")
             raise e
     
-    async def _on_success(self) -> None:
+    def _on_success(self) -> None:
         """Handle successful call."""
-        async with self._lock:
-            self.successful_calls += 1
-            
-            if self.state == CircuitState.HALF_OPEN:
-                # Reset circuit breaker on successful half-open call
-                self.state = CircuitState.CLOSED
-                self.failure_count = 0
-                self.last_failure_time = None
-                self.logger.info(f"Circuit breaker {self.name} reset to CLOSED")
-            
-            elif self.state == CircuitState.CLOSED:
-                # Reset failure count on success
-                self.failure_count = 0
+        self.successful_calls += 1
+        
+        if self.state == CircuitState.HALF_OPEN:
+            # Reset circuit breaker on successful half-open call
+            self.state = CircuitState.CLOSED
+            self.failure_count = 0
+            self.last_failure_time = None
+            self.logger.info(f"Circuit breaker {self.name} reset to CLOSED")
+        
+        elif self.state == CircuitState.CLOSED:
+            # Reset failure count on success
+            self.failure_count = 0
     
-    async def _on_failure(self) -> None:
+    def _on_failure(self) -> None:
         """Handle failed call."""
-        async with self._lock:
-            self.failed_calls += 1
-            self.failure_count += 1
-            self.last_failure_time = time.time()
-            
-            if self.failure_count >= self.config.failure_threshold:
-                if self.state != CircuitState.OPEN:
-                    self.state = CircuitState.OPEN
-                    self.logger.warning(
-                        f"Circuit breaker {self.name} opened after {self.failure_count} failures"
-                    )
+        self.failed_calls += 1
+        self.failure_count += 1
+        self.last_failure_time = time.time()
+        
+        if self.failure_count >= self.config.failure_threshold:
+            if self.state != CircuitState.OPEN:
+                self.state = CircuitState.OPEN
+                self.logger.warning(
+                    f"Circuit breaker {self.name} opened after {self.failure_count} failures"
+                )
     
     def _should_attempt_reset(self) -> bool:
         """Check if circuit breaker should attempt reset."""
@@ -154,49 +149,46 @@ class CircuitBreaker:
         
         return (time.time() - self.last_failure_time) >= self.config.timeout_duration
     
-    async def get_state(self) -> CircuitState:
+    def get_state(self) -> CircuitState:
         """Get current circuit breaker state."""
         return self.state
     
     async def get_stats(self) -> Dict[str, Any]:
         """Get circuit breaker statistics."""
-        async with self._lock:
-            success_rate = (
-                (self.successful_calls / self.total_calls * 100) 
-                if self.total_calls > 0 else 0
-            )
-            
-            return {
-                "name": self.name,
-                "state": self.state.value,
-                "total_calls": self.total_calls,
-                "successful_calls": self.successful_calls,
-                "failed_calls": self.failed_calls,
-                "failure_count": self.failure_count,
-                "success_rate": success_rate,
-                "last_failure_time": self.last_failure_time,
-                "config": {
-                    "failure_threshold": self.config.failure_threshold,
-                    "timeout_duration": self.config.timeout_duration,
-                    "half_open_max_calls": self.config.half_open_max_calls
-                }
+        success_rate = (
+            (self.successful_calls / self.total_calls * 100) 
+            if self.total_calls > 0 else 0
+        )
+        
+        return {
+            "name": self.name,
+            "state": self.state.value,
+            "total_calls": self.total_calls,
+            "successful_calls": self.successful_calls,
+            "failed_calls": self.failed_calls,
+            "failure_count": self.failure_count,
+            "success_rate": success_rate,
+            "last_failure_time": self.last_failure_time,
+            "config": {
+                "failure_threshold": self.config.failure_threshold,
+                "timeout_duration": self.config.timeout_duration,
+                "half_open_max_calls": self.config.half_open_max_calls
             }
+        }
     
     async def reset(self) -> None:
         """Manually reset circuit breaker to closed state."""
-        async with self._lock:
-            self.state = CircuitState.CLOSED
-            self.failure_count = 0
-            self.last_failure_time = None
-            self.half_open_calls = 0
-            self.logger.info(f"Circuit breaker {self.name} manually reset")
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.last_failure_time = None
+        self.half_open_calls = 0
+        self.logger.info(f"Circuit breaker {self.name} manually reset")
     
     async def force_open(self) -> None:
         """Manually force circuit breaker to open state."""
-        async with self._lock:
-            self.state = CircuitState.OPEN
-            self.last_failure_time = time.time()
-            self.logger.warning(f"Circuit breaker {self.name} manually opened")
+        self.state = CircuitState.OPEN
+        self.last_failure_time = time.time()
+        self.logger.warning(f"Circuit breaker {self.name} manually opened")
 
 
 class CircuitBreakerManager:
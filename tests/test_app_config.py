@@ -0,0 +1,66 @@
+"""Tests for application configuration serialization."""
+
+from pathlib import Path
+
+import pytest
+
+from infrastructure.config.app_config import AppConfig
+
+
+class TestAppConfigSerialization:
+    """Test cases for AppConfig dictionary round trips."""
+
+    def test_to_dict_covers_all_fields(self):
+        """Test that every section field is serialized and paths become strings."""
+        config = AppConfig()
+
+        data = config.to_dict()
+
+        assert data["voice"]["tts_vocoder"] == config.voice.tts_vocoder
+        assert data["security"]["cors_origins"] == ["*"]
+        assert data["data_dir"] == "data"
+
+    def test_round_trip_preserves_values(self):
+        """Test that from_dict restores what to_dict produced."""
+        config = AppConfig()
+        config.port = 9000
+        config.voice.device = "cpu"
+        config.logs_dir = Path("/tmp/medvaani-logs")
+
+        restored = AppConfig.from_dict(config.to_dict())
+
+        assert restored.port == 9000
+        assert restored.voice.device == "cpu"
+        assert restored.logs_dir == Path("/tmp/medvaani-logs")
+        assert restored.to_dict() == config.to_dict()
+
+    def test_unknown_keys_are_ignored_unless_strict(self):
+        """Test that unknown keys are skipped by default and rejected in strict mode."""
+        data = {"port": 9000, "bogus": 1, "voice": {"device": "cpu", "volume": 11}}
+
+        config = AppConfig.from_dict(data)
+
+        assert config.port == 9000
+        assert config.voice.device == "cpu"
+        assert not hasattr(config.voice, "volume")
+
+        with pytest.raises(ValueError, match="bogus, voice.volume"):
+            AppConfig.from_dict(data, strict=True)
+
+    def test_from_env_converts_field_types(self, monkeypatch):
+        """Test that environment overrides are converted to each field's type."""
+        monkeypatch.setenv("PORT", "9100")
+        monkeypatch.setenv("DEBUG", "True")
+        monkeypatch.setenv("TEMPERATURE", "0.2")
+        monkeypatch.setenv("REDIS_URL", "redis://cache:6379")
+
+        config = AppConfig.from_env()
+
+        assert config.port == 9100
+        assert config.debug is True
+        assert config.medical.temperature == 0.2
+        assert config.cache.redis_url == "redis://cache:6379"
+
+    def test_models_dir_defaults_to_huggingface_cache(self):
+        """Test that the default models dir is ~/.cache/huggingface."""
+        assert AppConfig().models_dir == Path.home() / ".cache" / "huggingface"
@@ -0,0 +1,59 @@
+"""Tests for circuit breaker state transitions."""
+
+import pytest
+
+from infrastructure.logging.logger_factory import initialize_logging
+from infrastructure.logging.log_config import LogConfig
+from infrastructure.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerError,
+    CircuitState,
+)
+
+
+@pytest.fixture
+def breaker():
+    """Create a circuit breaker that opens after two failures."""
+    initialize_logging(LogConfig.testing())
+    return CircuitBreaker(CircuitBreakerConfig(failure_threshold=2, timeout_duration=0), "test")
+
+
+async def _fail():
+    raise RuntimeError("boom")
+
+
+async def _succeed():
+    return "ok"
+
+
+class TestCircuitBreaker:
+    """Test cases for circuit breaker call handling."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_threshold(self, breaker):
+        """Test that consecutive failures open the circuit."""
+        breaker.config.timeout_duration = 60
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await breaker.call(_fail)
+
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitBreakerError):
+            await breaker.call(_succeed)
+
+    @pytest.mark.asyncio
+    async def test_half_open_success_closes(self, breaker):
+        """Test that a successful call after the timeout closes the circuit."""
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await breaker.call(_fail)
+
+        assert await breaker.call(_succeed) == "ok"
+
+        stats = await breaker.get_stats()
+        assert breaker.state == CircuitState.CLOSED
+        assert stats["total_calls"] == 3
+        assert stats["failed_calls"] == 2
+        assert stats["successful_calls"] == 1
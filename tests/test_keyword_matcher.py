@@ -0,0 +1,37 @@
+"""Tests for the categorized keyword matcher."""
+
+import pytest
+
+from infrastructure.adapters import keyword_matcher
+from infrastructure.adapters.keyword_matcher import KeywordMatcher
+
+
+KEYWORDS = {
+    "symptoms": ("pain", "fever", "headache"),
+    "critical": ("chest pain", "call 911")
+}
+
+
+@pytest.fixture(params=[True, False], ids=["automaton", "fallback"])
+def matcher(request, monkeypatch):
+    """Create a matcher with and without pyahocorasick."""
+    if request.param and not keyword_matcher.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(keyword_matcher, "AHOCORASICK_AVAILABLE", request.param)
+    return KeywordMatcher(KEYWORDS)
+
+
+class TestKeywordMatcher:
+    """Test cases for KeywordMatcher."""
+
+    def test_finds_keywords_in_registration_order(self, matcher):
+        """Test that found keywords keep their registration order."""
+        found = matcher.find("Headache, then chest PAIN and fever; chest pain again")
+
+        assert found["symptoms"] == ["pain", "fever", "headache"]
+        assert found["critical"] == ["chest pain"]
+
+    def test_no_matches(self, matcher):
+        """Test that every category is present even without matches."""
+        assert matcher.find("") == {"symptoms": [], "critical": []}
+        assert matcher.find("feeling fine") == {"symptoms": [], "critical": []}
@@ -0,0 +1,105 @@
+"""Tests for logger factory configuration updates."""
+
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from infrastructure.logging.log_config import LogConfig, LogLevel
+from infrastructure.logging.logger_factory import LoggerFactory
+from infrastructure.logging.structured_logger import _QUEUE_ROUTER
+
+
+@pytest.fixture
+def factory():
+    """Create a fresh logger factory and release its handlers afterwards."""
+    factory = LoggerFactory.initialize(LogConfig.testing())
+    yield factory
+    factory.shutdown()
+
+
+def _file_handlers(logger):
+    return [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+
+
+class TestLoggerFactoryUpdates:
+    """Test cases for updating configuration without rebuilding loggers."""
+
+    def test_file_logging_toggles_handlers_in_place(self, factory, tmp_path):
+        """Test that file logging attaches and removes one shared handler."""
+        first = factory.get_logger("factory_test_first")
+        second = factory.get_logger("factory_test_second")
+
+        factory.enable_file_logging(tmp_path / "app.log")
+
+        assert factory.get_logger("factory_test_first") is first
+        assert _file_handlers(first) == _file_handlers(second)
+        assert len(_file_handlers(first)) == 1
+
+        factory.disable_file_logging()
+
+        assert _file_handlers(first) == []
+        assert _file_handlers(second) == []
+
+    def test_new_logger_reuses_shared_file_handler(self, factory, tmp_path):
+        """Test that a logger created after enabling file logging shares the handler."""
+        first = factory.get_logger("factory_test_shared_first")
+        factory.enable_file_logging(tmp_path / "app.log")
+
+        later = factory.get_logger("factory_test_shared_later")
+
+        assert len(_file_handlers(later)) == 1
+        assert _file_handlers(later) == _file_handlers(first)
+
+    def test_queued_records_reach_file_on_shutdown(self, factory, tmp_path):
+        """Test that records written through the queue are flushed by shutdown."""
+        log_file = tmp_path / "app.log"
+        logger = factory.get_logger("factory_test_queue")
+        factory.enable_file_logging(log_file)
+
+        logger.warning("queued record")
+        factory.shutdown()
+
+        assert "queued record" in log_file.read_text()
+
+    def test_level_only_update_keeps_loggers(self, factory):
+        """Test that changing only the level does not recreate loggers."""
+        logger = factory.get_logger("factory_test_level")
+        config = LogConfig.testing()
+        config.level = LogLevel.ERROR
+
+        factory.update_config(config)
+
+        assert factory.get_logger("factory_test_level") is logger
+        assert logger.logger.level == logging.ERROR
+
+    def test_set_log_level_updates_handlers(self, factory, tmp_path):
+        """Test that lowering the level also lowers the output handlers' levels."""
+        logger = factory.get_logger("factory_test_handler_level")
+        factory.set_log_level(LogLevel.ERROR)
+        factory.enable_file_logging(tmp_path / "app.log")
+
+        factory.set_log_level(LogLevel.DEBUG)
+
+        assert logger.logger.level == logging.DEBUG
+        assert logger.handlers
+        assert all(handler.level == logging.DEBUG for handler in logger.handlers)
+
+    def test_format_update_rebuilds_loggers_in_place(self, factory):
+        """Test that a handler-affecting change rebuilds held loggers' handlers."""
+        logger = factory.get_logger("factory_test_format")
+        config = LogConfig.development()
+
+        factory.update_config(config)
+
+        assert factory.get_logger("factory_test_format") is logger
+        assert logger.config is config
+        assert logger.handlers
+        assert _QUEUE_ROUTER.routes["factory_test_format"] == tuple(logger.handlers)
+        assert any(isinstance(h, QueueHandler) for h in logger.logger.handlers)
+
+    def test_shutdown_resets_singleton(self, factory):
+        """Test that shutdown drops the singleton instance."""
+        factory.shutdown()
+
+        assert LoggerFactory() is not factory
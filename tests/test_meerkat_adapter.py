@@ -0,0 +1,212 @@
+"""Tests for Meerkat adapter response handling (no model weights required)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("transformers")
+
+import torch
+from transformers import BatchEncoding
+
+from infrastructure.logging.logger_factory import initialize_logging
+from infrastructure.logging.log_config import LogConfig
+from infrastructure.adapters import meerkat_adapter
+from infrastructure.adapters.meerkat_adapter import MeerkatAdapter
+from domain.entities.medical_response import UrgencyLevel
+
+
+@pytest.fixture
+def adapter():
+    """Create an adapter without loading any model."""
+    initialize_logging(LogConfig.testing())
+    return MeerkatAdapter(device="cpu", torch_dtype="float32")
+
+
+class TestResponseCache:
+    """Test cases for the generated-response cache."""
+
+    def test_repeated_prompt_skips_generation(self, adapter, monkeypatch):
+        """Test that a repeated prompt is served from the cache."""
+        calls = []
+        monkeypatch.setattr(adapter, "_run_generation", lambda prompt, template_name=None: calls.append(prompt) or "answer")
+
+        assert adapter._generate_text_sync("headache") == "answer"
+        assert adapter._generate_text_sync("headache") == "answer"
+
+        assert calls == ["headache"]
+
+    def test_cache_key_includes_model_settings(self, adapter, monkeypatch):
+        """Test that changing the model invalidates cached responses."""
+        calls = []
+        monkeypatch.setattr(adapter, "_run_generation", lambda prompt, template_name=None: calls.append(prompt) or "answer")
+
+        adapter._generate_text_sync("headache")
+        adapter.model_name = "other/model"
+        adapter._generate_text_sync("headache")
+
+        assert len(calls) == 2
+
+    def test_cache_is_bounded(self, adapter, monkeypatch):
+        """Test that the least recently used entry is evicted."""
+        monkeypatch.setattr(meerkat_adapter, "RESPONSE_CACHE_SIZE", 2)
+        monkeypatch.setattr(adapter, "_run_generation", lambda prompt, template_name=None: prompt.upper())
+
+        for prompt in ("a", "b", "c"):
+            adapter._generate_text_sync(prompt)
+
+        assert len(adapter._response_cache) == 2
+        assert adapter._response_cache_key("a") not in adapter._response_cache
+
+
+class TestResponseParsing:
+    """Test cases for extracting structured items from model output."""
+
+    def test_recommendations_are_capped(self, adapter):
+        """Test that recommendation extraction stops at the cap."""
+        text = "Recommendations:\n" + "\n".join(f"- Drink water serving {i}" for i in range(20))
+
+        recommendations = adapter._extract_recommendations(text)
+
+        assert len(recommendations) == meerkat_adapter.MAX_RECOMMENDATIONS
+        assert recommendations[0] == "Drink water serving 0"
+
+    def test_red_flags_include_critical_symptoms(self, adapter):
+        """Test that critical symptoms are flagged once each."""
+        text = (
+            "Red flags:\n- Sudden chest pain radiating to arm\n"
+            "Remember:\nIf breathing worsens call 911."
+        )
+
+        red_flags = adapter._extract_red_flags(text)
+
+        assert red_flags == ["Sudden chest pain radiating to arm", "Warning: call 911"]
+
+    def test_red_flags_are_capped(self, adapter):
+        """Test that red flag extraction stops at the cap."""
+        text = "Red flags:\n" + "\n".join(f"- Symptom number {i}" for i in range(10)) + "\nchest pain"
+
+        red_flags = adapter._extract_red_flags(text)
+
+        assert len(red_flags) == meerkat_adapter.MAX_RED_FLAGS
+        assert "Warning: chest pain" not in red_flags
+
+    def test_long_text_warnings_match_short_path(self, adapter):
+        """Test that the vectorized scan for long text finds the same lines."""
+        lines = [
+            "Avoid NSAIDs due to bleeding RISK." if i % 7 == 0 else "Patient rested comfortably overnight."
+            for i in range(400)
+        ]
+        text = "\n".join(lines)
+        assert len(text) > meerkat_adapter.LONG_TEXT_THRESHOLD
+
+        warnings = adapter._extract_warnings(text)
+        interactions = adapter._extract_interactions(text)
+
+        expected = [line for line in lines if "risk" in line.lower()]
+        assert warnings == expected
+        assert interactions == expected
+
+
+class TestUrgencyExtraction:
+    """Test cases for urgency level extraction."""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Seek immediate care; risk is high", UrgencyLevel.EMERGENCY),
+        ("Low risk, but see a doctor soon", UrgencyLevel.HIGH),
+        ("This is not urgent", UrgencyLevel.EMERGENCY),
+        ("Highly likely a routine cold", UrgencyLevel.HIGH),
+        ("Please follow up with your physician", UrgencyLevel.LOW),
+        ("Rest and drink fluids", UrgencyLevel.MODERATE),
+        (UrgencyLevel.LOW, UrgencyLevel.LOW),
+    ])
+    def test_extract_urgency_level(self, adapter, text, expected):
+        """Test urgency priority and substring matching."""
+        assert adapter._extract_urgency_level(text) == expected
+
+
+def _stream_of(chunks, consumed):
+    async def stream(prompt, template_name=None):
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+    return stream
+
+
+class TestUrgencyStreaming:
+    """Test cases for stopping urgency generation once a level is named."""
+
+    @pytest.mark.asyncio
+    async def test_stops_on_level_split_across_chunks(self, adapter, monkeypatch):
+        """Test that a level word split across two chunks stops the stream."""
+        consumed = []
+        monkeypatch.setattr(adapter, "_generate_text_stream", _stream_of(["Level: EMER", "GENCY", " because"], consumed))
+
+        text = await adapter._generate_urgency_text("prompt")
+
+        assert text == "Level: EMERGENCY"
+        assert consumed == ["Level: EMER", "GENCY"]
+
+    @pytest.mark.asyncio
+    async def test_stops_on_lowercase_level(self, adapter, monkeypatch):
+        """Test that a lowercase level stops the stream."""
+        consumed = []
+        monkeypatch.setattr(adapter, "_generate_text_stream", _stream_of(["Urgency level: high", ".", " more"], consumed))
+
+        assert await adapter._generate_urgency_text("prompt") == "Urgency level: high"
+
+    @pytest.mark.asyncio
+    async def test_symptom_phrase_does_not_stop(self, adapter, monkeypatch):
+        """Test that level words inside symptom phrases do not end the stream."""
+        consumed = []
+        chunks = ["High blood pressure with a low-grade fever", " is concerning.", "\nUrgency level: MODERATE", " more"]
+        monkeypatch.setattr(adapter, "_generate_text_stream", _stream_of(chunks, consumed))
+
+        text = await adapter._generate_urgency_text("prompt")
+
+        assert text.endswith("Urgency level: MODERATE")
+        assert len(consumed) == 3
+
+    @pytest.mark.asyncio
+    async def test_chunk_cap_truncates(self, adapter, monkeypatch):
+        """Test that generation without a level stops at the chunk cap."""
+        consumed = []
+        monkeypatch.setattr(meerkat_adapter, "URGENCY_STREAM_MAX_CHUNKS", 3)
+        monkeypatch.setattr(adapter, "_generate_text_stream", _stream_of(["a ", "b ", "c ", "d "], consumed))
+
+        assert await adapter._generate_urgency_text("prompt") == "a b c"
+        assert len(consumed) == 3
+
+
+class TestPrefixCache:
+    """Test cases for reusing a cached template prefix."""
+
+    @pytest.fixture
+    def tokenized(self, adapter, monkeypatch):
+        """Stub a model and tokenizer whose prompt tokenizes to ids 1..5."""
+        input_ids = torch.tensor([[1, 2, 3, 4, 5]])
+        monkeypatch.setattr(adapter, "model", SimpleNamespace(device="cpu"), raising=False)
+        monkeypatch.setattr(
+            adapter, "tokenizer",
+            lambda prompt, **kwargs: BatchEncoding({"input_ids": input_ids, "attention_mask": torch.ones_like(input_ids)}),
+            raising=False
+        )
+
+    @pytest.mark.usefixtures("tokenized")
+    def test_prefix_reused_when_tokens_match(self, adapter):
+        """Test that a prefix whose ids lead the prompt's ids supplies the cache."""
+        adapter._prefix_cache["urgency"] = (torch.tensor([[1, 2]]), ["past"])
+
+        inputs = adapter._prepare_generation_inputs("prompt", "urgency")
+
+        assert inputs["input_ids"].tolist() == [[1, 2, 3, 4, 5]]
+        assert inputs["past_key_values"] == ["past"]
+
+    @pytest.mark.usefixtures("tokenized")
+    def test_prefix_skipped_when_tokens_differ(self, adapter):
+        """Test that a prefix tokenized differently from the prompt is not used."""
+        adapter._prefix_cache["urgency"] = (torch.tensor([[1, 9]]), ["past"])
+
+        inputs = adapter._prepare_generation_inputs("prompt", "urgency")
+
+        assert "past_key_values" not in inputs
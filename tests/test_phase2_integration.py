@@ -390,6 +390,25 @@ class TestApplicationContainer:
         # Should be same instance
         assert logger1 is logger2
 
+    @pytest.mark.asyncio
+    async def test_ashutdown_awaits_adapter_close(self, container):
+        """Test that async adapter closes finish before shutdown returns."""
+        container.initialize()
+        adapter = AsyncMock()
+        container.__dict__["whisper_adapter"] = adapter
+
+        await container.ashutdown()
+
+        adapter.close.assert_awaited_once()
+        assert "whisper_adapter" not in container.__dict__
+        assert not container._initialized
+
+    @pytest.mark.asyncio
+    async def test_sync_shutdown_rejected_in_event_loop(self, container):
+        """Test that the blocking shutdown refuses to run inside an event loop."""
+        with pytest.raises(RuntimeError):
+            container.shutdown()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
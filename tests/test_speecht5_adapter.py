@@ -0,0 +1,75 @@
+"""Tests for SpeechT5 adapter request handling (no model weights required)."""
+
+import asyncio
+import threading
+
+import pytest
+import torch
+
+from application.ports.voice_interface_port import SynthesisError
+from infrastructure.logging.logger_factory import initialize_logging
+from infrastructure.logging.log_config import LogConfig
+from infrastructure.adapters import speecht5_adapter
+from infrastructure.adapters.speecht5_adapter import SpeechT5Adapter
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    """Create a batching adapter without loading any model."""
+    initialize_logging(LogConfig.testing())
+    # The constructor only checks that the packages exist; nothing here imports them
+    monkeypatch.setattr(speecht5_adapter, "SPEECHT5_AVAILABLE", True)
+    return SpeechT5Adapter(device="cpu", torch_dtype="float32", batch_size=2, max_wait_ms=0)
+
+
+class TestBatcherShutdown:
+    """Test cases for closing the adapter with synthesis requests outstanding."""
+
+    @pytest.mark.asyncio
+    async def test_close_fails_running_and_queued_requests(self, adapter, monkeypatch):
+        """Test that close() resolves requests in the running batch and in the queue."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_batch(texts, configs):
+            started.set()
+            release.wait(5)
+            return [None] * len(texts)
+
+        monkeypatch.setattr(adapter, "_synthesize_batch_sync", blocking_batch)
+
+        running = asyncio.ensure_future(adapter._synthesize("first", {}))
+        await asyncio.to_thread(started.wait, 5)
+        queued = asyncio.ensure_future(adapter._synthesize("second", {}))
+        await asyncio.sleep(0)
+
+        try:
+            await adapter.close()
+
+            for request in (running, queued):
+                with pytest.raises(SynthesisError):
+                    await asyncio.wait_for(request, 1)
+        finally:
+            release.set()
+
+
+class TestQuantization:
+    """Test cases for choosing the model precision."""
+
+    @pytest.fixture(autouse=True)
+    def available(self, monkeypatch):
+        """Allow constructing adapters without the TTS packages installed."""
+        initialize_logging(LogConfig.testing())
+        monkeypatch.setattr(speecht5_adapter, "SPEECHT5_AVAILABLE", True)
+
+    def test_default_keeps_requested_dtype(self):
+        """Test that no precision change happens unless asked for."""
+        adapter = SpeechT5Adapter(device="cpu", torch_dtype="float16")
+
+        assert adapter.quantization is None
+        assert adapter.torch_dtype == torch.float16
+
+    def test_auto_never_selects_int8(self):
+        """Test that auto only swaps fp16 for bf16 on CPU."""
+        assert SpeechT5Adapter(device="cpu", torch_dtype="float16", quantization="auto").quantization == "bf16"
+        assert SpeechT5Adapter(device="cuda", torch_dtype="float16", quantization="auto").quantization is None
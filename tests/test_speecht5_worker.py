@@ -0,0 +1,37 @@
+"""Tests for the process-isolated SpeechT5 adapter (no model weights required)."""
+
+import pytest
+
+from infrastructure.logging.logger_factory import initialize_logging
+from infrastructure.logging.log_config import LogConfig
+from infrastructure.adapters.speecht5_worker import SpeechT5ProcessAdapter
+
+
+@pytest.fixture
+def adapter():
+    """Create a proxy whose worker runs on the CPU."""
+    initialize_logging(LogConfig.testing())
+    return SpeechT5ProcessAdapter(device="cpu", torch_dtype="float32")
+
+
+class TestWorkerProcess:
+    """Test cases for the worker process lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_request_round_trip_and_shutdown(self, adapter):
+        """Test that a request is answered by the worker and close() stops it."""
+        try:
+            await adapter._ensure_worker()
+            process = adapter._process
+
+            # Answered by the worker whether or not it could construct SpeechT5 here
+            status = await adapter.get_health_status()
+
+            assert status["service"] == "speecht5_tts"
+            assert status["worker_pid"] == process.pid
+        finally:
+            await adapter.close()
+
+        assert not process.is_alive()
+        assert process.exitcode == 0
+        assert (await adapter.get_health_status())["status"] == "not_loaded"
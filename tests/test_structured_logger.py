@@ -0,0 +1,50 @@
+"""Tests for the buffered rotating log file handler."""
+
+import logging
+import time
+
+import pytest
+
+from infrastructure.logging import structured_logger
+from infrastructure.logging.structured_logger import BufferedRotatingFileHandler
+
+
+def _record(message, level=logging.INFO):
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+@pytest.fixture
+def handler(tmp_path):
+    """Create a UTF-8 handler that rolls over at 64 bytes."""
+    handler = BufferedRotatingFileHandler(tmp_path / "app.log", maxBytes=64, backupCount=1, encoding="utf-8")
+    yield handler
+    handler.close()
+
+
+class TestBufferedRotatingFileHandler:
+    """Test cases for size tracking and deferred flushing."""
+
+    def test_size_counts_encoded_bytes(self, handler):
+        """Test that non-ASCII text is counted in bytes, not characters."""
+        handler.emit(_record("é" * 10))
+
+        assert handler._size == 21
+
+    def test_rollover_uses_byte_size(self, handler, tmp_path):
+        """Test that rollover triggers on the encoded size of multi-byte text."""
+        handler.emit(_record("ह" * 15))
+        handler.emit(_record("ह" * 15))
+
+        assert (tmp_path / "app.log.1").exists()
+
+    def test_quiet_period_is_flushed(self, handler, tmp_path, monkeypatch):
+        """Test that a buffered record reaches the file without further logging."""
+        monkeypatch.setattr(structured_logger, "FILE_FLUSH_INTERVAL_SECONDS", 0.05)
+        handler._last_flush = time.monotonic()
+
+        handler.emit(_record("buffered"))
+        deadline = time.monotonic() + 2
+        while "buffered" not in (tmp_path / "app.log").read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert "buffered" in (tmp_path / "app.log").read_text()
@@ -0,0 +1,83 @@
+"""Tests for Whisper adapter model loading (no model weights required)."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("transformers")
+
+from infrastructure.logging.logger_factory import initialize_logging
+from infrastructure.logging.log_config import LogConfig
+from infrastructure.adapters import whisper_adapter
+from infrastructure.adapters.whisper_adapter import WhisperAdapter
+from domain.value_objects.audio_data import AudioData
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    """Create an adapter whose processor and feature setup are stubbed."""
+    initialize_logging(LogConfig.testing())
+    adapter = WhisperAdapter(device="cpu", torch_dtype="float32")
+
+    processor = SimpleNamespace(
+        tokenizer=object(),
+        feature_extractor=SimpleNamespace(mel_filters=np.zeros((201, 80), dtype=np.float32), n_fft=400)
+    )
+    monkeypatch.setattr(whisper_adapter.WhisperProcessor, "from_pretrained", lambda name: processor)
+    monkeypatch.setattr(adapter, "_build_language_detection_tokens", lambda: None)
+    monkeypatch.setattr(adapter, "_log_mel_features", lambda arrays: None)
+    return adapter
+
+
+def _capture_pipeline(monkeypatch):
+    calls = []
+    monkeypatch.setattr(whisper_adapter, "pipeline", lambda task, **kwargs: calls.append(kwargs) or object())
+    return calls
+
+
+class TestModelLoading:
+    """Test cases for building the ASR pipeline around the loaded model."""
+
+    @pytest.mark.asyncio
+    async def test_dispatched_model_is_not_moved(self, adapter, monkeypatch):
+        """Test that a model placed by accelerate is passed without a device."""
+        calls = _capture_pipeline(monkeypatch)
+        model = SimpleNamespace(hf_device_map={"": "cpu"})
+        monkeypatch.setattr(adapter, "_load_transformers_model", lambda: model)
+
+        await adapter._ensure_model_loaded()
+
+        assert adapter._is_loaded
+        assert calls[0]["model"] is model
+        assert "device" not in calls[0]
+
+    @pytest.mark.asyncio
+    async def test_plain_model_gets_device(self, adapter, monkeypatch):
+        """Test that an unquantized model is placed on the adapter device."""
+        calls = _capture_pipeline(monkeypatch)
+        monkeypatch.setattr(adapter, "_load_transformers_model", lambda: SimpleNamespace())
+
+        await adapter._ensure_model_loaded()
+
+        assert calls[0]["device"] == "cpu"
+
+
+class TestAudioPreparation:
+    """Test cases for scaling audio before feature extraction."""
+
+    def test_out_of_range_float_is_peak_normalized(self, adapter):
+        """Test that float audio peaking above 1.0 is scaled into range."""
+        audio = AudioData.from_numpy(np.array([0.5, -2.0, 1.0], dtype=np.float32), sample_rate=16000)
+
+        prepared = adapter._prepare_audio_for_whisper(audio)
+
+        np.testing.assert_allclose(prepared, [0.25, -1.0, 0.5])
+
+    def test_in_range_float_is_unscaled(self, adapter):
+        """Test that float audio already in range passes through unchanged."""
+        samples = np.array([0.5, -0.25, 0.1], dtype=np.float32)
+
+        prepared = adapter._prepare_audio_for_whisper(AudioData.from_numpy(samples, sample_rate=16000))
+
+        np.testing.assert_array_equal(prepared, samples)